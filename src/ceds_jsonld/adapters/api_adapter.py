@@ -77,6 +77,8 @@ class APIAdapter(SourceAdapter):
         self._base_params = params or {}
         self._body = body
         self._results_key = results_key
+        # Dot-notation path split once here rather than on every page.
+        self._results_path: tuple[str, ...] = tuple(results_key.split(".")) if results_key else ()
         self._pagination = pagination
         self._page_size = page_size
         self._offset_param = offset_param
@@ -153,9 +155,9 @@ class APIAdapter(SourceAdapter):
         Supports dot-notation paths (e.g. ``"students.student"``) for
         nested response structures such as PowerSchool's API.
         """
-        if self._results_key:
+        if self._results_path:
             obj = data
-            for segment in self._results_key.split("."):
+            for segment in self._results_path:
                 if not isinstance(obj, dict) or segment not in obj:
                     msg = f"Response missing expected key '{self._results_key}'"
                     raise AdapterError(msg)
@@ -13,6 +13,28 @@ from typing import Any
 from ceds_jsonld.adapters.base import SourceAdapter
 from ceds_jsonld.exceptions import AdapterError
 
+#: BigQuery scalar type for each exact Python parameter type.  ``bool`` has its
+#: own entry, so ``True`` never falls through to ``INT64``.
+_PARAM_TYPE_MAP: dict[type, str] = {
+    bool: "BOOL",
+    int: "INT64",
+    float: "FLOAT64",
+    str: "STRING",
+}
+
+
+def _param_type(value: Any) -> str:
+    """Return the BigQuery scalar type name for a bind parameter value."""
+    bq_type = _PARAM_TYPE_MAP.get(type(value))
+    if bq_type is not None:
+        return bq_type
+    # Subclasses (IntEnum, str subclasses, ...) resolve via their nearest base.
+    for base in type(value).__mro__[1:]:
+        bq_type = _PARAM_TYPE_MAP.get(base)
+        if bq_type is not None:
+            return bq_type
+    return "STRING"
+
 
 class BigQueryAdapter(SourceAdapter):
     """Execute a SQL query or read a table from Google BigQuery.
@@ -189,15 +211,7 @@ class BigQueryAdapter(SourceAdapter):
 
         query_params = []
         for name, value in self._params.items():
-            if isinstance(value, bool):
-                bq_type = "BOOL"
-            elif isinstance(value, int):
-                bq_type = "INT64"
-            elif isinstance(value, float):
-                bq_type = "FLOAT64"
-            else:
-                bq_type = "STRING"
             query_params.append(
-                bigquery.ScalarQueryParameter(name, bq_type, value),
+                bigquery.ScalarQueryParameter(name, _param_type(value), value),
             )
         return bigquery.QueryJobConfig(query_parameters=query_params)
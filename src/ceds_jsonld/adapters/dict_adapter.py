@@ -33,23 +33,38 @@ class DictAdapter(SourceAdapter):
                 of record dicts.
         """
         if isinstance(data, dict):
-            self._data: list[dict[str, Any]] = [data]
+            self._data: tuple[dict[str, Any], ...] = (data,)
         else:
-            # Materialise so count() and repeated read() work.
-            self._data = list(data)
+            # Snapshot once so count() and repeated read() work and see the
+            # same rows even if the caller's list changes afterwards.
+            self._data = tuple(data)
 
     def read(self, **kwargs: Any) -> Iterator[dict[str, Any]]:
-        """Yield each dict in order.
+        """Iterate over each dict in order.
 
         Returns:
             Iterator of dicts.
         """
-        yield from self._data
+        return iter(self._data)
+
+    def read_batch(self, batch_size: int = 1000, **kwargs: Any) -> Iterator[list[dict[str, Any]]]:
+        """Yield batches as slices of the in-memory snapshot.
+
+        Args:
+            batch_size: Number of records per batch.
+
+        Returns:
+            An iterator of lists of dicts.
+        """
+        data = self._data
+        step = max(batch_size, 1)
+        for start in range(0, len(data), step):
+            yield list(data[start : start + step])
 
     def count(self) -> int | None:
         """Return the number of records.
 
         Returns:
-            Length of the internal list.
+            Length of the snapshot.
         """
         return len(self._data)
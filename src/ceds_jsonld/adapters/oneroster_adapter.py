@@ -15,22 +15,34 @@ from ceds_jsonld.adapters.base import SourceAdapter
 from ceds_jsonld.exceptions import AdapterError
 
 # Standard OneRoster 1.1 resource endpoints
-_ONEROSTER_RESOURCES = {
-    "users",
-    "students",
-    "teachers",
-    "orgs",
-    "enrollments",
-    "courses",
-    "classes",
-    "academicSessions",
-    "demographics",
-    "lineItems",
-    "results",
-    "gradingPeriods",
-    "terms",
-    "categories",
-}
+_ONEROSTER_RESOURCES: frozenset[str] = frozenset(
+    {
+        "users",
+        "students",
+        "teachers",
+        "orgs",
+        "enrollments",
+        "courses",
+        "classes",
+        "academicSessions",
+        "demographics",
+        "lineItems",
+        "results",
+        "gradingPeriods",
+        "terms",
+        "categories",
+    }
+)
+
+
+def _raise_key_collision(key: str, existing: Any, new: Any) -> None:
+    """Raise the AdapterError for a flattened key that is already taken."""
+    msg = (
+        f"Key collision during record flattening: '{key}' "
+        f"already exists with value {existing!r}. "
+        f"Cannot overwrite with {new!r}."
+    )
+    raise AdapterError(msg)
 
 
 class OneRosterAdapter(SourceAdapter):
@@ -123,6 +135,7 @@ class OneRosterAdapter(SourceAdapter):
         self._page_size = page_size
         self._flatten = flatten
         self._timeout = timeout
+        self._httpx: Any = None  # httpx module, cached by read() on first use
 
     # ------------------------------------------------------------------
     # Public API
@@ -138,7 +151,7 @@ class OneRosterAdapter(SourceAdapter):
             AdapterError: If httpx is missing, auth fails, or any API
                 call errors out.
         """
-        httpx = self._import_httpx()
+        httpx = self._httpx = self._httpx or self._import_httpx()
         token = self._resolve_token(httpx)
         client = self._make_client(httpx, token)
 
@@ -221,7 +234,7 @@ class OneRosterAdapter(SourceAdapter):
 
     def _fetch_page(self, client: Any, offset: int) -> list[dict[str, Any]]:
         """Fetch one page of records from the OneRoster endpoint."""
-        httpx_mod = self._import_httpx()
+        httpx_mod = self._httpx or self._import_httpx()
 
         url = f"{self._base_url}/{self._resource}"
         params: dict[str, Any] = {
@@ -274,27 +287,30 @@ class OneRosterAdapter(SourceAdapter):
                 existing key in the record.
         """
         flat: dict[str, Any] = {}
-
-        def _safe_set(target: dict[str, Any], k: str, v: Any) -> None:
-            if k in target:
-                msg = (
-                    f"Key collision during record flattening: '{k}' "
-                    f"already exists with value {target[k]!r}. "
-                    f"Cannot overwrite with {v!r}."
-                )
-                raise AdapterError(msg)
-            target[k] = v
-
+        # Records come straight from resp.json(), so exact type checks suffice.
         for key, value in record.items():
-            if isinstance(value, dict):
+            if type(value) is dict:
+                prefix = key + "_"
                 for sub_key, sub_val in value.items():
-                    _safe_set(flat, f"{key}_{sub_key}", sub_val)
-            elif isinstance(value, list) and value and isinstance(value[0], dict):
+                    flat_key = prefix + sub_key
+                    if flat_key in flat:
+                        _raise_key_collision(flat_key, flat[flat_key], sub_val)
+                    flat[flat_key] = sub_val
+            elif type(value) is list and value and type(value[0]) is dict:
                 singular = key.rstrip("s") if key.endswith("s") else key
                 for idx, element in enumerate(value):
+                    prefix = f"{singular}_{idx}_"
                     for sub_key, sub_val in element.items():
-                        _safe_set(flat, f"{singular}_{idx}_{sub_key}", sub_val)
-                _safe_set(flat, f"{key}_count", len(value))
+                        flat_key = prefix + sub_key
+                        if flat_key in flat:
+                            _raise_key_collision(flat_key, flat[flat_key], sub_val)
+                        flat[flat_key] = sub_val
+                count_key = key + "_count"
+                if count_key in flat:
+                    _raise_key_collision(count_key, flat[count_key], len(value))
+                flat[count_key] = len(value)
             else:
-                _safe_set(flat, key, value)
+                if key in flat:
+                    _raise_key_collision(key, flat[key], value)
+                flat[key] = value
         return flat
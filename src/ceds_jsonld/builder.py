@@ -7,6 +7,7 @@ Driven by mapping configs and shape definitions, not hand-coded per shape.
 from __future__ import annotations
 
 import math
+from dataclasses import dataclass
 from typing import Any
 
 from ceds_jsonld.exceptions import BuildError
@@ -16,6 +17,40 @@ from ceds_jsonld.sanitize import sanitize_iri_component, validate_base_uri
 
 _log = get_logger(__name__)
 
+# Returned by _unwrap() for an empty list — the property is omitted.
+_EMPTY = object()
+
+
+def _unwrap(values: list[Any]) -> Any:
+    """Return the sole element of a one-item list, the list itself, or ``_EMPTY``.
+
+    JSON-LD output writes single values bare rather than as one-element arrays.
+    """
+    n = len(values)
+    if n == 1:
+        return values[0]
+    return values if n else _EMPTY
+
+
+@dataclass(frozen=True, slots=True)
+class _PropertyPlan:
+    """One mapping-config property, resolved once at builder init.
+
+    Attributes:
+        name: Property name as it appears in mapped rows and the document.
+        node_type: ``@type`` of every sub-node built for the property.
+        fields: ``(target, datatype)`` pairs in config order; ``datatype`` is
+            ``None`` for plain values.
+        record_status: Inject the record-status template into each node.
+        data_collection: Inject the data-collection template into each node.
+    """
+
+    name: str
+    node_type: str
+    fields: tuple[tuple[str, str | None], ...]
+    record_status: bool
+    data_collection: bool
+
 
 class JSONLDBuilder:
     """Build JSON-LD documents from mapped data rows.
@@ -51,6 +86,8 @@ class JSONLDBuilder:
         self._record_status_template: dict[str, Any] | None = None
         self._data_collection_template: dict[str, Any] | None = None
         self._init_templates()
+        # Resolve every per-row config lookup once; build_one only walks plans.
+        self._plans = self._init_plans()
         _log.debug("builder.initialized", shape=shape_def.name)
 
     def build_one(self, mapped_row: dict[str, Any]) -> dict[str, Any]:
@@ -80,16 +117,15 @@ class JSONLDBuilder:
             "@type": self._config["type"],
         }
 
-        for prop_name, prop_def in self._config.get("properties", {}).items():
-            instances = mapped_row.get(prop_name)
+        for plan in self._plans:
+            instances = mapped_row.get(plan.name)
             if not instances:
                 continue
 
-            nodes = self._build_sub_nodes(instances, prop_def)
-            if not nodes:
-                continue
             # Single instance → unwrap from array
-            doc[prop_name] = nodes if len(nodes) > 1 else nodes[0]
+            nodes = _unwrap(self._build_sub_nodes(instances, plan))
+            if nodes is not _EMPTY:
+                doc[plan.name] = nodes
 
         return doc
 
@@ -118,25 +154,49 @@ class JSONLDBuilder:
         if dc_defaults:
             self._data_collection_template = self._build_data_collection_template(dc_defaults)
 
+    def _init_plans(self) -> tuple[_PropertyPlan, ...]:
+        """Resolve each configured property into a :class:`_PropertyPlan`."""
+        plans: list[_PropertyPlan] = []
+        for prop_name, prop_def in self._config.get("properties", {}).items():
+            if "type" not in prop_def:
+                msg = f"Shape '{self._shape.name}' property '{prop_name}' has no 'type' in its mapping config"
+                raise BuildError(msg)
+            fields = tuple(
+                (field_def.get("target", field_key), field_def.get("datatype") or None)
+                for field_key, field_def in prop_def.get("fields", {}).items()
+            )
+            plans.append(
+                _PropertyPlan(
+                    name=prop_name,
+                    node_type=prop_def["type"],
+                    fields=fields,
+                    record_status=bool(prop_def.get("include_record_status") and self._record_status_template),
+                    data_collection=bool(prop_def.get("include_data_collection") and self._data_collection_template),
+                )
+            )
+        return tuple(plans)
+
     def _build_sub_nodes(
         self,
         instances: list[dict[str, Any]],
-        prop_def: dict[str, Any],
+        plan: _PropertyPlan,
     ) -> list[dict[str, Any]]:
         """Build typed sub-shape nodes from mapped instances."""
         nodes: list[dict[str, Any]] = []
+        node_type = plan.node_type
+        fields = plan.fields
+        rs_template = self._record_status_template if plan.record_status else None
+        dc_template = self._data_collection_template if plan.data_collection else None
 
         for instance in instances:
-            node: dict[str, Any] = {"@type": prop_def["type"]}
+            node: dict[str, Any] = {"@type": node_type}
 
             # Add mapped fields with optional typed literals
-            for _field_key, field_def in prop_def.get("fields", {}).items():
-                target = field_def.get("target", _field_key)
+            for target, datatype in fields:
                 if target not in instance:
                     continue
 
                 value = instance[target]
-                datatype = field_def.get("datatype")
 
                 if datatype:
                     typed = self._typed_literal(value, datatype)
@@ -145,19 +205,18 @@ class JSONLDBuilder:
                 else:
                     # Plain value — unwrap single-element lists
                     if isinstance(value, list):
-                        if not value:
+                        value = _unwrap(value)
+                        if value is _EMPTY:
                             continue
-                        node[target] = value if len(value) > 1 else value[0]
-                    else:
-                        node[target] = value
+                    node[target] = value
 
             # Inject record status
-            if prop_def.get("include_record_status") and self._record_status_template:
-                node["hasRecordStatus"] = self._copy_template(self._record_status_template)
+            if rs_template is not None:
+                node["hasRecordStatus"] = self._copy_template(rs_template)
 
             # Inject data collection
-            if prop_def.get("include_data_collection") and self._data_collection_template:
-                node["hasDataCollection"] = self._copy_template(self._data_collection_template)
+            if dc_template is not None:
+                node["hasDataCollection"] = self._copy_template(dc_template)
 
             nodes.append(node)
 
@@ -175,15 +234,23 @@ class JSONLDBuilder:
             ``{"@type": datatype, "@value": value}``, a list of such dicts,
             or ``None`` if the value is ``None`` or non-finite.
         """
+        # Mapped values are overwhelmingly plain strings; wrap them directly.
+        # Each call returns a fresh dict — documents never share nodes (see
+        # _copy_template), so results are deliberately not memoized.
+        if type(value) is str:
+            return {"@type": datatype, "@value": value}
         if value is None:
             return None
-        if isinstance(value, float) and (math.isnan(value) or math.isinf(value)):
+        if isinstance(value, float) and not math.isfinite(value):
             return None
         if isinstance(value, list):
+            # Locals keep the per-element filter free of global/builtin lookups.
+            isfinite = math.isfinite
+            to_str = str
             clean = [
-                {"@type": datatype, "@value": str(v)}
+                {"@type": datatype, "@value": to_str(v)}
                 for v in value
-                if v is not None and not (isinstance(v, float) and (math.isnan(v) or math.isinf(v)))
+                if v is not None and not (isinstance(v, float) and not isfinite(v))
             ]
             return clean or None
         return {"@type": datatype, "@value": str(value)}
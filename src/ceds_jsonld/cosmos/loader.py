@@ -14,6 +14,7 @@ Supports:
 from __future__ import annotations
 
 import asyncio
+import functools
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -140,6 +141,10 @@ class CosmosLoader:
         self._create_if_missing = create_if_missing
         self._concurrency = concurrency
 
+        # The partition strategy is fixed for the loader's lifetime, so bind
+        # it once here rather than re-passing it on every document.
+        self._prepare_for_cosmos = functools.partial(prepare_for_cosmos, partition_value=partition_value)
+
         # Lazy-initialised SDK objects.
         self._client: Any = None
         self._database: Any = None
@@ -253,7 +258,7 @@ class CosmosLoader:
         """Prepare a document for Cosmos, injecting id/partitionKey if needed."""
         if "id" in doc and "partitionKey" in doc:
             return doc
-        return prepare_for_cosmos(doc, partition_value=self._partition_value)
+        return self._prepare_for_cosmos(doc)
 
     @staticmethod
     def _extract_ru(response: Any) -> float:
@@ -53,15 +53,11 @@ def prepare_for_cosmos(
         msg = f"Document is missing '{id_field}'. Cannot prepare for Cosmos DB. Available keys: {sorted(doc.keys())}"
         raise KeyError(msg)
 
-    cosmos_doc = copy.deepcopy(doc)
-
-    # Extract the trailing identifier from the URI.
-    # Split on both '/' and '#' separators — URIs may use either as the
+    # Extract the trailing identifier from the URI: everything after the
+    # last '/' or '#', whichever comes later — URIs may use either as the
     # namespace delimiter (e.g. "cepi:person/12345" or "cepi:person#12345").
     raw_id = str(doc[id_field])
-    # First split on '#' (fragment), then on '/' (path), taking the last segment.
-    last_segment = raw_id.rsplit("#", 1)[-1] if "#" in raw_id else raw_id
-    derived_id = last_segment.rsplit("/", 1)[-1] if "/" in last_segment else last_segment
+    derived_id = raw_id[max(raw_id.rfind("#"), raw_id.rfind("/")) + 1 :]
 
     if not derived_id:
         msg = (
@@ -71,6 +67,7 @@ def prepare_for_cosmos(
         )
         raise CosmosError(msg)
 
+    cosmos_doc = copy.deepcopy(doc)
     cosmos_doc["id"] = derived_id
 
     # Partition key: explicit value, or fall back to @type.
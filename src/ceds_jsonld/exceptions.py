@@ -31,8 +31,12 @@ class ValidationError(CEDSJSONLDError):
     """Raised when SHACL validation or pre-build validation fails."""
 
 
-class SerializationError(CEDSJSONLDError):
-    """Raised when JSON serialization fails."""
+class SerializationError(CEDSJSONLDError, ValueError):
+    """Raised when JSON serialization fails.
+
+    Also a :class:`ValueError`, so callers that treat unserializable data
+    (e.g. NaN/Infinity floats) as a bad value can catch it either way.
+    """
 
 
 class AdapterError(CEDSJSONLDError):
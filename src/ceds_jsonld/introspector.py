@@ -9,8 +9,16 @@ This module is NOT in the hot path — it runs at dev/load time, not per-record.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import contextlib
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 from rdflib import BNode, Graph, Namespace, URIRef
@@ -18,6 +26,9 @@ from rdflib.collection import Collection
 from rdflib.namespace import RDF, XSD
 
 from ceds_jsonld.exceptions import ShapeLoadError
+from ceds_jsonld.logging import get_logger
+
+_log = get_logger(__name__)
 
 # ---------------------------------------------------------------------------
 # Namespaces
@@ -27,13 +38,16 @@ SH = Namespace("http://www.w3.org/ns/shacl#")
 CEDS = Namespace("http://ceds.ed.gov/terms#")
 CEPI = Namespace("http://cepi-dev.state.mi.us/")
 
+# Bumped whenever the sidecar layout written by from_cache() changes.
+_CACHE_FORMAT = 1
+
 
 # ---------------------------------------------------------------------------
 # Data structures
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class PropertyInfo:
     """Introspected information about a single SHACL property shape.
 
@@ -64,7 +78,7 @@ class PropertyInfo:
     is_closed: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeShapeInfo:
     """Introspected information about a SHACL NodeShape.
 
@@ -136,6 +150,66 @@ class SHACLIntrospector:
         self._root_shape: NodeShapeInfo | None = None
         self._parse_all()
 
+    @classmethod
+    def from_cache(
+        cls,
+        shacl_path: str | Path,
+        *,
+        cache_path: str | Path | None = None,
+    ) -> SHACLIntrospector:
+        """Load a SHACL file, reusing a JSON sidecar of its parsed shapes.
+
+        The sidecar stores the flattened NodeShapes together with the SHA-256
+        of the Turtle bytes, the sidecar format and the package version.  When
+        all three match, the shapes are rebuilt from JSON and rdflib parsing
+        is skipped entirely.  Otherwise the file is parsed normally and the
+        sidecar is (re)written atomically; a read-only location is tolerated.
+
+        Sidecars live in the user cache directory (``$XDG_CACHE_HOME`` or
+        ``~/.cache`` — ``%LOCALAPPDATA%`` on Windows — under
+        ``ceds-jsonld/shacl``) unless ``cache_path`` is given.
+
+        Args:
+            shacl_path: Path to a SHACL Turtle file.
+            cache_path: Optional explicit sidecar location.
+
+        Returns:
+            A ready introspector.
+
+        Raises:
+            ShapeLoadError: If the file cannot be read or parsed.
+        """
+        from ceds_jsonld import __version__
+
+        source = Path(shacl_path)
+        try:
+            digest = hashlib.sha256(source.read_bytes()).hexdigest()
+        except OSError as exc:
+            msg = f"Failed to read SHACL file {source}: {exc}"
+            raise ShapeLoadError(msg) from exc
+
+        sidecar = Path(cache_path) if cache_path is not None else _default_sidecar(source)
+        try:
+            cached = json.loads(sidecar.read_text(encoding="utf-8"))
+            if cached["format"] == _CACHE_FORMAT and cached["version"] == __version__ and cached["sha256"] == digest:
+                _log.debug("introspector.cache.hit", path=str(sidecar))
+                return cls._from_shape_records(cached["shapes"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        introspector = cls(source)
+        payload = {
+            "format": _CACHE_FORMAT,
+            "version": __version__,
+            "sha256": digest,
+            "shapes": [introspector._shape_record(s) for s in introspector._node_shapes.values()],
+        }
+        try:
+            _write_sidecar(sidecar, json.dumps(payload))
+        except OSError as exc:
+            _log.debug("introspector.cache.unwritable", path=str(sidecar), error=str(exc))
+        return introspector
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -168,9 +242,12 @@ class SHACLIntrospector:
         """
         return self.root_shape()
 
-    def all_shapes(self) -> dict[str, NodeShapeInfo]:
-        """Return all parsed NodeShapes keyed by local name."""
-        return dict(self._node_shapes)
+    def all_shapes(self) -> Mapping[str, NodeShapeInfo]:
+        """Return all parsed NodeShapes keyed by local name.
+
+        The result is a read-only view shared across calls — no copy is made.
+        """
+        return self._shapes_view
 
     def get_shape(self, local_name: str) -> NodeShapeInfo:
         """Get a specific NodeShape by its local name.
@@ -379,7 +456,13 @@ class SHACLIntrospector:
             info = self._parse_node_shape(shape_iri)  # type: ignore[arg-type]
             self._node_shapes[info.local_name] = info
 
-        # Second pass: resolve children (properties with sh:node)
+        self._link_shapes()
+
+    def _link_shapes(self) -> None:
+        """Resolve ``children`` between parsed shapes and determine the root."""
+        self._shapes_view = MappingProxyType(self._node_shapes)
+
+        # Resolve children (properties with sh:node)
         for shape_info in self._node_shapes.values():
             for prop in shape_info.properties:
                 if prop.node_shape and prop.node_shape in self._node_shapes:
@@ -476,6 +559,37 @@ class SHACLIntrospector:
             allowed_values=allowed,
         )
 
+    # ------------------------------------------------------------------
+    # Sidecar cache (see from_cache)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _shape_record(shape: NodeShapeInfo) -> dict[str, Any]:
+        """Flatten a NodeShape for the sidecar — ``children`` are re-linked on load."""
+        return {
+            "iri": shape.iri,
+            "local_name": shape.local_name,
+            "target_class": shape.target_class,
+            "target_class_local": shape.target_class_local,
+            "is_closed": shape.is_closed,
+            "ignored_properties": shape.ignored_properties,
+            "properties": [asdict(p) for p in shape.properties],
+        }
+
+    @classmethod
+    def _from_shape_records(cls, records: list[dict[str, Any]]) -> SHACLIntrospector:
+        """Build an introspector from sidecar records without an rdflib graph."""
+        introspector = cls.__new__(cls)
+        introspector._graph = Graph()
+        introspector._node_shapes = {}
+        introspector._root_shape = None
+        for record in records:
+            properties = [PropertyInfo(**p) for p in record["properties"]]
+            info = NodeShapeInfo(**{**record, "properties": properties})
+            introspector._node_shapes[info.local_name] = info
+        introspector._link_shapes()
+        return introspector
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -575,7 +689,7 @@ class SHACLIntrospector:
                     field_entry["datatype"] = prop.datatype
 
             if prop.allowed_values:
-                field_entry["# allowed_values"] = [self._local_name(URIRef(v)) for v in prop.allowed_values]
+                field_entry["allowed_values"] = [self._local_name(URIRef(v)) for v in prop.allowed_values]
 
             if prop.min_count is None or prop.min_count == 0:
                 field_entry["optional"] = True
@@ -674,3 +788,40 @@ class SHACLIntrospector:
             result["children"][child_name] = self._shape_to_dict(child_shape)
 
         return result
+
+
+# ---------------------------------------------------------------------------
+# Sidecar cache helpers
+# ---------------------------------------------------------------------------
+
+
+def _default_sidecar(source: Path) -> Path:
+    """Return the user-cache sidecar path for a SHACL file.
+
+    The name carries a hash of the resolved source path so files with the
+    same name in different directories do not share a sidecar.
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    key = hashlib.sha256(str(source.resolve()).encode("utf-8")).hexdigest()[:16]
+    return Path(base) / "ceds-jsonld" / "shacl" / f"{source.stem}-{key}.json"
+
+
+def _write_sidecar(sidecar: Path, text: str) -> None:
+    """Write *text* to *sidecar* via a temp file and ``os.replace``.
+
+    Readers never see a half-written sidecar, and concurrent writers leave
+    one complete file behind.
+    """
+    sidecar.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=sidecar.parent, prefix=f".{sidecar.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(text)
+        os.replace(tmp, sidecar)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
@@ -58,6 +58,10 @@ _EMAIL_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\
 _PII_VALUE_PATTERNS: tuple[re.Pattern[str], ...] = (_SSN_PATTERN, _EMAIL_PATTERN)
 
 
+#: Exact value types that can never carry PII; returned without inspection.
+_PASSTHROUGH_TYPES: frozenset[type] = frozenset({int, float, bool, type(None)})
+
+
 def _scrub_value(value: str) -> str:
     """Replace PII patterns found in a string value.
 
@@ -81,8 +85,9 @@ def _mask_pii(event_dict: dict[str, Any]) -> dict[str, Any]:
     redacted.  String values are additionally scanned for common PII
     patterns (SSN, email) regardless of key name.
 
-    The input dict is **deep-copied** first so that caller-owned objects
-    (nested dicts, lists) are never mutated.
+    Caller-owned objects are never mutated: the top-level dict is always
+    new, and nested dicts and lists are copied only along the paths that
+    lead to a redacted value — branches without PII are shared as-is.
 
     Args:
         event_dict: The structured log event.
@@ -90,37 +95,41 @@ def _mask_pii(event_dict: dict[str, Any]) -> dict[str, Any]:
     Returns:
         A *new* dict with sensitive values replaced by ``***REDACTED***``.
     """
-    import copy as _copy
-
-    masked = _copy.deepcopy(event_dict)
-    for key in list(masked.keys()):
-        if key.lower() in PII_FIELDS:
-            masked[key] = _REDACTED
-        else:
-            masked[key] = _mask_value(masked[key])
-    return masked
+    return {key: _REDACTED if key.lower() in PII_FIELDS else _mask_value(value) for key, value in event_dict.items()}
 
 
 def _mask_value(value: Any) -> Any:
-    """Recursively mask PII inside an arbitrary value.
+    """Recursively mask PII inside an arbitrary value (copy-on-write).
 
     Args:
         value: A string, dict, list, or other value from a log event.
 
     Returns:
-        The value with PII patterns scrubbed and nested PII keys redacted.
+        *value* itself when nothing inside it needs masking; otherwise a
+        shallow copy with PII patterns scrubbed and nested PII keys redacted.
     """
+    if type(value) in _PASSTHROUGH_TYPES:
+        return value
+    if isinstance(value, str):
+        return _scrub_value(value)  # re.sub returns the same object on no match
     if isinstance(value, dict):
-        for k in list(value.keys()):
-            if k.lower() in PII_FIELDS:
-                value[k] = _REDACTED
-            else:
-                value[k] = _mask_value(value[k])
-    elif isinstance(value, list):
+        masked_dict: dict[Any, Any] | None = None
+        for k, v in value.items():
+            new = _REDACTED if k.lower() in PII_FIELDS else _mask_value(v)
+            if new is not v:
+                if masked_dict is None:
+                    masked_dict = value.copy()
+                masked_dict[k] = new
+        return value if masked_dict is None else masked_dict
+    if isinstance(value, list):
+        masked_list: list[Any] | None = None
         for i, item in enumerate(value):
-            value[i] = _mask_value(item)
-    elif isinstance(value, str):
-        return _scrub_value(value)
+            new = _mask_value(item)
+            if new is not item:
+                if masked_list is None:
+                    masked_list = value.copy()
+                masked_list[i] = new
+        return value if masked_list is None else masked_list
     return value
 
 
@@ -140,6 +149,9 @@ try:
 
         structlog.configure(
             processors=[
+                # Drop events below the stdlib logger's level before any
+                # processor — including PII masking — does work on them.
+                structlog.stdlib.filter_by_level,
                 structlog.contextvars.merge_contextvars,
                 structlog.stdlib.add_log_level,
                 structlog.stdlib.add_logger_name,
@@ -9,12 +9,77 @@ from __future__ import annotations
 import copy
 import math
 from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
 from ceds_jsonld.exceptions import MappingError
 from ceds_jsonld.sanitize import sanitize_string_value, validate_base_uri
 from ceds_jsonld.transforms import get_transform
 
+# Exact types _ensure_scalar passes through without further checks.
+# ``bool`` is deliberately absent: ``type(True) is bool``, not ``int``.
+_PLAIN_SCALAR_TYPES = frozenset({str, int})
+
+
+# Leaf types _copy_config shares instead of copying.
+_IMMUTABLE_CONFIG_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _copy_config(value: Any) -> Any:
+    """Deep-copy parsed mapping-config data.
+
+    Configs are plain YAML data, so dicts and lists are rebuilt directly and
+    immutable leaves are shared — several times faster than
+    ``copy.deepcopy``, which keeps a memo for arbitrary object graphs.  Any
+    other type falls back to ``copy.deepcopy``.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return {k: _copy_config(v) for k, v in value.items()}
+    if value_type is list:
+        return [_copy_config(v) for v in value]
+    if value_type in _IMMUTABLE_CONFIG_TYPES:
+        return value
+    return copy.deepcopy(value)
+
+
+@dataclass(frozen=True, slots=True)
+class _FieldPlan:
+    """One mapping-config field, resolved once at mapper init.
+
+    Attributes:
+        target: Key the mapped value is stored under.
+        source: Source column read from each raw row.
+        optional: Whether a missing value (or a ``None`` transform result)
+            is allowed.
+        transform: Transform name, or ``None`` for no transform.
+        multi_value_split: Delimiter for multiple values within one
+            instance, or ``None``.
+    """
+
+    target: str
+    source: str
+    optional: bool
+    transform: str | None
+    multi_value_split: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class _PropertyPlan:
+    """One mapping-config property, resolved once at mapper init.
+
+    Attributes:
+        name: Property name as it appears in the mapped output.
+        multiple: ``True`` for ``cardinality: multiple`` properties.
+        split_on: Instance delimiter for multiple-cardinality properties.
+        fields: Field plans in config order.
+    """
+
+    name: str
+    multiple: bool
+    split_on: str
+    fields: tuple[_FieldPlan, ...]
+
 
 class FieldMapper:
     """Map raw data rows to structured dicts using a YAML mapping config.
@@ -41,6 +106,10 @@ class FieldMapper:
         """
         self._config = mapping_config
         self._custom_transforms = custom_transforms
+        self._plans = self._init_plans()
+        # Transform callables by name, resolved on first use so an unknown
+        # name still fails when a row needs it, as with get_transform().
+        self._transform_fns: dict[str, Callable[..., Any]] = {}
 
         # Validate base_uri early so malformed URIs are caught even when
         # FieldMapper is used without Builder (e.g. via compose()).
@@ -83,7 +152,7 @@ class FieldMapper:
         Returns:
             A new FieldMapper with the overrides applied.
         """
-        new_config = copy.deepcopy(self._config)
+        new_config = _copy_config(self._config)
 
         if id_source is not None:
             new_config["id_source"] = id_source
@@ -137,9 +206,9 @@ class FieldMapper:
             custom_transforms: Optional custom transforms.
 
         Returns:
-            A new FieldMapper with the merged config.
+            A FieldMapper with the merged config.
         """
-        merged = copy.deepcopy(base_config)
+        merged = _copy_config(base_config)
 
         for key, value in overlay_config.items():
             if key == "properties":
@@ -158,16 +227,16 @@ class FieldMapper:
                                     if field_name in base_prop["fields"]:
                                         base_prop["fields"][field_name].update(field_def)
                                     else:
-                                        base_prop["fields"][field_name] = copy.deepcopy(field_def)
+                                        base_prop["fields"][field_name] = _copy_config(field_def)
                             else:
                                 base_prop[prop_key] = prop_val
                     else:
-                        base_props[prop_name] = copy.deepcopy(prop_def)
+                        base_props[prop_name] = _copy_config(prop_def)
             elif key in ("record_status_defaults", "data_collection_defaults"):
                 if key in merged and isinstance(merged[key], dict):
                     merged[key].update(value)
                 else:
-                    merged[key] = copy.deepcopy(value)
+                    merged[key] = _copy_config(value)
             else:
                 merged[key] = value
 
@@ -176,7 +245,7 @@ class FieldMapper:
     @property
     def config(self) -> dict[str, Any]:
         """Return the current mapping config (read-only copy)."""
-        return copy.deepcopy(self._config)
+        return _copy_config(self._config)
 
     def map(self, raw_row: dict[str, Any]) -> dict[str, Any]:
         """Map a single raw data row to a structured dict for the builder.
@@ -213,15 +282,18 @@ class FieldMapper:
 
         id_transform_name = self._config.get("id_transform")
         if id_transform_name:
-            transform_fn = get_transform(id_transform_name, self._custom_transforms)
+            transform_fn = self._transform_fn(id_transform_name)
             id_value = transform_fn(id_value)
         result["__id__"] = id_value
 
         # Map each property
-        for prop_name, prop_def in self._config.get("properties", {}).items():
-            instances = self._map_property(raw_row, prop_name, prop_def)
+        for plan in self._plans:
+            if plan.multiple:
+                instances = self._map_multiple(raw_row, plan)
+            else:
+                instances = self._map_single(raw_row, plan)
             if instances:
-                result[prop_name] = instances
+                result[plan.name] = instances
 
         return result
 
@@ -229,45 +301,66 @@ class FieldMapper:
     # Internal
     # ------------------------------------------------------------------
 
-    def _map_property(
-        self,
-        raw_row: dict[str, Any],
-        prop_name: str,
-        prop_def: dict[str, Any],
-    ) -> list[dict[str, Any]]:
-        """Map a single property, respecting cardinality."""
-        cardinality = prop_def.get("cardinality", "single")
+    def _init_plans(self) -> tuple[_PropertyPlan, ...]:
+        """Resolve each configured property into a :class:`_PropertyPlan`."""
+        plans: list[_PropertyPlan] = []
+        for prop_name, prop_def in self._config.get("properties", {}).items():
+            fields: list[_FieldPlan] = []
+            for field_key, field_def in prop_def.get("fields", {}).items():
+                if "source" not in field_def:
+                    msg = f"Property '{prop_name}' field '{field_key}' has no 'source'"
+                    raise MappingError(msg)
+                fields.append(
+                    _FieldPlan(
+                        target=field_def.get("target", field_key),
+                        source=field_def["source"],
+                        optional=bool(field_def.get("optional", False)),
+                        transform=field_def.get("transform") or None,
+                        multi_value_split=field_def.get("multi_value_split") or None,
+                    )
+                )
+            plans.append(
+                _PropertyPlan(
+                    name=prop_name,
+                    multiple=prop_def.get("cardinality", "single") == "multiple",
+                    split_on=prop_def.get("split_on", "|"),
+                    fields=tuple(fields),
+                )
+            )
+        return tuple(plans)
 
-        if cardinality == "multiple":
-            return self._map_multiple(raw_row, prop_name, prop_def)
-        return self._map_single(raw_row, prop_name, prop_def)
+    def _transform_fn(self, name: str) -> Callable[..., Any]:
+        """Return the transform callable for *name*, memoized per mapper."""
+        fn = self._transform_fns.get(name)
+        if fn is None:
+            fn = self._transform_fns[name] = get_transform(name, self._custom_transforms)
+        return fn
 
     def _map_single(
         self,
         raw_row: dict[str, Any],
-        prop_name: str,
-        prop_def: dict[str, Any],
+        plan: _PropertyPlan,
     ) -> list[dict[str, Any]]:
         """Map a single-cardinality property (one instance)."""
-        fields = prop_def.get("fields", {})
+        prop_name = plan.name
         instance: dict[str, Any] = {}
 
-        for _field_key, field_def in fields.items():
-            target = field_def.get("target", _field_key)
-            source = field_def["source"]
+        for field in plan.fields:
+            target = field.target
+            source = field.source
             value = raw_row.get(source)
 
             if self._is_empty(value):
-                if not field_def.get("optional", False):
+                if not field.optional:
                     msg = f"Required field '{source}' is missing or empty in row for property '{prop_name}'"
                     raise MappingError(msg)
                 continue
 
             self._ensure_scalar(value, source, prop_name)
             value = sanitize_string_value(str(value))
-            transform_name = field_def.get("transform")
+            transform_name = field.transform
             if transform_name:
-                transform_fn = get_transform(transform_name, self._custom_transforms)
+                transform_fn = self._transform_fn(transform_name)
                 try:
                     raw_result = transform_fn(value)
                 except Exception as exc:
@@ -288,7 +381,7 @@ class FieldMapper:
                 # Transform returned None — check if this is a required field.
                 # None is acceptable for optional fields (signals "skip"),
                 # but required fields must not be silently dropped.
-                if not field_def.get("optional", False):
+                if not field.optional:
                     msg = (
                         f"Transform '{transform_name or '(none)'}' on required field "
                         f"'{source}' in property '{prop_name}' produced None. "
@@ -305,27 +398,26 @@ class FieldMapper:
     def _map_multiple(
         self,
         raw_row: dict[str, Any],
-        prop_name: str,
-        prop_def: dict[str, Any],
+        plan: _PropertyPlan,
     ) -> list[dict[str, Any]]:
         """Map a multiple-cardinality property (pipe-delimited instances)."""
-        split_on = prop_def.get("split_on", "|")
-        fields = prop_def.get("fields", {})
+        prop_name = plan.name
+        split_on = plan.split_on
 
         # Determine instance count from the first field's source column
-        first_field_def = next(iter(fields.values()))
-        first_source = first_field_def["source"]
+        first_source = plan.fields[0].source
         first_raw = raw_row.get(first_source)
 
         if self._is_empty(first_raw):
             # All fields missing — skip this property
-            if first_field_def.get("optional", False):
-                return []
             return []
 
         self._ensure_scalar(first_raw, first_source, prop_name)
         parts = str(first_raw).split(split_on)
         num_instances = len(parts)
+        # Each source column is checked and split once per row, on first use,
+        # rather than once per instance.
+        split_cache: dict[str, list[str]] = {first_source: parts}
 
         instances: list[dict[str, Any]] = []
         for i in range(num_instances):
@@ -336,36 +428,37 @@ class FieldMapper:
 
             instance: dict[str, Any] = {}
 
-            for _field_key, field_def in fields.items():
-                target = field_def.get("target", _field_key)
-                source = field_def["source"]
+            for field in plan.fields:
+                target = field.target
+                source = field.source
                 raw_value = raw_row.get(source)
 
                 if self._is_empty(raw_value):
-                    if not field_def.get("optional", False):
+                    if not field.optional:
                         continue
                     continue
 
-                self._ensure_scalar(raw_value, source, prop_name)
-                field_parts = str(raw_value).split(split_on)
-
-                # Fix #29: Use None for out-of-range segments instead of
-                # forward-filling.  Log a warning when pipe counts differ.
-                if i < len(field_parts):
-                    segment = field_parts[i].strip()
-                else:
-                    from ceds_jsonld.logging import get_logger
-
-                    _log = get_logger(__name__)
-                    _log.warning(
-                        "mapper.pipe_count_mismatch",
-                        property=prop_name,
-                        field=source,
-                        expected=num_instances,
-                        actual=len(field_parts),
-                    )
-                    segment = ""
+                field_parts = split_cache.get(source)
+                if field_parts is None:
+                    self._ensure_scalar(raw_value, source, prop_name)
+                    field_parts = str(raw_value).split(split_on)
+                    if len(field_parts) < num_instances:
+                        # Fix #29: pad out-of-range segments as missing instead
+                        # of forward-filling; warn once per column per row.
+                        from ceds_jsonld.logging import get_logger
+
+                        _log = get_logger(__name__)
+                        _log.warning(
+                            "mapper.pipe_count_mismatch",
+                            property=prop_name,
+                            field=source,
+                            expected=num_instances,
+                            actual=len(field_parts),
+                        )
+                        field_parts += [""] * (num_instances - len(field_parts))
+                    split_cache[source] = field_parts
 
+                segment = field_parts[i].strip()
                 if not segment:
                     # Empty segment — treat as missing
                     continue
@@ -373,12 +466,12 @@ class FieldMapper:
                 value = sanitize_string_value(segment)
 
                 # Handle multi_value_split within a single instance
-                multi_split = field_def.get("multi_value_split")
+                multi_split = field.multi_value_split
                 if multi_split:
                     sub_values = [v.strip() for v in value.split(multi_split) if v.strip()]
-                    transform_name = field_def.get("transform")
+                    transform_name = field.transform
                     if transform_name:
-                        transform_fn = get_transform(transform_name, self._custom_transforms)
+                        transform_fn = self._transform_fn(transform_name)
                         transformed = []
                         for v in sub_values:
                             try:
@@ -398,7 +491,7 @@ class FieldMapper:
                             )
                             if validated is not None:
                                 transformed.append(validated)
-                            elif not field_def.get("optional", False):
+                            elif not field.optional:
                                 msg = (
                                     f"Transform '{transform_name}' on required field "
                                     f"'{source}' in property '{prop_name}' produced None. "
@@ -410,9 +503,9 @@ class FieldMapper:
                     if sub_values:
                         instance[target] = sub_values
                 else:
-                    transform_name = field_def.get("transform")
+                    transform_name = field.transform
                     if transform_name:
-                        transform_fn = get_transform(transform_name, self._custom_transforms)
+                        transform_fn = self._transform_fn(transform_name)
                         try:
                             raw_result = transform_fn(value)
                         except Exception as exc:
@@ -429,7 +522,7 @@ class FieldMapper:
                             prop_name,
                         )
                         if xform_result is None:
-                            if not field_def.get("optional", False):
+                            if not field.optional:
                                 msg = (
                                     f"Transform '{transform_name}' on required field "
                                     f"'{source}' in property '{prop_name}' produced None. "
@@ -541,6 +634,13 @@ class FieldMapper:
         Raises:
             MappingError: If the value is a dict or list.
         """
+        # Exact-type fast path for the values CSV/DB rows actually carry;
+        # subclasses (numpy scalars, str enums, ...) take the isinstance checks.
+        value_type = type(value)
+        if value_type in _PLAIN_SCALAR_TYPES:
+            return value
+        if value_type is float and math.isfinite(value):
+            return value
         if isinstance(value, dict):
             msg = (
                 f"Field '{field_name}' in property '{prop_name}' contains a nested dict "
@@ -585,17 +685,20 @@ class FieldMapper:
         """
         if value is None:
             return True
-        if isinstance(value, str) and not value.strip():
-            return True
-        # Empty collections / sequences
-        if isinstance(value, (list, tuple, set, frozenset, dict)) and not value:
-            return True
-        # Handle pandas NaN
-        try:
-            import math
-
-            if isinstance(value, float) and math.isnan(value):
-                return True
-        except (TypeError, ValueError):
-            pass
+        # Exact-type fast paths for the values rows actually carry.
+        value_type = type(value)
+        if value_type is str:
+            return not value or value.isspace()
+        if value_type is int:
+            return False
+        if value_type is float:
+            return value != value  # NaN is the only float unequal to itself
+        # Subclasses (numpy scalars, str enums, ...) and collections.
+        if isinstance(value, str):
+            return not value or value.isspace()
+        if isinstance(value, (list, tuple, set, frozenset, dict)):
+            return not value
+        # Handle pandas / numpy NaN
+        if isinstance(value, float):
+            return math.isnan(value)
         return False
@@ -6,6 +6,9 @@ JSONLDBuilder → serializer chain, providing both streaming and batch APIs.
 
 from __future__ import annotations
 
+import datetime
+import functools
+import importlib.util
 import time
 from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
@@ -49,6 +52,28 @@ def _try_tqdm(total: int | None = None, desc: str = "Processing") -> Any:
         return None
 
 
+_MODE_LOOKUP: dict[str, ValidationMode] = {m.value: m for m in ValidationMode}
+
+
+def _as_mode(mode: str | ValidationMode) -> ValidationMode:
+    """Resolve a mode name to its :class:`ValidationMode` via a plain dict hit."""
+    if isinstance(mode, ValidationMode):
+        return mode
+    try:
+        return _MODE_LOOKUP[mode]
+    except KeyError:
+        return ValidationMode(mode)  # raises the usual ValueError
+
+
+@functools.lru_cache(maxsize=1)
+def _cosmos_available() -> bool:
+    """Return ``True`` if ``azure-cosmos`` can be imported (probed once per process)."""
+    try:
+        return importlib.util.find_spec("azure.cosmos") is not None
+    except ImportError:
+        return False
+
+
 # ------------------------------------------------------------------
 # Pipeline result / metrics
 # ------------------------------------------------------------------
@@ -84,11 +109,33 @@ class PipelineResult:
 # ------------------------------------------------------------------
 
 
+# Dead-letter entries are small; a 64 KiB buffer batches hundreds of them
+# per write() syscall on failure-heavy runs.
+_DEAD_LETTER_BUFFER_SIZE = 64 * 1024
+
+
+def _dead_letter_default(obj: Any) -> Any:
+    """Serialize the non-JSON values commonly found in raw source rows.
+
+    Sets become lists and date/time objects their ISO 8601 strings; anything
+    else raises ``TypeError`` so :class:`_DeadLetterWriter` falls back to
+    ``repr()`` coercion.
+    """
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    msg = f"Type is not JSON serializable: {type(obj).__name__}"
+    raise TypeError(msg)
+
+
 class _DeadLetterWriter:
     """Write failed records to an NDJSON file for later reprocessing.
 
     Opens the file lazily on the first failure so no file is created
-    if there are zero errors.
+    if there are zero errors.  The handle stays open for the whole run
+    behind a large write buffer; callers must :meth:`close` it (in a
+    ``finally``) to flush the entries.
     """
 
     def __init__(self, path: Path | None) -> None:
@@ -99,20 +146,20 @@ class _DeadLetterWriter:
     def write(self, raw_row: dict[str, Any], error: str) -> None:
         """Write a failed record with its error to the dead-letter file.
 
-        Uses a fallback serialization strategy: if the raw_row contains
-        non-JSON-serializable types (set, datetime, custom objects), the
-        values are coerced to strings via ``repr()`` so the DLQ writer
-        never itself becomes a crash source.
+        Sets and date/time values are serialized natively (as lists and ISO
+        8601 strings).  If the raw_row still contains non-JSON-serializable
+        types (custom objects), the values are coerced to strings via
+        ``repr()`` so the DLQ writer never itself becomes a crash source.
         """
         if self._path is None:
             return
         if self._fh is None:
             self._path.parent.mkdir(parents=True, exist_ok=True)
-            self._fh = self._path.open("wb")
+            self._fh = self._path.open("wb", buffering=_DEAD_LETTER_BUFFER_SIZE)
             _log.info("dead_letter.opened", path=str(self._path))
         entry = {"_error": error, "_record": raw_row}
         try:
-            data = dumps(entry, pretty=False)
+            data = dumps(entry, pretty=False, default=_dead_letter_default, newline=True)
         except Exception:
             # Fallback: coerce non-serializable values to repr strings
             import json as _json
@@ -121,8 +168,8 @@ class _DeadLetterWriter:
                 k: repr(v) if not isinstance(v, (str, int, float, bool, type(None))) else v for k, v in raw_row.items()
             }
             safe_entry = {"_error": error, "_record": safe_row, "_serialization_fallback": True}
-            data = _json.dumps(safe_entry, ensure_ascii=False, default=str).encode("utf-8")
-        self._fh.write(data + b"\n")
+            data = (_json.dumps(safe_entry, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+        self._fh.write(data)
         self._count += 1
 
     @property
@@ -239,6 +286,7 @@ class Pipeline:
 
         self._builder = JSONLDBuilder(self._shape_def)
         self._pre_validator = PreBuildValidator(self._mapper._config)
+        self._cosmos_available = _cosmos_available()
 
         _log.info("pipeline.initialized", shape=shape, adapter=type(source).__name__)
 
@@ -274,8 +322,7 @@ class Pipeline:
             PipelineError: On adapter or build failures.
             ValidationError: In strict mode, on the first validation error.
         """
-        if isinstance(mode, str):
-            mode = ValidationMode(mode)
+        mode = _as_mode(mode)
 
         result = ValidationResult()
 
@@ -288,12 +335,7 @@ class Pipeline:
                     raw_row,
                     mode=ValidationMode.STRICT if mode is ValidationMode.STRICT else ValidationMode.REPORT,
                 )
-                result.record_count += 1
-                if not row_result.conforms:
-                    result.conforms = False
-                for rec_id, issues in row_result.issues.items():
-                    for issue in issues:
-                        result.add_issue(rec_id, issue)
+                result.merge(row_result)
         except ValidationError:
             raise
         except PipelineError:
@@ -324,8 +366,8 @@ class Pipeline:
                 mode=mode,
                 sample_rate=sample_rate,
             )
-            result.error_count += shacl_result.error_count
-            result.warning_count += shacl_result.warning_count
+            # add_issue() is the single source of truth for the counters;
+            # the records were already counted in phase 1.
             if not shacl_result.conforms:
                 result.conforms = False
             for rec_id, issues in shacl_result.issues.items():
@@ -369,8 +411,7 @@ class Pipeline:
             PipelineError: On adapter, mapping, or build failures.
             ValidationError: In strict mode when a row fails validation.
         """
-        if isinstance(validation_mode, str):
-            validation_mode = ValidationMode(validation_mode)
+        validation_mode = _as_mode(validation_mode)
 
         # Try to get a record count for progress tracking
         total = self._source.count() if hasattr(self._source, "count") else None
@@ -496,7 +537,19 @@ class Pipeline:
 
         Returns:
             A :class:`PipelineResult` with timing, counts, and throughput.
+
+        Raises:
+            PipelineError: On an unknown ``validation_mode``, or on row
+                failures when no dead-letter path is configured.
         """
+        vmode = ValidationMode.REPORT
+        if validate:
+            try:
+                vmode = _as_mode(validation_mode)
+            except ValueError as exc:
+                msg = f"Invalid validation_mode {validation_mode!r}; expected one of {sorted(_MODE_LOOKUP)}"
+                raise PipelineError(msg) from exc
+
         t0 = time.perf_counter()
         records_in = 0
         records_out = 0
@@ -508,11 +561,6 @@ class Pipeline:
                 records_in += 1
                 try:
                     if validate:
-                        vmode = (
-                            validation_mode
-                            if isinstance(validation_mode, ValidationMode)
-                            else ValidationMode(validation_mode)
-                        )
                         row_result = self._pre_validator.validate_row(raw_row, mode=vmode)
                         if not row_result.conforms and vmode is not ValidationMode.STRICT:
                             dead.write(raw_row, "pre-build validation failed")
@@ -581,19 +629,21 @@ class Pipeline:
             records_failed = 0
             dead = _DeadLetterWriter(self._dead_letter_path)
             docs: list[dict[str, Any]] = []
-            for raw_row in self._source.read():
-                records_in += 1
-                try:
-                    mapped = self._mapper.map(raw_row)
-                    doc = self._builder.build_one(mapped)
-                    docs.append(doc)
-                except Exception as exc:
-                    if self._dead_letter_path is not None:
-                        dead.write(raw_row, str(exc))
-                        records_failed += 1
-                    else:
-                        raise
-            dead.close()
+            try:
+                for raw_row in self._source.read():
+                    records_in += 1
+                    try:
+                        mapped = self._mapper.map(raw_row)
+                        doc = self._builder.build_one(mapped)
+                        docs.append(doc)
+                    except Exception as exc:
+                        if self._dead_letter_path is not None:
+                            dead.write(raw_row, str(exc))
+                            records_failed += 1
+                        else:
+                            raise
+            finally:
+                dead.close()
             data = dumps(docs, pretty=pretty)
             out = Path(path)
             out.parent.mkdir(parents=True, exist_ok=True)
@@ -646,22 +696,24 @@ class Pipeline:
             records_in = 0
             records_out = 0
             dead = _DeadLetterWriter(self._dead_letter_path)
-            with out.open("wb") as fh:
-                for raw_row in self._source.read():
-                    records_in += 1
-                    try:
-                        mapped = self._mapper.map(raw_row)
-                        doc = self._builder.build_one(mapped)
-                    except Exception as exc:
-                        if self._dead_letter_path is not None:
-                            dead.write(raw_row, str(exc))
-                            continue
-                        raise
-                    line = dumps(doc, pretty=False) + b"\n"
-                    fh.write(line)
-                    total_bytes += len(line)
-                    records_out += 1
-            dead.close()
+            try:
+                with out.open("wb") as fh:
+                    for raw_row in self._source.read():
+                        records_in += 1
+                        try:
+                            mapped = self._mapper.map(raw_row)
+                            doc = self._builder.build_one(mapped)
+                        except Exception as exc:
+                            if self._dead_letter_path is not None:
+                                dead.write(raw_row, str(exc))
+                                continue
+                            raise
+                        line = dumps(doc, pretty=False, newline=True)
+                        fh.write(line)
+                        total_bytes += len(line)
+                        records_out += 1
+            finally:
+                dead.close()
             elapsed = time.perf_counter() - t0
             rps = records_out / elapsed if elapsed > 0 else 0.0
             result = PipelineResult(
@@ -724,19 +776,19 @@ class Pipeline:
             and RU cost.
 
         Raises:
-            PipelineError: On build or upload failure.
-            CosmosError: If ``azure-cosmos`` is not installed.
+            PipelineError: If ``azure-cosmos`` is not installed, or on
+                build or upload failure.
         """
         import asyncio
 
-        try:
-            from ceds_jsonld.cosmos.loader import CosmosLoader as _CosmosLoader
-        except Exception as exc:
+        if not self._cosmos_available:
             msg = (
                 "Cosmos DB support requires the 'azure-cosmos' package. "
                 "Install it with: pip install ceds-jsonld[cosmos]"
             )
-            raise PipelineError(msg) from exc
+            raise PipelineError(msg)
+
+        from ceds_jsonld.cosmos.loader import CosmosLoader as _CosmosLoader
 
         target_container = container or self._shape_name
         docs = self.build_all()
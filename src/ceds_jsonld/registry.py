@@ -7,7 +7,7 @@ these definitions for use by FieldMapper and JSONLDBuilder.
 
 from __future__ import annotations
 
-import json
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -15,14 +15,31 @@ from urllib.request import urlopen
 
 import yaml
 
-from ceds_jsonld.exceptions import ShapeLoadError
+from ceds_jsonld.exceptions import SerializationError, ShapeLoadError
 from ceds_jsonld.logging import get_logger
+from ceds_jsonld.mapping import _copy_config
+from ceds_jsonld.serializer import loads
 
 _log = get_logger(__name__)
 
 # Default ontologies directory shipped with the package
 _PACKAGE_ONTOLOGIES = Path(__file__).parent / "ontologies"
 
+# libyaml's C loader when PyYAML was built with it — same safe subset,
+# roughly an order of magnitude faster on mapping files.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_mapping_yaml(path: Path, mtime_ns: int, size: int) -> Any:
+    """Parse a mapping YAML file, memoized on its path and stat signature.
+
+    Editing the file changes ``mtime_ns``/``size`` and so misses the cache.
+    Callers get the shared parse result and must copy it before handing it
+    out.
+    """
+    return yaml.load(path.read_text(encoding="utf-8"), Loader=_YAML_LOADER)  # noqa: S506
+
 
 @dataclass(frozen=True)
 class ShapeDefinition:
@@ -247,15 +264,18 @@ class ShapeRegistry:
         # --- JSON-LD Context ---
         context_path = self._find_file(shape_dir, "*context*.json", "JSON-LD context")
         try:
-            context = json.loads(context_path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError) as exc:
+            context = loads(context_path.read_bytes())
+        except (SerializationError, OSError) as exc:
             msg = f"Failed to parse context file {context_path}: {exc}"
             raise ShapeLoadError(msg) from exc
 
         # --- Mapping YAML ---
         mapping_path = self._find_file(shape_dir, "*mapping*.yaml", "mapping YAML")
         try:
-            mapping_config = yaml.safe_load(mapping_path.read_text(encoding="utf-8"))
+            stat = mapping_path.stat()
+            # Every ShapeDefinition owns its config; copying the cached parse
+            # is far cheaper than re-parsing the YAML.
+            mapping_config = _copy_config(_parse_mapping_yaml(mapping_path, stat.st_mtime_ns, stat.st_size))
         except (yaml.YAMLError, OSError) as exc:
             msg = f"Failed to parse mapping YAML {mapping_path}: {exc}"
             raise ShapeLoadError(msg) from exc
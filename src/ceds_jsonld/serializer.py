@@ -7,6 +7,7 @@ This module provides a unified API regardless of which backend is available.
 from __future__ import annotations
 
 import math
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import Any
 
@@ -17,21 +18,29 @@ def _reject_non_finite(obj: Any) -> None:
     """Raise SerializationError if *obj* contains non-finite floats.
 
     JSON-LD is a strict subset of RFC 8259 JSON which does not permit
-    bare ``NaN``, ``Infinity``, or ``-Infinity`` tokens.  This pre-check
-    ensures consistent rejection regardless of the serialization backend.
+    bare ``NaN``, ``Infinity``, or ``-Infinity`` tokens.  orjson silently
+    writes them as ``null``, so the orjson backend runs this pre-check; the
+    stdlib backend relies on ``allow_nan=False`` to reject them during
+    encoding instead.
     """
-    if isinstance(obj, float) and (math.isnan(obj) or math.isinf(obj)):
-        msg = (
-            f"Cannot serialize non-finite float value {obj!r} to JSON. "
-            f"NaN and Infinity are not valid JSON per RFC 8259. "
-            f"Clean the data before serialization."
-        )
-        raise SerializationError(msg)
+    if isinstance(obj, float):
+        if not math.isfinite(obj):
+            msg = (
+                f"Cannot serialize non-finite float value {obj!r} to JSON. "
+                f"NaN and Infinity are not valid JSON per RFC 8259. "
+                f"Clean the data before serialization."
+            )
+            raise SerializationError(msg)
+        return
     if isinstance(obj, dict):
-        for v in obj.values():
-            _reject_non_finite(v)
+        values: Iterable[Any] = obj.values()
     elif isinstance(obj, (list, tuple)):
-        for v in obj:
+        values = obj
+    else:
+        return
+    for v in values:
+        # Strings are the bulk of JSON-LD leaves — skip the call for them.
+        if type(v) is not str:
             _reject_non_finite(v)
 
 
@@ -44,12 +53,22 @@ try:
 
     _BACKEND = "orjson"
 
-    def dumps(obj: Any, *, pretty: bool = False) -> bytes:
+    def dumps(
+        obj: Any,
+        *,
+        pretty: bool = False,
+        default: Callable[[Any], Any] | None = None,
+        newline: bool = False,
+    ) -> bytes:
         """Serialize a Python object to JSON bytes.
 
         Args:
             obj: The object to serialize.
             pretty: If True, indent with 2 spaces.
+            default: Optional hook called for objects the backend cannot
+                serialize natively; it must return a serializable value or
+                raise ``TypeError``.
+            newline: If True, append ``\\n`` to the output (one NDJSON line).
 
         Returns:
             UTF-8 encoded JSON bytes.
@@ -60,7 +79,9 @@ try:
         try:
             _reject_non_finite(obj)
             option = orjson.OPT_INDENT_2 if pretty else 0
-            return orjson.dumps(obj, option=option)
+            if newline:
+                option |= orjson.OPT_APPEND_NEWLINE
+            return orjson.dumps(obj, option=option, default=default)
         except Exception as exc:
             msg = f"Failed to serialize object: {exc}"
             raise SerializationError(msg) from exc
@@ -88,21 +109,30 @@ except ImportError:
 
     _BACKEND = "json"
 
-    def dumps(obj: Any, *, pretty: bool = False) -> bytes:  # type: ignore[misc]
+    def dumps(  # type: ignore[misc]
+        obj: Any,
+        *,
+        pretty: bool = False,
+        default: Callable[[Any], Any] | None = None,
+        newline: bool = False,
+    ) -> bytes:
         """Serialize a Python object to JSON bytes (stdlib fallback).
 
         Raises:
             SerializationError: If serialization fails.
         """
         try:
-            _reject_non_finite(obj)
             indent = 2 if pretty else None
-            return _json.dumps(
+            text = _json.dumps(
                 obj,
                 indent=indent,
                 ensure_ascii=False,
                 allow_nan=False,
-            ).encode("utf-8")
+                default=default,
+            )
+            if newline:
+                text += "\n"
+            return text.encode("utf-8")
         except Exception as exc:
             msg = f"Failed to serialize object: {exc}"
             raise SerializationError(msg) from exc
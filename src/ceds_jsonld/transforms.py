@@ -6,10 +6,20 @@ They are referenced by name in mapping YAML configs and applied by FieldMapper.
 
 from __future__ import annotations
 
+import datetime
+import functools
+import re
 from collections.abc import Callable
 from typing import Any
 
+# Y-M-D digit groups (padding optional), optionally followed by a "T" or
+# space-separated time component that date_format discards.
+_ISO_DATE_RE = re.compile(r"(\d+)-(\d+)-(\d+)(?:[T ].*)?", re.DOTALL)
 
+
+# sex_prefix and race_prefix map low-cardinality code columns (a handful of
+# distinct values repeated on every row), so their results are memoized.
+@functools.lru_cache(maxsize=1024)
 def sex_prefix(value: str) -> str | None:
     """Add 'Sex_' prefix to a sex/gender value.
 
@@ -26,6 +36,7 @@ def sex_prefix(value: str) -> str | None:
     return f"Sex_{cleaned}"
 
 
+@functools.lru_cache(maxsize=1024)
 def race_prefix(value: str) -> str | None:
     """Add 'RaceAndEthnicity_' prefix to a race/ethnicity value.
 
@@ -59,7 +70,8 @@ def first_pipe_split(value: str) -> str | None:
     Returns:
         First value, cleaned of numeric artifacts, or ``None`` if empty.
     """
-    first = str(value).split("|")[0].strip()
+    # partition() stops at the first pipe — no list of every segment.
+    first = str(value).partition("|")[0].strip()
     if not first:
         return None
     # Fast path for pure integers — avoids float() precision loss on large numbers.
@@ -117,29 +129,27 @@ def date_format(value: str) -> str:
     Raises:
         ValueError: If the value cannot be parsed as YYYY-MM-DD.
     """
-    import datetime as _dt
-
     s = str(value).strip()
 
-    # Strip time component if present (e.g. "2026-02-08T14:30:00")
-    if "T" in s:
-        s = s.split("T")[0]
-    elif " " in s and "-" in s.split(" ")[0]:
-        s = s.split(" ")[0]
-
-    parts = s.split("-")
-    if len(parts) != 3:
+    # Fast path: an already-padded YYYY-MM-DD, optionally followed by a time
+    # component.  The dash positions are checked first because
+    # ``fromisoformat`` also accepts forms this transform rejects
+    # (``20260208``, ``2026-W06-1``).
+    if len(s) >= 10 and s[4] == "-" and s[7] == "-" and (len(s) == 10 or s[10] in "T "):
+        try:
+            return datetime.date.fromisoformat(s[:10]).isoformat()
+        except ValueError:
+            pass  # fall through for the detailed error message
+
+    match = _ISO_DATE_RE.fullmatch(s)
+    if match is None:
         msg = f"Value '{value}' is not a valid ISO 8601 date. Expected YYYY-MM-DD format (e.g. '2026-02-08')."
         raise ValueError(msg)
 
-    year_s, month_s, day_s = parts
-    if not (year_s.isdigit() and month_s.isdigit() and day_s.isdigit()):
-        msg = f"Value '{value}' contains non-numeric date components. Expected YYYY-MM-DD format (e.g. '2026-02-08')."
-        raise ValueError(msg)
-
+    year_s, month_s, day_s = match.groups()
     try:
-        dt = _dt.date(int(year_s), int(month_s), int(day_s))
-    except ValueError:
+        dt = datetime.date(int(year_s), int(month_s), int(day_s))
+    except (ValueError, OverflowError):
         msg = f"Value '{value}' is not a valid calendar date. Expected YYYY-MM-DD with valid month (1-12) and day."
         raise ValueError(msg) from None
 
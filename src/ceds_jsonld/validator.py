@@ -19,7 +19,10 @@ human-readable error reports.
 from __future__ import annotations
 
 import datetime
+import functools
 import random
+import re
+import sys
 from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
@@ -28,6 +31,11 @@ from typing import Any
 
 from ceds_jsonld.exceptions import ValidationError
 
+#: ISO 8601 date-time: ``YYYY-MM-DD`` + ``T`` or space + ``hh:mm[:ss[.fff]]``
+#: with an optional ``Z`` / ``±hh[:]mm`` offset.
+_ISO8601_DATETIME_RE = re.compile(r"^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?$")
+_INTEGER_DATATYPES = frozenset({"xsd:integer", "xsd:int"})
+
 # ---------------------------------------------------------------------------
 # Data structures
 # ---------------------------------------------------------------------------
@@ -47,7 +55,7 @@ class ValidationMode(Enum):
     SAMPLE = "sample"
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldIssue:
     """A single field-level validation issue.
 
@@ -65,8 +73,15 @@ class FieldIssue:
     expected: Any = None
     actual: Any = None
 
+    def __post_init__(self) -> None:
+        # Severities built at runtime (deserialized reports, user code) share
+        # the literal's object, so ``severity == "error"`` hits the identity
+        # fast path in every counter.
+        if type(self.severity) is str:
+            self.severity = sys.intern(self.severity)
+
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Outcome of validating one or more records.
 
@@ -101,6 +116,25 @@ class ValidationResult:
         else:
             self.warning_count += 1
 
+    def merge(self, other: ValidationResult) -> None:
+        """Fold another result's records, issues, and counters into this one.
+
+        Issue lists are extended per record and the counters summed, so
+        aggregating a sub-result costs one step per record rather than one
+        :meth:`add_issue` call per issue.  ``raw_report`` is left to the
+        caller.
+
+        Args:
+            other: The result to absorb.  It is not modified.
+        """
+        for record_id, issues in other.issues.items():
+            self.issues.setdefault(record_id, []).extend(issues)
+        self.record_count += other.record_count
+        self.error_count += other.error_count
+        self.warning_count += other.warning_count
+        if not other.conforms:
+            self.conforms = False
+
     def summary(self) -> str:
         """Return a one-line human-readable summary.
 
@@ -182,27 +216,7 @@ class PreBuildValidator:
         """
         rid = record_id or str(raw_row.get(self._config.get("id_source", ""), "unknown"))
         result = ValidationResult(record_count=1)
-
-        # Check id_source column
-        id_source = self._config.get("id_source", "")
-        id_val = raw_row.get(id_source)
-        if self._is_empty(id_val):
-            issue = FieldIssue(
-                property_path="@id",
-                message=(
-                    f"ID source field '{id_source}' is missing or empty. Available columns: {sorted(raw_row.keys())}"
-                ),
-                expected=f"non-empty value in '{id_source}'",
-                actual=id_val,
-            )
-            result.add_issue(rid, issue)
-            if mode is ValidationMode.STRICT:
-                raise ValidationError(issue.message)
-
-        # Check each property's fields
-        for rule in self._rules:
-            self._check_rule(raw_row, rule, rid, result, mode)
-
+        self._validate_into(raw_row, rid, result, mode)
         return result
 
     def validate_batch(
@@ -233,16 +247,14 @@ class PreBuildValidator:
             to_check = list(enumerate(rows))
 
         effective_mode = ValidationMode.STRICT if mode is ValidationMode.STRICT else ValidationMode.REPORT
+        id_source = self._config.get("id_source", "")
 
+        # Issues are written straight into the aggregate result — no
+        # per-row ValidationResult to allocate and then copy from.
         for idx, row in to_check:
-            rid = str(row.get(self._config.get("id_source", ""), f"row_{idx}"))
-            row_result = self.validate_row(row, record_id=rid, mode=effective_mode)
+            rid = str(row.get(id_source, f"row_{idx}"))
+            self._validate_into(row, rid, result, effective_mode)
             result.record_count += 1
-            if not row_result.conforms:
-                result.conforms = False
-            for rec_id, issues in row_result.issues.items():
-                for issue in issues:
-                    result.add_issue(rec_id, issue)
 
         return result
 
@@ -277,10 +289,10 @@ class PreBuildValidator:
         lookup = context_lookup or {}
         iri_to_name = introspector._build_iri_to_name(lookup)
 
+        child_shapes = introspector.all_shapes()
         for prop in root.properties:
             prop_name = iri_to_name.get(prop.path, prop.name or prop.path_local)
             if prop.node_shape:
-                child_shapes = introspector.all_shapes()
                 child = child_shapes.get(prop.node_shape)
                 if child:
                     for child_prop in child.properties:
@@ -298,9 +310,13 @@ class PreBuildValidator:
     # Internal — rule compilation
     # ------------------------------------------------------------------
 
-    @dataclass
+    @dataclass(slots=True, frozen=True)
     class _FieldRule:
-        """Compiled validation rule for one field."""
+        """Compiled validation rule for one field.
+
+        Slotted and frozen: rules are built once in :meth:`_compile_rules`
+        and only read on the per-row hot path.
+        """
 
         property_path: str
         source_column: str
@@ -309,6 +325,25 @@ class PreBuildValidator:
         allowed_values: list[str]
         is_multi_cardinality: bool
         split_on: str
+        allowed_set: frozenset[str] = field(init=False)
+        allowed_preview: str = field(init=False)
+        split_re: re.Pattern[str] | None = field(init=False)
+
+        def __post_init__(self) -> None:
+            # Interned so every issue raised for this field shares one string.
+            object.__setattr__(self, "property_path", sys.intern(self.property_path))
+            object.__setattr__(self, "source_column", sys.intern(self.source_column))
+            # Hash-probe membership for sh:in lists; allowed_values keeps the
+            # original order for error messages.
+            object.__setattr__(self, "allowed_set", frozenset(self.allowed_values))
+            # Rendered once — a bad enum value can repeat across every row.
+            more = "..." if len(self.allowed_values) > 5 else ""
+            object.__setattr__(self, "allowed_preview", f"{self.allowed_values[:5]}{more}")
+            # findall() yields only the non-empty segments of a delimited
+            # value. A character class only expresses single-char delimiters;
+            # longer ones keep using str.split().
+            split_re = re.compile(f"[^{re.escape(self.split_on)}]+") if len(self.split_on) == 1 else None
+            object.__setattr__(self, "split_re", split_re)
 
     def _compile_rules(self) -> list[PreBuildValidator._FieldRule]:
         """Pre-compile per-field rules from the mapping config."""
@@ -341,6 +376,32 @@ class PreBuildValidator:
 
         return rules
 
+    def _validate_into(
+        self,
+        raw_row: dict[str, Any],
+        record_id: str,
+        result: ValidationResult,
+        mode: ValidationMode,
+    ) -> None:
+        """Run the ID check and every field rule, recording issues on *result*."""
+        id_source = self._config.get("id_source", "")
+        id_val = raw_row.get(id_source)
+        if self._is_empty(id_val):
+            issue = FieldIssue(
+                property_path="@id",
+                message=(
+                    f"ID source field '{id_source}' is missing or empty. Available columns: {sorted(raw_row.keys())}"
+                ),
+                expected=f"non-empty value in '{id_source}'",
+                actual=id_val,
+            )
+            result.add_issue(record_id, issue)
+            if mode is ValidationMode.STRICT:
+                raise ValidationError(issue.message)
+
+        for rule in self._rules:
+            self._check_rule(raw_row, rule, record_id, result, mode)
+
     def _check_rule(
         self,
         raw_row: dict[str, Any],
@@ -392,8 +453,9 @@ class PreBuildValidator:
                 if mode is ValidationMode.STRICT:
                     raise ValidationError(issue.message)
 
-        # Datatype plausibility checks
-        if rule.datatype:
+        # Datatype plausibility checks — native ints are valid integers
+        # by construction, so skip the string scan for them.
+        if rule.datatype and not (type(value) is int and rule.datatype in _INTEGER_DATATYPES):
             self._check_datatype(str_val, rule, record_id, result, mode)
 
         # Allowed value checks (from sh:in)
@@ -462,7 +524,7 @@ class PreBuildValidator:
                     raise ValidationError(issue.message) from None
 
         elif dt in ("xsd:dateTime",):
-            if "T" not in value and " " not in value:
+            if _ISO8601_DATETIME_RE.match(value) is None:
                 issue = FieldIssue(
                     property_path=rule.property_path,
                     message=(
@@ -477,10 +539,15 @@ class PreBuildValidator:
                 if mode is ValidationMode.STRICT:
                     raise ValidationError(issue.message)
 
-        elif dt in ("xsd:integer", "xsd:int"):
+        elif dt in _INTEGER_DATATYPES:
+            # Fast path for plain integers — no float() round-trip and no
+            # exception machinery for the common case.
+            digits = value[1:] if value[:1] in ("+", "-") else value
+            if digits.isdecimal():
+                return
             try:
                 int(float(value))
-            except (ValueError, TypeError):
+            except (ValueError, TypeError, OverflowError):
                 issue = FieldIssue(
                     property_path=rule.property_path,
                     message=f"Value '{value}' is not a valid integer",
@@ -503,7 +570,7 @@ class PreBuildValidator:
         """Check value against allowed values (from sh:in)."""
         # For multi-cardinality fields, the raw value may be pipe-delimited
         if rule.is_multi_cardinality:
-            parts = value.split(rule.split_on)
+            parts = rule.split_re.findall(value) if rule.split_re is not None else value.split(rule.split_on)
         else:
             parts = [value]
 
@@ -511,13 +578,10 @@ class PreBuildValidator:
             part = part.strip()
             if not part:
                 continue
-            if part not in rule.allowed_values:
+            if part not in rule.allowed_set:
                 issue = FieldIssue(
                     property_path=rule.property_path,
-                    message=(
-                        f"Value '{part}' is not in the allowed values list. "
-                        f"Allowed: {rule.allowed_values[:5]}{'...' if len(rule.allowed_values) > 5 else ''}"
-                    ),
+                    message=(f"Value '{part}' is not in the allowed values list. Allowed: {rule.allowed_preview}"),
                     severity="warning",
                     expected=rule.allowed_values,
                     actual=part,
@@ -548,6 +612,41 @@ class PreBuildValidator:
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_shacl_triples(source: str, *, is_file: bool, mtime_ns: int) -> tuple[tuple[Any, ...], tuple[Any, ...]]:
+    """Parse SHACL Turtle into immutable namespace and triple tuples, memoized per source.
+
+    Files are keyed by resolved path and modification time, inline Turtle
+    by its text.  Only immutable rdflib terms are cached; each validator
+    builds its own ``Graph`` from them via :func:`_build_shacl_graph`.
+    """
+    from rdflib import Graph
+
+    graph = Graph()
+    if is_file:
+        graph.parse(source, format="turtle")
+    else:
+        graph.parse(data=source, format="turtle")
+    return tuple(graph.namespaces()), tuple(graph)
+
+
+def _build_shacl_graph(source: str, *, is_file: bool, mtime_ns: int) -> Any:
+    """Return a fresh rdflib ``Graph`` for a SHACL source.
+
+    Copying the cached triples is several times cheaper than re-parsing the
+    Turtle, and no two validators ever share a mutable graph.
+    """
+    from rdflib import Graph
+
+    namespaces, triples = _parse_shacl_triples(source, is_file=is_file, mtime_ns=mtime_ns)
+    graph = Graph()
+    for prefix, namespace in namespaces:
+        graph.bind(prefix, namespace, override=True)
+    for triple in triples:
+        graph.add(triple)
+    return graph
+
+
 class SHACLValidator:
     """Full SHACL validation of built JSON-LD documents via pySHACL.
 
@@ -588,23 +687,30 @@ class SHACLValidator:
             raise ValidationError(msg) from exc
 
         try:
-            from rdflib import Graph
+            import rdflib  # noqa: F401
         except ImportError as exc:
             msg = "SHACL validation requires rdflib. Install it with: pip install rdflib"
             raise ValidationError(msg) from exc
 
-        self._shacl_graph = Graph()
         source_path = Path(shacl_source)
         try:
             if source_path.exists():
-                self._shacl_graph.parse(str(source_path), format="turtle")
+                self._shacl_graph = _build_shacl_graph(
+                    str(source_path.resolve()),
+                    is_file=True,
+                    mtime_ns=source_path.stat().st_mtime_ns,
+                )
             else:
-                self._shacl_graph.parse(data=str(shacl_source), format="turtle")
+                self._shacl_graph = _build_shacl_graph(str(shacl_source), is_file=False, mtime_ns=0)
         except Exception as exc:
             msg = f"Failed to parse SHACL source: {exc}"
             raise ValidationError(msg) from exc
 
         self._context = context
+        # Resolved once: the value swapped in for URL contexts, and whether
+        # _prepare_doc needs to look at documents at all.
+        self._injection_context = context.get("@context", context) if context is not None else None
+        self._needs_injection = self._injection_context is not None
 
     # ------------------------------------------------------------------
     # Public API
@@ -717,12 +823,7 @@ class SHACLValidator:
 
         for _idx, doc in to_check:
             doc_result = self.validate_one(doc, mode=effective_mode)
-            result.record_count += 1
-            if not doc_result.conforms:
-                result.conforms = False
-            for rec_id, issues in doc_result.issues.items():
-                for issue in issues:
-                    result.add_issue(rec_id, issue)
+            result.merge(doc_result)
             if doc_result.raw_report:
                 result.raw_report += doc_result.raw_report + "\n"
 
@@ -739,14 +840,13 @@ class SHACLValidator:
         context dict, inject the local context so parsing doesn't require
         network access.
         """
-        if self._context is None:
+        if not self._needs_injection:
             return doc
 
-        context_val = doc.get("@context")
-        if isinstance(context_val, str):
+        if type(doc.get("@context")) is str:
             # Replace URL context with local context dict
             prepared = dict(doc)
-            prepared["@context"] = self._context.get("@context", self._context)
+            prepared["@context"] = self._injection_context
             return prepared
 
         return doc
@@ -2,11 +2,46 @@
 
 from __future__ import annotations
 
+import difflib
+import json
+from typing import Any
+
 import pytest
 
+from ceds_jsonld.builder import JSONLDBuilder
 from ceds_jsonld.registry import ShapeRegistry
 
 
+def pytest_assertrepr_compare(op: str, left: Any, right: Any) -> list[str] | None:
+    """Show a unified diff of pretty-printed JSON when two JSON-LD documents differ.
+
+    Only kicks in for ``==`` between dicts carrying ``@context``, so a single
+    whole-document assertion still pinpoints the differing node.
+    """
+    if op != "==" or not (isinstance(left, dict) and isinstance(right, dict)):
+        return None
+    if "@context" not in left or "@context" not in right:
+        return None
+    left_lines = json.dumps(left, sort_keys=True, indent=2, default=repr).splitlines()
+    right_lines = json.dumps(right, sort_keys=True, indent=2, default=repr).splitlines()
+    diff = difflib.unified_diff(left_lines, right_lines, "left", "right", lineterm="")
+    return ["JSON-LD documents differ:", *diff]
+
+
+@pytest.fixture(scope="session")
+def person_registry() -> ShapeRegistry:
+    """Registry with the Person shape loaded once per session — read-only."""
+    registry = ShapeRegistry()
+    registry.load_shape("person")
+    return registry
+
+
+@pytest.fixture(scope="session")
+def person_builder(person_registry: ShapeRegistry) -> JSONLDBuilder:
+    """Person builder for the session — builders keep no per-row state."""
+    return JSONLDBuilder(person_registry.get_shape("person"))
+
+
 @pytest.fixture()
 def person_shape_def():
     """Load the Person shape definition from shipped ontologies."""
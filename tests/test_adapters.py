@@ -273,6 +273,19 @@ class TestDictAdapter:
         assert len(batches[0]) == 2
         assert len(batches[1]) == 1
 
+    def test_read_batch_matches_read(self) -> None:
+        adapter = DictAdapter([{"v": i} for i in range(7)])
+        batches = list(adapter.read_batch(batch_size=3))
+        assert [len(b) for b in batches] == [3, 3, 1]
+        assert [r for b in batches for r in b] == list(adapter.read())
+
+    def test_snapshot_ignores_later_source_changes(self) -> None:
+        rows = [{"v": 1}]
+        adapter = DictAdapter(rows)
+        rows.append({"v": 2})
+        assert adapter.count() == 1
+        assert list(adapter.read()) == [{"v": 1}]
+
     def test_generator_input_materialised(self) -> None:
         gen = ({"v": i} for i in range(3))
         adapter = DictAdapter(gen)
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import dataclasses
+
 import pytest
 
 from ceds_jsonld.builder import JSONLDBuilder
-from ceds_jsonld.exceptions import BuildError
+from ceds_jsonld.exceptions import BuildError, MappingError
 from ceds_jsonld.mapping import FieldMapper
 
 
@@ -194,3 +196,16 @@ class TestBuildOneErrors:
         builder = JSONLDBuilder(person_shape_def)
         with pytest.raises(BuildError, match="__id__"):
             builder.build_one({"hasPersonName": [{"FirstName": "X"}]})
+
+    def test_property_without_type_fails_at_init(self, person_shape_def):
+        config = dict(person_shape_def.mapping_config)
+        config["properties"] = {"hasThing": {"fields": {}}}
+        shape = dataclasses.replace(person_shape_def, mapping_config=config)
+        with pytest.raises(BuildError, match="hasThing"):
+            JSONLDBuilder(shape)
+
+    def test_field_without_source_fails_at_mapper_init(self, person_shape_def):
+        config = dict(person_shape_def.mapping_config)
+        config["properties"] = {"hasThing": {"type": "Thing", "fields": {"name": {"target": "Name"}}}}
+        with pytest.raises(MappingError, match="Property 'hasThing' field 'name' has no 'source'"):
+            FieldMapper(config)
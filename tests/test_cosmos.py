@@ -238,6 +238,15 @@ class TestCosmosLoaderUpsert:
         assert result.failed == 0
         assert mock_container.upsert_item.await_count == 5
 
+    def test_upsert_many_sums_ru_charge(self, loader_with_mock: CosmosLoader, mock_container: AsyncMock) -> None:
+        response = MagicMock()
+        response.get_response_headers.return_value = {"x-ms-request-charge": "1.5"}
+        mock_container.upsert_item = AsyncMock(return_value=response)
+        docs = [_sample_doc(str(i)) for i in range(5)]
+        result = asyncio.run(loader_with_mock.upsert_many(docs))
+        assert result.succeeded == 5
+        assert result.total_ru == pytest.approx(7.5)
+
     def test_upsert_many_partial_failure(self, loader_with_mock: CosmosLoader, mock_container: AsyncMock) -> None:
         call_count = 0
 
@@ -23,7 +23,7 @@ import pytest
 from ceds_jsonld.adapters.dict_adapter import DictAdapter
 from ceds_jsonld.exceptions import PipelineError, ValidationError
 from ceds_jsonld.pipeline import Pipeline
-from ceds_jsonld.registry import ShapeRegistry
+from ceds_jsonld.registry import ShapeDefinition, ShapeRegistry
 from ceds_jsonld.validator import (
     FieldIssue,
     PreBuildValidator,
@@ -44,6 +44,24 @@ def registry() -> ShapeRegistry:
     return reg
 
 
+@pytest.fixture(scope="module")
+def person_shape(person_registry: ShapeRegistry) -> ShapeDefinition:
+    """Person shape from the session registry — read-only across tests."""
+    return person_registry.get_shape("person")
+
+
+@pytest.fixture(scope="module")
+def prebuild_validator(person_shape: ShapeDefinition) -> PreBuildValidator:
+    """Shared validator — tests only pass fresh ``ValidationResult`` objects in."""
+    return PreBuildValidator(person_shape.mapping_config)
+
+
+@pytest.fixture(scope="module")
+def shacl_validator(person_shape: ShapeDefinition) -> SHACLValidator:
+    """SHACL validator for the Person shape, parsed once per module."""
+    return SHACLValidator(person_shape.shacl_path, context=person_shape.context)
+
+
 @pytest.fixture()
 def valid_row() -> dict[str, Any]:
     return {
@@ -217,31 +235,26 @@ class TestPipelineErrorWrapping:
         with pytest.raises(PipelineError, match="Validation failed"):
             pipeline.validate()
 
-    def test_to_json_wraps_write_error(self, registry: ShapeRegistry, valid_row: dict) -> None:
+    def test_to_json_wraps_write_error(self, registry: ShapeRegistry, valid_row: dict, tmp_path: Path) -> None:
         """to_json wraps write failures in PipelineError."""
         source = DictAdapter([valid_row])
         pipeline = Pipeline(source=source, shape="person", registry=registry)
 
-        # Use a path that's actually a directory to force a write error
-        bad_path = Path("NUL" if sys.platform == "win32" else "/dev/null/impossible")
-        # On Windows, NUL is a special device — try an invalid nested path
-        bad_path = Path("Z:\\nonexistent_drive\\output.json")
-
-        # This may or may not raise depending on the OS; we just exercise the path
-        try:
-            pipeline.to_json(bad_path)
-        except PipelineError:
-            pass  # Expected
+        # A regular file as the parent directory fails on every OS, and
+        # nothing is written outside this test's tmp_path.
+        blocker = tmp_path / "blocker"
+        blocker.write_bytes(b"")
+        with pytest.raises(PipelineError):
+            pipeline.to_json(blocker / "output.json")
 
-    def test_to_ndjson_wraps_write_error(self, registry: ShapeRegistry, valid_row: dict) -> None:
+    def test_to_ndjson_wraps_write_error(self, registry: ShapeRegistry, valid_row: dict, tmp_path: Path) -> None:
         """to_ndjson wraps write failures in PipelineError."""
         source = DictAdapter([valid_row])
         pipeline = Pipeline(source=source, shape="person", registry=registry)
-        bad_path = Path("Z:\\nonexistent_drive\\output.ndjson")
-        try:
-            pipeline.to_ndjson(bad_path)
-        except PipelineError:
-            pass
+        blocker = tmp_path / "blocker"
+        blocker.write_bytes(b"")
+        with pytest.raises(PipelineError):
+            pipeline.to_ndjson(blocker / "output.ndjson")
 
 
 # =====================================================================
@@ -252,193 +265,128 @@ class TestPipelineErrorWrapping:
 class TestPreBuildDatatypeChecks:
     """Test the _check_datatype branches for xsd:dateTime and xsd:integer."""
 
-    @pytest.fixture()
-    def _make_validator_with_datatype(self, registry: ShapeRegistry):
-        """Helper to create a validator with injected datatype rules."""
-
-        def _factory(property_name: str, field_name: str, datatype: str):
-            shape_def = registry.get_shape("person")
-            config = dict(shape_def.mapping_config)  # shallow copy
-            # We'll test through the public API by constructing a minimal config
-            return config
-
-        return _factory
-
-    def test_datetime_valid_passes(self, registry: ShapeRegistry) -> None:
-        """A value with 'T' separator is accepted for xsd:dateTime."""
-        shape_def = registry.get_shape("person")
-        config = shape_def.mapping_config
-
-        # Create a validator with an injected dateTime rule
-        validator = PreBuildValidator(config)
-        # Manually inject a dateTime rule for testing
+    def _make_rule(self, datatype: str) -> Any:
         from ceds_jsonld.validator import PreBuildValidator as PBV
 
-        rule = PBV._FieldRule(
+        return PBV._FieldRule(
             property_path="test.field",
             source_column="TestField",
             required=False,
-            datatype="xsd:dateTime",
+            datatype=datatype,
             allowed_values=[],
             is_multi_cardinality=False,
             split_on="|",
         )
+
+    def test_datetime_valid_passes(self, prebuild_validator: PreBuildValidator) -> None:
+        """A value with 'T' separator is accepted for xsd:dateTime."""
+        rule = self._make_rule("xsd:dateTime")
         result = ValidationResult(record_count=1)
-        validator._check_datatype("2024-01-15T10:30:00", rule, "rec1", result, ValidationMode.REPORT)
+        prebuild_validator._check_datatype("2024-01-15T10:30:00", rule, "rec1", result, ValidationMode.REPORT)
         assert result.warning_count == 0
 
-    def test_datetime_space_separator_passes(self, registry: ShapeRegistry) -> None:
+    def test_datetime_space_separator_passes(self, prebuild_validator: PreBuildValidator) -> None:
         """A value with space instead of T is also accepted."""
-        shape_def = registry.get_shape("person")
-        validator = PreBuildValidator(shape_def.mapping_config)
-        from ceds_jsonld.validator import PreBuildValidator as PBV
-
-        rule = PBV._FieldRule(
-            property_path="test.field",
-            source_column="TestField",
-            required=False,
-            datatype="xsd:dateTime",
-            allowed_values=[],
-            is_multi_cardinality=False,
-            split_on="|",
-        )
+        rule = self._make_rule("xsd:dateTime")
         result = ValidationResult(record_count=1)
-        validator._check_datatype("2024-01-15 10:30:00", rule, "rec1", result, ValidationMode.REPORT)
+        prebuild_validator._check_datatype("2024-01-15 10:30:00", rule, "rec1", result, ValidationMode.REPORT)
         assert result.warning_count == 0
 
-    def test_datetime_invalid_warns(self, registry: ShapeRegistry) -> None:
+    def test_datetime_invalid_warns(self, prebuild_validator: PreBuildValidator) -> None:
         """A date-only value triggers a warning for xsd:dateTime."""
-        shape_def = registry.get_shape("person")
-        validator = PreBuildValidator(shape_def.mapping_config)
-        from ceds_jsonld.validator import PreBuildValidator as PBV
-
-        rule = PBV._FieldRule(
-            property_path="test.field",
-            source_column="TestField",
-            required=False,
-            datatype="xsd:dateTime",
-            allowed_values=[],
-            is_multi_cardinality=False,
-            split_on="|",
-        )
+        rule = self._make_rule("xsd:dateTime")
         result = ValidationResult(record_count=1)
-        validator._check_datatype("2024-01-15", rule, "rec1", result, ValidationMode.REPORT)
+        prebuild_validator._check_datatype("2024-01-15", rule, "rec1", result, ValidationMode.REPORT)
         assert result.warning_count == 1
         assert "dateTime" in result.issues["rec1"][0].message
 
-    def test_datetime_strict_raises(self, registry: ShapeRegistry) -> None:
-        """Invalid dateTime in STRICT mode raises ValidationError."""
-        shape_def = registry.get_shape("person")
-        validator = PreBuildValidator(shape_def.mapping_config)
-        from ceds_jsonld.validator import PreBuildValidator as PBV
+    @pytest.mark.parametrize(
+        "value",
+        ["2024-01-15T10:30", "2024-01-15T10:30:00.123", "2024-01-15T10:30:00Z", "2024-01-15T10:30:00+05:00"],
+    )
+    def test_datetime_iso_variants_pass(self, prebuild_validator: PreBuildValidator, value: str) -> None:
+        """Optional seconds, fractions and UTC offsets are all valid ISO 8601."""
+        rule = self._make_rule("xsd:dateTime")
+        result = ValidationResult(record_count=1)
+        prebuild_validator._check_datatype(value, rule, "rec1", result, ValidationMode.REPORT)
+        assert result.warning_count == 0
 
-        rule = PBV._FieldRule(
-            property_path="test.field",
-            source_column="TestField",
-            required=False,
-            datatype="xsd:dateTime",
-            allowed_values=[],
-            is_multi_cardinality=False,
-            split_on="|",
-        )
+    @pytest.mark.parametrize("value", ["next Tuesday", "2024-01-15 noon", "15/01/2024 10:30:00", "2024-01-15T"])
+    def test_datetime_malformed_warns(self, prebuild_validator: PreBuildValidator, value: str) -> None:
+        """Values merely containing 'T' or a space are no longer accepted."""
+        rule = self._make_rule("xsd:dateTime")
+        result = ValidationResult(record_count=1)
+        prebuild_validator._check_datatype(value, rule, "rec1", result, ValidationMode.REPORT)
+        assert result.warning_count == 1
+
+    def test_datetime_strict_raises(self, prebuild_validator: PreBuildValidator) -> None:
+        """Invalid dateTime in STRICT mode raises ValidationError."""
+        rule = self._make_rule("xsd:dateTime")
         result = ValidationResult(record_count=1)
         with pytest.raises(ValidationError, match="dateTime"):
-            validator._check_datatype("2024-01-15", rule, "rec1", result, ValidationMode.STRICT)
+            prebuild_validator._check_datatype("2024-01-15", rule, "rec1", result, ValidationMode.STRICT)
 
-    def test_integer_valid_passes(self, registry: ShapeRegistry) -> None:
+    def test_integer_valid_passes(self, prebuild_validator: PreBuildValidator) -> None:
         """A numeric string passes xsd:integer check."""
-        shape_def = registry.get_shape("person")
-        validator = PreBuildValidator(shape_def.mapping_config)
-        from ceds_jsonld.validator import PreBuildValidator as PBV
-
-        rule = PBV._FieldRule(
-            property_path="test.field",
-            source_column="TestField",
-            required=False,
-            datatype="xsd:integer",
-            allowed_values=[],
-            is_multi_cardinality=False,
-            split_on="|",
-        )
+        rule = self._make_rule("xsd:integer")
         result = ValidationResult(record_count=1)
-        validator._check_datatype("42", rule, "rec1", result, ValidationMode.REPORT)
+        prebuild_validator._check_datatype("42", rule, "rec1", result, ValidationMode.REPORT)
         assert result.warning_count == 0
 
-    def test_integer_float_string_passes(self, registry: ShapeRegistry) -> None:
+    def test_integer_float_string_passes(self, prebuild_validator: PreBuildValidator) -> None:
         """A float-like string is accepted (truncatable to int)."""
-        shape_def = registry.get_shape("person")
-        validator = PreBuildValidator(shape_def.mapping_config)
-        from ceds_jsonld.validator import PreBuildValidator as PBV
+        rule = self._make_rule("xsd:integer")
+        result = ValidationResult(record_count=1)
+        prebuild_validator._check_datatype("3.14", rule, "rec1", result, ValidationMode.REPORT)
+        assert result.warning_count == 0
 
-        rule = PBV._FieldRule(
-            property_path="test.field",
-            source_column="TestField",
-            required=False,
-            datatype="xsd:integer",
-            allowed_values=[],
-            is_multi_cardinality=False,
-            split_on="|",
-        )
+    @pytest.mark.parametrize("value", ["-42", "+7", "98765432109876543210"])
+    def test_integer_signed_and_large_pass(self, prebuild_validator: PreBuildValidator, value: str) -> None:
+        """Signed and arbitrarily large integers take the fast path."""
+        rule = self._make_rule("xsd:integer")
         result = ValidationResult(record_count=1)
-        validator._check_datatype("3.14", rule, "rec1", result, ValidationMode.REPORT)
+        prebuild_validator._check_datatype(value, rule, "rec1", result, ValidationMode.REPORT)
         assert result.warning_count == 0
 
-    def test_integer_invalid_warns(self, registry: ShapeRegistry) -> None:
-        """A non-numeric string triggers a warning for xsd:integer."""
-        shape_def = registry.get_shape("person")
-        validator = PreBuildValidator(shape_def.mapping_config)
-        from ceds_jsonld.validator import PreBuildValidator as PBV
+    def test_native_int_skips_datatype_scan(self, prebuild_validator: PreBuildValidator) -> None:
+        """Native ints bypass the string check; bools are still checked."""
+        rule = self._make_rule("xsd:integer")
+        result = ValidationResult(record_count=1)
+        with patch.object(PreBuildValidator, "_check_datatype", wraps=prebuild_validator._check_datatype) as check:
+            prebuild_validator._check_rule({"TestField": 42}, rule, "rec1", result, ValidationMode.REPORT)
+            check.assert_not_called()
+            prebuild_validator._check_rule({"TestField": True}, rule, "rec1", result, ValidationMode.REPORT)
+            check.assert_called_once()
+        assert result.warning_count == 1
 
-        rule = PBV._FieldRule(
-            property_path="test.field",
-            source_column="TestField",
-            required=False,
-            datatype="xsd:integer",
-            allowed_values=[],
-            is_multi_cardinality=False,
-            split_on="|",
-        )
+    @pytest.mark.parametrize("value", ["-", "--5", "inf", "nan"])
+    def test_integer_non_finite_or_bare_sign_warns(self, prebuild_validator: PreBuildValidator, value: str) -> None:
+        """A bare sign or a non-finite float string is not an integer."""
+        rule = self._make_rule("xsd:integer")
         result = ValidationResult(record_count=1)
-        validator._check_datatype("abc", rule, "rec1", result, ValidationMode.REPORT)
+        prebuild_validator._check_datatype(value, rule, "rec1", result, ValidationMode.REPORT)
+        assert result.warning_count == 1
+
+    def test_integer_invalid_warns(self, prebuild_validator: PreBuildValidator) -> None:
+        """A non-numeric string triggers a warning for xsd:integer."""
+        rule = self._make_rule("xsd:integer")
+        result = ValidationResult(record_count=1)
+        prebuild_validator._check_datatype("abc", rule, "rec1", result, ValidationMode.REPORT)
         assert result.warning_count == 1
         assert "integer" in result.issues["rec1"][0].message.lower()
 
-    def test_integer_strict_raises(self, registry: ShapeRegistry) -> None:
+    def test_integer_strict_raises(self, prebuild_validator: PreBuildValidator) -> None:
         """Invalid integer in STRICT mode raises ValidationError."""
-        shape_def = registry.get_shape("person")
-        validator = PreBuildValidator(shape_def.mapping_config)
-        from ceds_jsonld.validator import PreBuildValidator as PBV
-
-        rule = PBV._FieldRule(
-            property_path="test.field",
-            source_column="TestField",
-            required=False,
-            datatype="xsd:integer",
-            allowed_values=[],
-            is_multi_cardinality=False,
-            split_on="|",
-        )
+        rule = self._make_rule("xsd:integer")
         result = ValidationResult(record_count=1)
         with pytest.raises(ValidationError, match="integer"):
-            validator._check_datatype("xyz", rule, "rec1", result, ValidationMode.STRICT)
+            prebuild_validator._check_datatype("xyz", rule, "rec1", result, ValidationMode.STRICT)
 
-    def test_xsd_int_also_checked(self, registry: ShapeRegistry) -> None:
+    def test_xsd_int_also_checked(self, prebuild_validator: PreBuildValidator) -> None:
         """xsd:int (not just xsd:integer) uses the integer path."""
-        shape_def = registry.get_shape("person")
-        validator = PreBuildValidator(shape_def.mapping_config)
-        from ceds_jsonld.validator import PreBuildValidator as PBV
-
-        rule = PBV._FieldRule(
-            property_path="test.field",
-            source_column="TestField",
-            required=False,
-            datatype="xsd:int",
-            allowed_values=[],
-            is_multi_cardinality=False,
-            split_on="|",
-        )
+        rule = self._make_rule("xsd:int")
         result = ValidationResult(record_count=1)
-        validator._check_datatype("not_a_number", rule, "rec1", result, ValidationMode.REPORT)
+        prebuild_validator._check_datatype("not_a_number", rule, "rec1", result, ValidationMode.REPORT)
         assert result.warning_count == 1
 
 
@@ -469,65 +417,100 @@ class TestPreBuildAllowedValues:
             split_on=split_on,
         )
 
-    def test_single_value_in_allowed(self, registry: ShapeRegistry) -> None:
-        shape_def = registry.get_shape("person")
-        validator = PreBuildValidator(shape_def.mapping_config)
+    def test_single_value_in_allowed(self, prebuild_validator: PreBuildValidator) -> None:
         rule = self._make_rule(["Male", "Female", "NonBinary"])
         result = ValidationResult(record_count=1)
-        validator._check_allowed_values("Female", rule, "rec1", result, ValidationMode.REPORT)
+        prebuild_validator._check_allowed_values("Female", rule, "rec1", result, ValidationMode.REPORT)
         assert result.warning_count == 0
 
-    def test_single_value_not_in_allowed(self, registry: ShapeRegistry) -> None:
-        shape_def = registry.get_shape("person")
-        validator = PreBuildValidator(shape_def.mapping_config)
+    def test_single_value_not_in_allowed(self, prebuild_validator: PreBuildValidator) -> None:
         rule = self._make_rule(["Male", "Female", "NonBinary"])
         result = ValidationResult(record_count=1)
-        validator._check_allowed_values("Unknown", rule, "rec1", result, ValidationMode.REPORT)
+        prebuild_validator._check_allowed_values("Unknown", rule, "rec1", result, ValidationMode.REPORT)
         assert result.warning_count == 1
         assert "allowed values" in result.issues["rec1"][0].message.lower()
 
-    def test_multi_cardinality_all_valid(self, registry: ShapeRegistry) -> None:
-        shape_def = registry.get_shape("person")
-        validator = PreBuildValidator(shape_def.mapping_config)
+    def test_multi_cardinality_all_valid(self, prebuild_validator: PreBuildValidator) -> None:
         rule = self._make_rule(["White", "Black", "Hispanic"], multi=True)
         result = ValidationResult(record_count=1)
-        validator._check_allowed_values("White|Black", rule, "rec1", result, ValidationMode.REPORT)
+        prebuild_validator._check_allowed_values("White|Black", rule, "rec1", result, ValidationMode.REPORT)
         assert result.warning_count == 0
 
-    def test_multi_cardinality_one_invalid(self, registry: ShapeRegistry) -> None:
-        shape_def = registry.get_shape("person")
-        validator = PreBuildValidator(shape_def.mapping_config)
+    def test_multi_cardinality_one_invalid(self, prebuild_validator: PreBuildValidator) -> None:
         rule = self._make_rule(["White", "Black", "Hispanic"], multi=True)
         result = ValidationResult(record_count=1)
-        validator._check_allowed_values("White|Martian", rule, "rec1", result, ValidationMode.REPORT)
+        prebuild_validator._check_allowed_values("White|Martian", rule, "rec1", result, ValidationMode.REPORT)
         assert result.warning_count == 1
 
-    def test_allowed_values_strict_raises(self, registry: ShapeRegistry) -> None:
-        shape_def = registry.get_shape("person")
-        validator = PreBuildValidator(shape_def.mapping_config)
+    def test_allowed_values_strict_raises(self, prebuild_validator: PreBuildValidator) -> None:
         rule = self._make_rule(["A", "B", "C"])
         result = ValidationResult(record_count=1)
         with pytest.raises(ValidationError, match="allowed values"):
-            validator._check_allowed_values("Z", rule, "rec1", result, ValidationMode.STRICT)
+            prebuild_validator._check_allowed_values("Z", rule, "rec1", result, ValidationMode.STRICT)
 
-    def test_empty_parts_skipped(self, registry: ShapeRegistry) -> None:
+    def test_empty_parts_skipped(self, prebuild_validator: PreBuildValidator) -> None:
         """Empty splits (e.g. trailing pipe) are ignored."""
-        shape_def = registry.get_shape("person")
-        validator = PreBuildValidator(shape_def.mapping_config)
         rule = self._make_rule(["A", "B"], multi=True)
         result = ValidationResult(record_count=1)
-        validator._check_allowed_values("A||B|", rule, "rec1", result, ValidationMode.REPORT)
+        prebuild_validator._check_allowed_values("A||B|", rule, "rec1", result, ValidationMode.REPORT)
         assert result.warning_count == 0
 
-    def test_allowed_values_truncated_list_in_message(self, registry: ShapeRegistry) -> None:
+    def test_rule_precomputes_allowed_set(self) -> None:
+        rule = self._make_rule(["A", "B", "A"])
+        assert rule.allowed_set == frozenset({"A", "B"})
+        assert rule.allowed_values == ["A", "B", "A"]
+
+    def test_rule_interns_path_and_column(self) -> None:
+        from ceds_jsonld.validator import PreBuildValidator as PBV
+
+        path = "".join(["test.", "field"])
+        column = "".join(["Test", "Field"])
+        rule = PBV._FieldRule(
+            property_path=path,
+            source_column=column,
+            required=False,
+            datatype=None,
+            allowed_values=[],
+            is_multi_cardinality=False,
+            split_on="|",
+        )
+        assert rule.property_path is sys.intern("test.field")
+        assert rule.source_column is sys.intern("TestField")
+
+    def test_allowed_values_truncated_list_in_message(self, prebuild_validator: PreBuildValidator) -> None:
         """When >5 allowed values, the message shows '...' truncation."""
-        shape_def = registry.get_shape("person")
-        validator = PreBuildValidator(shape_def.mapping_config)
         rule = self._make_rule(["V1", "V2", "V3", "V4", "V5", "V6", "V7"])
         result = ValidationResult(record_count=1)
-        validator._check_allowed_values("NOPE", rule, "rec1", result, ValidationMode.REPORT)
+        prebuild_validator._check_allowed_values("NOPE", rule, "rec1", result, ValidationMode.REPORT)
         assert "..." in result.issues["rec1"][0].message
 
+    @pytest.mark.parametrize(
+        ("split_on", "value", "expected"),
+        [
+            ("|", "A||B|", ["A", "B"]),
+            (";", "A;;B", ["A", "B"]),
+        ],
+    )
+    def test_split_re_yields_non_empty_segments(self, split_on: str, value: str, expected: list[str]) -> None:
+        """The precompiled splitter drops empty segments."""
+        rule = self._make_rule([], multi=True, split_on=split_on)
+        assert rule.split_re is not None
+        assert rule.split_re.findall(value) == expected
+
+    def test_multi_char_split_on_still_checked(self, prebuild_validator: PreBuildValidator) -> None:
+        """Multi-character delimiters fall back to str.split()."""
+        rule = self._make_rule(["A", "B|C"], multi=True, split_on="||")
+        assert rule.split_re is None
+        result = ValidationResult(record_count=1)
+        prebuild_validator._check_allowed_values("A||||B|C||Z", rule, "rec1", result, ValidationMode.REPORT)
+        assert [i.actual for i in result.issues["rec1"]] == ["Z"]
+
+    def test_allowed_preview_precomputed_on_rule(self) -> None:
+        """The message preview is rendered once when the rule is built."""
+        assert self._make_rule(["A", "B"]).allowed_preview == "['A', 'B']"
+        long_rule = self._make_rule([f"V{i}" for i in range(1, 8)])
+        assert long_rule.allowed_preview == "['V1', 'V2', 'V3', 'V4', 'V5']..."
+
 
 # =====================================================================
 # SHACLValidator — edge cases
@@ -542,41 +525,50 @@ class TestSHACLValidatorEdges:
         with pytest.raises(ValidationError, match="parse SHACL"):
             SHACLValidator("this is not valid turtle content at all {{{")
 
-    def test_validate_one_unparseable_jsonld(self, registry: ShapeRegistry) -> None:
+    def test_same_shacl_source_parses_once_with_separate_graphs(self, person_shape: ShapeDefinition) -> None:
+        """Validators over one SHACL file share the parse but never a mutable graph."""
+        from rdflib import Graph, URIRef
+
+        first = SHACLValidator(person_shape.shacl_path)
+        with patch.object(Graph, "parse", side_effect=AssertionError("re-parsed")):
+            second = SHACLValidator(str(person_shape.shacl_path))
+        assert first._shacl_graph is not second._shacl_graph
+        assert set(first._shacl_graph) == set(second._shacl_graph)
+
+        first._shacl_graph.add((URIRef("urn:x"), URIRef("urn:y"), URIRef("urn:z")))
+        assert len(first._shacl_graph) == len(second._shacl_graph) + 1
+        third = SHACLValidator(person_shape.shacl_path)
+        assert len(third._shacl_graph) == len(second._shacl_graph)
+
+    def test_validate_one_unparseable_jsonld(self, shacl_validator: SHACLValidator) -> None:
         """A doc that rdflib can't parse returns an issue, not a crash."""
-        shape_def = registry.get_shape("person")
-        v = SHACLValidator(shape_def.shacl_path, context=shape_def.context)
         bad_doc = {"@context": "http://example.org/nonexistent", "@id": "x", "@type": "Person"}
-        result = v.validate_one(bad_doc, mode=ValidationMode.REPORT)
+        result = shacl_validator.validate_one(bad_doc, mode=ValidationMode.REPORT)
         assert isinstance(result, ValidationResult)
 
-    def test_validate_one_strict_bad_doc(self, registry: ShapeRegistry) -> None:
+    def test_validate_one_strict_bad_doc(self, shacl_validator: SHACLValidator) -> None:
         """In STRICT mode, a minimally wrong doc raises."""
-        shape_def = registry.get_shape("person")
-        v = SHACLValidator(shape_def.shacl_path, context=shape_def.context)
         # An empty doc with wrong type
         bad_doc = {
-            "@context": shape_def.context.get("@context", shape_def.context),
+            "@context": shacl_validator._injection_context,
             "@id": "urn:test:bad1",
             "@type": "CompletelyWrong",
         }
         # This may either raise or return non-conformant — both are fine
         try:
-            v.validate_one(bad_doc, mode=ValidationMode.STRICT)
+            shacl_validator.validate_one(bad_doc, mode=ValidationMode.STRICT)
         except ValidationError:
             pass  # Expected
 
-    def test_validate_batch_strict_raises_on_bad(self, registry: ShapeRegistry) -> None:
+    def test_validate_batch_strict_raises_on_bad(self, shacl_validator: SHACLValidator) -> None:
         """validate_batch in STRICT mode raises on first bad doc."""
-        shape_def = registry.get_shape("person")
-        v = SHACLValidator(shape_def.shacl_path, context=shape_def.context)
         bad_doc = {
-            "@context": shape_def.context.get("@context", shape_def.context),
+            "@context": shacl_validator._injection_context,
             "@id": "urn:test:bad2",
             "@type": "NotAPerson",
         }
         try:
-            v.validate_batch([bad_doc], mode=ValidationMode.STRICT)
+            shacl_validator.validate_batch([bad_doc], mode=ValidationMode.STRICT)
         except ValidationError:
             pass  # Expected
 
@@ -669,22 +661,28 @@ class TestToCosmosCoverage:
     """Cover the import-error branch in to_cosmos()."""
 
     def test_to_cosmos_missing_azure_cosmos(self, registry: ShapeRegistry, valid_row: dict) -> None:
-        """When azure-cosmos import fails, PipelineError is raised."""
+        """When azure-cosmos is unavailable, PipelineError is raised."""
         source = DictAdapter([valid_row])
         pipeline = Pipeline(source=source, shape="person", registry=registry)
+        pipeline._cosmos_available = False  # simulate azure-cosmos not installed
 
-        # Patch the import to simulate azure-cosmos not installed
-        with patch.dict(sys.modules, {"ceds_jsonld.cosmos.loader": None}):
-            # The to_cosmos method tries to import CosmosLoader dynamically
-            # When it fails, it should raise PipelineError
-            try:
-                pipeline.to_cosmos(
-                    endpoint="https://fake.documents.azure.com:443/",
-                    credential="fake-key",
-                    database="testdb",
-                )
-            except (PipelineError, TypeError, ImportError):
-                pass  # Any of these is acceptable
+        with pytest.raises(PipelineError, match="azure-cosmos"):
+            pipeline.to_cosmos(
+                endpoint="https://fake.documents.azure.com:443/",
+                credential="fake-key",
+                database="testdb",
+            )
+
+    def test_cosmos_probe_handles_missing_parent_package(self) -> None:
+        """A missing ``azure`` namespace package reads as unavailable."""
+        from ceds_jsonld.pipeline import _cosmos_available
+
+        _cosmos_available.cache_clear()
+        try:
+            with patch("importlib.util.find_spec", side_effect=ModuleNotFoundError("azure")):
+                assert _cosmos_available() is False
+        finally:
+            _cosmos_available.cache_clear()
 
 
 # =====================================================================
@@ -707,6 +705,12 @@ class TestPipelineValidateModeParsing:
         result = pipeline.validate(mode=ValidationMode.REPORT)
         assert isinstance(result, ValidationResult)
 
+    def test_validate_rejects_unknown_mode(self, registry: ShapeRegistry, valid_row: dict) -> None:
+        source = DictAdapter([valid_row])
+        pipeline = Pipeline(source=source, shape="person", registry=registry)
+        with pytest.raises(ValueError, match="bogus"):
+            pipeline.validate(mode="bogus")
+
     def test_validate_sample_mode_string(self, registry: ShapeRegistry, valid_row: dict) -> None:
         source = DictAdapter([valid_row])
         pipeline = Pipeline(source=source, shape="person", registry=registry)
@@ -778,16 +782,15 @@ class TestPipelineValidateSHACLInitFailure:
 class TestFromIntrospectorFailure:
     """Cover the from_introspector exception fallback."""
 
-    def test_from_introspector_bad_introspector_falls_back(self, registry: ShapeRegistry) -> None:
+    def test_from_introspector_bad_introspector_falls_back(self, person_shape: ShapeDefinition) -> None:
         """If introspector.root_shape() throws, a plain validator is returned."""
-        shape_def = registry.get_shape("person")
 
         class BrokenIntrospector:
             def root_shape(self):
                 msg = "broken"
                 raise RuntimeError(msg)
 
-        validator = PreBuildValidator.from_introspector(shape_def.mapping_config, BrokenIntrospector())
+        validator = PreBuildValidator.from_introspector(person_shape.mapping_config, BrokenIntrospector())
         assert isinstance(validator, PreBuildValidator)
 
 
@@ -799,9 +802,7 @@ class TestFromIntrospectorFailure:
 class TestPreBuildIDStrict:
     """Cover the strict raise path for missing ID source."""
 
-    def test_missing_id_strict_raises(self, registry: ShapeRegistry) -> None:
-        shape_def = registry.get_shape("person")
-        validator = PreBuildValidator(shape_def.mapping_config)
+    def test_missing_id_strict_raises(self, prebuild_validator: PreBuildValidator) -> None:
         row = {
             "FirstName": "Jane",
             "LastName": "Doe",
@@ -812,7 +813,7 @@ class TestPreBuildIDStrict:
             "PersonIdentifierTypes": "Type",
         }
         with pytest.raises(ValidationError, match="PersonIdentifiers"):
-            validator.validate_row(row, mode=ValidationMode.STRICT)
+            prebuild_validator.validate_row(row, mode=ValidationMode.STRICT)
 
 
 # =====================================================================
@@ -823,22 +824,27 @@ class TestPreBuildIDStrict:
 class TestSHACLValidatorPrepareDoc:
     """Cover _prepare_doc context-injection branches."""
 
-    def test_no_context_returns_doc_unchanged(self, registry: ShapeRegistry) -> None:
+    def test_no_context_returns_doc_unchanged(self, person_shape: ShapeDefinition) -> None:
         """When context is None (no injection), doc passes through."""
-        shape_def = registry.get_shape("person")
-        v = SHACLValidator(shape_def.shacl_path, context=None)
+        v = SHACLValidator(person_shape.shacl_path, context=None)
         doc = {"@context": "http://example.org/ctx", "@id": "x"}
         result = v._prepare_doc(doc)
         assert result is doc  # Same object, no copy
 
-    def test_dict_context_not_replaced(self, registry: ShapeRegistry) -> None:
+    def test_dict_context_not_replaced(self, shacl_validator: SHACLValidator) -> None:
         """When @context is already a dict, it is not replaced."""
-        shape_def = registry.get_shape("person")
-        v = SHACLValidator(shape_def.shacl_path, context=shape_def.context)
         doc = {"@context": {"@vocab": "http://example.org/"}, "@id": "x"}
-        result = v._prepare_doc(doc)
+        result = shacl_validator._prepare_doc(doc)
         assert result is doc  # Dict context → not a string → no replacement
 
+    def test_url_context_replaced_with_copy(self, shacl_validator: SHACLValidator) -> None:
+        """A URL @context is swapped for the local context on a shallow copy."""
+        doc = {"@context": "http://example.org/ctx", "@id": "x"}
+        result = shacl_validator._prepare_doc(doc)
+        assert result is not doc
+        assert doc["@context"] == "http://example.org/ctx"
+        assert result["@context"] is shacl_validator._injection_context
+
 
 # =====================================================================
 # SHACLValidator.validate_one — SHACL non-conformant result parsing
@@ -848,18 +854,16 @@ class TestSHACLValidatorPrepareDoc:
 class TestSHACLResultParsing:
     """Cover _parse_shacl_results branches including the fallback."""
 
-    def test_non_conformant_doc_produces_issues(self, registry: ShapeRegistry) -> None:
+    def test_non_conformant_doc_produces_issues(self, shacl_validator: SHACLValidator) -> None:
         """A doc with wrong type should produce structured issues."""
-        shape_def = registry.get_shape("person")
-        v = SHACLValidator(shape_def.shacl_path, context=shape_def.context)
         # Build a doc with a valid context but missing required properties
         bad_doc = {
-            "@context": shape_def.context.get("@context", shape_def.context),
+            "@context": shacl_validator._injection_context,
             "@id": "urn:cepi:person/testbad",
             "@type": "Person",
             # No other properties — should fail SHACL
         }
-        result = v.validate_one(bad_doc, mode=ValidationMode.REPORT)
+        result = shacl_validator.validate_one(bad_doc, mode=ValidationMode.REPORT)
         assert isinstance(result, ValidationResult)
         assert result.record_count == 1
         # Should have _something_ in the raw_report
@@ -7,28 +7,30 @@ output produced by the reference ``build_person_direct()`` function from
 
 from __future__ import annotations
 
+import functools
+
 from ceds_jsonld.builder import JSONLDBuilder
 from ceds_jsonld.mapping import FieldMapper
 
+# Shared reference sub-shapes — every sub-node carries the same record status
+# and data collection, so the expected document aliases these two dicts.
+# Read-only: only ``actual`` is ever produced by the builder.
+_EXPECTED_RS = {
+    "@type": "RecordStatus",
+    "RecordStartDateTime": {"@type": "xsd:dateTime", "@value": "1900-01-01T00:00:00"},
+    "RecordEndDateTime": {"@type": "xsd:dateTime", "@value": "9999-12-31T00:00:00"},
+    "CommittedByOrganization": {"@id": "cepi:organization/3000000789"},
+}
 
-def _build_expected_record_status() -> dict:
-    """Construct the expected record status sub-shape."""
-    return {
-        "@type": "RecordStatus",
-        "RecordStartDateTime": {"@type": "xsd:dateTime", "@value": "1900-01-01T00:00:00"},
-        "RecordEndDateTime": {"@type": "xsd:dateTime", "@value": "9999-12-31T00:00:00"},
-        "CommittedByOrganization": {"@id": "cepi:organization/3000000789"},
-    }
-
-
-def _build_expected_data_collection() -> dict:
-    return {"@id": "http://example.org/dataCollection/45678", "@type": "DataCollection"}
+_EXPECTED_DC = {"@id": "http://example.org/dataCollection/45678", "@type": "DataCollection"}
 
 
+@functools.cache
 def _build_expected_person_row1() -> dict:
-    """Hand-verified expected output for CSV row 1 (EDITH ADAMS)."""
-    rs = _build_expected_record_status
-    dc = _build_expected_data_collection
+    """Hand-verified expected output for CSV row 1 (EDITH ADAMS).
+
+    Built once and shared between callers — DO NOT MUTATE.
+    """
     return {
         "@context": "https://cepi-dev.state.mi.us/ontology/context-person.json",
         "@id": "cepi:person/989897099",
@@ -37,14 +39,14 @@ def _build_expected_person_row1() -> dict:
             {
                 "@type": "PersonDemographicRace",
                 "hasRaceAndEthnicity": ["RaceAndEthnicity_White", "RaceAndEthnicity_Black"],
-                "hasRecordStatus": rs(),
-                "hasDataCollection": dc(),
+                "hasRecordStatus": _EXPECTED_RS,
+                "hasDataCollection": _EXPECTED_DC,
             },
             {
                 "@type": "PersonDemographicRace",
                 "hasRaceAndEthnicity": "RaceAndEthnicity_AmericanIndianOrAlaskaNative",
-                "hasRecordStatus": rs(),
-                "hasDataCollection": dc(),
+                "hasRecordStatus": _EXPECTED_RS,
+                "hasDataCollection": _EXPECTED_DC,
             },
         ],
         "hasPersonIdentification": [
@@ -53,39 +55,39 @@ def _build_expected_person_row1() -> dict:
                 "PersonIdentifier": {"@type": "xsd:token", "@value": "989897099"},
                 "hasPersonIdentificationSystem": "PersonIdentificationSystem_SSN",
                 "hasPersonIdentifierType": "PersonIdentifierType_PersonIdentifier",
-                "hasRecordStatus": rs(),
-                "hasDataCollection": dc(),
+                "hasRecordStatus": _EXPECTED_RS,
+                "hasDataCollection": _EXPECTED_DC,
             },
             {
                 "@type": "PersonIdentification",
                 "PersonIdentifier": {"@type": "xsd:token", "@value": "40420"},
                 "hasPersonIdentificationSystem": "PersonIdentificationSystem_EducatorID",
                 "hasPersonIdentifierType": "PersonIdentifierType_StaffMemberIdentifier",
-                "hasRecordStatus": rs(),
-                "hasDataCollection": dc(),
+                "hasRecordStatus": _EXPECTED_RS,
+                "hasDataCollection": _EXPECTED_DC,
             },
             {
                 "@type": "PersonIdentification",
                 "PersonIdentifier": {"@type": "xsd:token", "@value": "6202378625"},
                 "hasPersonIdentificationSystem": "PersonIdentificationSystem_State",
                 "hasPersonIdentifierType": "PersonIdentifierType_StudentIdentifier",
-                "hasRecordStatus": rs(),
-                "hasDataCollection": dc(),
+                "hasRecordStatus": _EXPECTED_RS,
+                "hasDataCollection": _EXPECTED_DC,
             },
             {
                 "@type": "PersonIdentification",
                 "PersonIdentifier": {"@type": "xsd:token", "@value": "124031"},
                 "hasPersonIdentificationSystem": "PersonIdentificationSystem_SSN",
                 "hasPersonIdentifierType": "PersonIdentifierType_StaffMemberIdentifier",
-                "hasRecordStatus": rs(),
-                "hasDataCollection": dc(),
+                "hasRecordStatus": _EXPECTED_RS,
+                "hasDataCollection": _EXPECTED_DC,
             },
         ],
         "hasPersonBirth": {
             "@type": "PersonBirth",
             "Birthdate": {"@type": "xsd:date", "@value": "1965-05-15"},
-            "hasRecordStatus": rs(),
-            "hasDataCollection": dc(),
+            "hasRecordStatus": _EXPECTED_RS,
+            "hasDataCollection": _EXPECTED_DC,
         },
         "hasPersonName": {
             "@type": "PersonName",
@@ -93,14 +95,14 @@ def _build_expected_person_row1() -> dict:
             "MiddleName": "M",
             "LastOrSurname": "ADAMS",
             "GenerationCodeOrSuffix": "III",
-            "hasRecordStatus": rs(),
-            "hasDataCollection": dc(),
+            "hasRecordStatus": _EXPECTED_RS,
+            "hasDataCollection": _EXPECTED_DC,
         },
         "hasPersonSexGender": {
             "@type": "PersonSexGender",
             "hasSex": "Sex_Female",
-            "hasRecordStatus": rs(),
-            "hasDataCollection": dc(),
+            "hasRecordStatus": _EXPECTED_RS,
+            "hasDataCollection": _EXPECTED_DC,
         },
     }
 
@@ -115,18 +117,10 @@ class TestPersonGoldenFile:
 
         actual = builder.build_one(mapper.map(sample_person_row_full))
         expected = _build_expected_person_row1()
+        assert expected is not actual
 
-        # Compare each section for better error messages
-        assert actual["@context"] == expected["@context"]
-        assert actual["@id"] == expected["@id"]
-        assert actual["@type"] == expected["@type"]
-        assert actual["hasPersonDemographicRace"] == expected["hasPersonDemographicRace"]
-        assert actual["hasPersonIdentification"] == expected["hasPersonIdentification"]
-        assert actual["hasPersonBirth"] == expected["hasPersonBirth"]
-        assert actual["hasPersonName"] == expected["hasPersonName"]
-        assert actual["hasPersonSexGender"] == expected["hasPersonSexGender"]
-
-        # Full document equality
+        # One full-document comparison; on failure conftest's
+        # pytest_assertrepr_compare hook renders a JSON diff.
         assert actual == expected
 
     def test_minimal_person_row(self, person_shape_def, sample_person_row_minimal):
@@ -136,10 +130,7 @@ class TestPersonGoldenFile:
 
         doc = builder.build_one(mapper.map(sample_person_row_minimal))
 
-        assert doc["@id"] == "cepi:person/123456789"
-        assert doc["@type"] == "Person"
+        assert {"@id": "cepi:person/123456789", "@type": "Person"}.items() <= doc.items()
         name = doc["hasPersonName"]
-        assert name["FirstName"] == "Jane"
-        assert name["LastOrSurname"] == "Doe"
-        assert "MiddleName" not in name
-        assert "GenerationCodeOrSuffix" not in name
+        assert {"FirstName": "Jane", "LastOrSurname": "Doe"}.items() <= name.items()
+        assert name.keys().isdisjoint({"MiddleName", "GenerationCodeOrSuffix"})
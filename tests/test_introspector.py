@@ -10,14 +10,19 @@ Validates:
 
 from __future__ import annotations
 
+import functools
 import json
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
 
+from ceds_jsonld import __version__
 from ceds_jsonld.exceptions import ShapeLoadError
 from ceds_jsonld.introspector import NodeShapeInfo, PropertyInfo, SHACLIntrospector
+from ceds_jsonld.registry import _YAML_LOADER
+from ceds_jsonld.serializer import dumps
 
 # ---------------------------------------------------------------------------
 # Paths
@@ -28,23 +33,71 @@ PERSON_SHACL = _BASE / "Person_SHACL.ttl"
 PERSON_CONTEXT = _BASE / "person_context.json"
 PERSON_MAPPING = _BASE / "person_mapping.yaml"
 
+# Every NodeShape declared in Person_SHACL.ttl.
+PERSON_NODE_SHAPES = (
+    "PersonShape",
+    "PersonBirthShape",
+    "PersonDemographicRaceShape",
+    "PersonIdentificationShape",
+    "PersonNameShape",
+    "PersonSexGenderShape",
+    "RecordStatusShape",
+)
+_PERSON_NODE_SHAPE_SET = frozenset(PERSON_NODE_SHAPES)
 
-@pytest.fixture()
+
+# The introspector and both config fixtures are parsed once per session.
+# Nothing in this module mutates them; tests that need a modified mapping
+# build their own copy.
+
+
+@pytest.fixture(scope="session")
 def introspector() -> SHACLIntrospector:
     """Create an introspector from the Person SHACL file."""
     return SHACLIntrospector(PERSON_SHACL)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def person_context() -> dict:
     """Load the Person JSON-LD context."""
     return json.loads(PERSON_CONTEXT.read_text(encoding="utf-8"))["@context"]
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def person_mapping_config() -> dict:
     """Load the Person mapping YAML config."""
-    return yaml.safe_load(PERSON_MAPPING.read_text(encoding="utf-8"))
+    return yaml.load(PERSON_MAPPING.read_text(encoding="utf-8"), Loader=_YAML_LOADER)
+
+
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+_TEST_TTL = """
+@prefix sh: <http://www.w3.org/ns/shacl#> .
+@prefix ex: <http://example.org/> .
+
+ex:TestShape a sh:NodeShape ;
+    sh:targetClass ex:TestClass ;
+    sh:closed true ;
+    sh:property ex:nameProperty .
+
+ex:nameProperty a sh:PropertyShape ;
+    sh:path ex:name .
+"""
+
+
+@functools.lru_cache(maxsize=8)
+def _intro_from_string(ttl: str) -> SHACLIntrospector:
+    """Parse inline Turtle once per distinct string — callers must not mutate the result."""
+    return SHACLIntrospector(ttl)
+
+
+def _with_property(cfg: dict, name: str, prop_def: dict) -> dict:
+    """Return *cfg* with ``properties[name]`` replaced by *prop_def*.
+
+    Only the top level and the ``properties`` dict are copied; everything
+    else is shared with the session-scoped fixture, which stays untouched.
+    """
+    return {**cfg, "properties": {**cfg["properties"], name: prop_def}}
 
 
 # ===================================================================
@@ -63,16 +116,14 @@ class TestSHACLParsing:
     def test_discovers_all_node_shapes(self, introspector: SHACLIntrospector) -> None:
         """All 7 NodeShapes from Person_SHACL.ttl should be found."""
         shapes = introspector.all_shapes()
-        expected = {
-            "PersonShape",
-            "PersonBirthShape",
-            "PersonDemographicRaceShape",
-            "PersonIdentificationShape",
-            "PersonNameShape",
-            "PersonSexGenderShape",
-            "RecordStatusShape",
-        }
-        assert set(shapes.keys()) == expected
+        assert shapes.keys() == _PERSON_NODE_SHAPE_SET
+
+    def test_all_shapes_is_shared_read_only_view(self, introspector: SHACLIntrospector) -> None:
+        """all_shapes() returns the same read-only view on every call."""
+        shapes = introspector.all_shapes()
+        assert shapes is introspector.all_shapes()
+        with pytest.raises(TypeError):
+            shapes["Injected"] = shapes["PersonShape"]  # type: ignore[index]
 
     def test_invalid_source_raises_error(self) -> None:
         """Non-existent file paths or bad Turtle should raise ShapeLoadError."""
@@ -81,19 +132,7 @@ class TestSHACLParsing:
 
     def test_parse_from_string(self) -> None:
         """Should parse SHACL from a Turtle string."""
-        ttl = """
-        @prefix sh: <http://www.w3.org/ns/shacl#> .
-        @prefix ex: <http://example.org/> .
-
-        ex:TestShape a sh:NodeShape ;
-            sh:targetClass ex:TestClass ;
-            sh:closed true ;
-            sh:property ex:nameProperty .
-
-        ex:nameProperty a sh:PropertyShape ;
-            sh:path ex:name .
-        """
-        intro = SHACLIntrospector(ttl)
+        intro = _intro_from_string(_TEST_TTL)
         shapes = intro.all_shapes()
         assert "TestShape" in shapes
         assert shapes["TestShape"].is_closed is True
@@ -136,15 +175,15 @@ class TestNodeShapeDetails:
         assert ps.target_class is not None
         assert ps.target_class.endswith("C200275")
 
-    def test_all_shapes_closed(self, introspector: SHACLIntrospector) -> None:
+    @pytest.mark.parametrize("shape_name", PERSON_NODE_SHAPES)
+    def test_all_shapes_closed(self, introspector: SHACLIntrospector, shape_name: str) -> None:
         """All NodeShapes in Person SHACL are sh:closed true."""
-        for shape in introspector.all_shapes().values():
-            assert shape.is_closed is True, f"{shape.local_name} should be closed"
+        assert introspector.get_shape(shape_name).is_closed is True
 
-    def test_ignored_properties_present(self, introspector: SHACLIntrospector) -> None:
+    @pytest.mark.parametrize("shape_name", PERSON_NODE_SHAPES)
+    def test_ignored_properties_present(self, introspector: SHACLIntrospector, shape_name: str) -> None:
         """All NodeShapes should have ignored properties (rdf:type, rdf:id, etc.)."""
-        for shape in introspector.all_shapes().values():
-            assert len(shape.ignored_properties) > 0, f"{shape.local_name} missing ignoredProperties"
+        assert len(introspector.get_shape(shape_name).ignored_properties) > 0
 
     def test_get_shape_not_found(self, introspector: SHACLIntrospector) -> None:
         """Requesting a non-existent shape should raise KeyError."""
@@ -231,8 +270,9 @@ class TestDictExport:
     def test_to_dict_is_serializable(self, introspector: SHACLIntrospector) -> None:
         """to_dict() output should be JSON-serializable (no rdflib objects)."""
         d = introspector.to_dict()
-        json_str = json.dumps(d, indent=2)
-        assert len(json_str) > 100
+        # Compact output through the package serializer (orjson when installed).
+        data = dumps(d)
+        assert len(data) > 100
 
     def test_to_dict_children_nested(self, introspector: SHACLIntrospector) -> None:
         """Children in to_dict() are recursively converted."""
@@ -288,11 +328,16 @@ class TestMappingTemplateGeneration:
     def test_template_is_yaml_serializable(self, introspector: SHACLIntrospector, person_context: dict) -> None:
         """Template should be serializable to YAML without errors."""
         tpl = introspector.generate_mapping_template(context_lookup=person_context)
-        yaml_str = yaml.dump(tpl, default_flow_style=False)
+        yaml_str = yaml.dump(tpl, Dumper=_YAML_DUMPER, default_flow_style=False)
         assert len(yaml_str) > 100
         # Should round-trip back
-        loaded = yaml.safe_load(yaml_str)
-        assert loaded["shape"] == "PersonShape"
+        loaded = yaml.load(yaml_str, Loader=_YAML_LOADER)
+        assert loaded == tpl
+
+    def test_template_is_plain_json_data(self, introspector: SHACLIntrospector, person_context: dict) -> None:
+        """Template holds only JSON-compatible values, so it survives a JSON round trip unchanged."""
+        tpl = introspector.generate_mapping_template(context_lookup=person_context)
+        assert json.loads(json.dumps(tpl)) == tpl
 
     def test_template_without_context(self, introspector: SHACLIntrospector) -> None:
         """Template should work without context — uses local IRI names."""
@@ -303,12 +348,12 @@ class TestMappingTemplateGeneration:
     def test_template_identification_system_allowed_values(
         self, introspector: SHACLIntrospector, person_context: dict
     ) -> None:
-        """PersonIdentification fields should note allowed values from sh:in."""
+        """PersonIdentification fields should carry allowed values from sh:in."""
         tpl = introspector.generate_mapping_template(context_lookup=person_context)
         ident = tpl["properties"]["hasPersonIdentification"]
         # Find the field that documents allowed values
-        has_allowed = any("# allowed_values" in f for f in ident["fields"].values() if isinstance(f, dict))
-        assert has_allowed, "Expected at least one field with allowed_values comment"
+        has_allowed = any("allowed_values" in f for f in ident["fields"].values() if isinstance(f, dict))
+        assert has_allowed, "Expected at least one field with an allowed_values key"
 
 
 # ===================================================================
@@ -342,10 +387,7 @@ class TestMappingValidation:
         self, introspector: SHACLIntrospector, person_context: dict, person_mapping_config: dict
     ) -> None:
         """A mapping with an unknown property should produce a warning."""
-        import copy
-
-        bad_mapping = copy.deepcopy(person_mapping_config)
-        bad_mapping["properties"]["fakeProperty"] = {"type": "FakeThing"}
+        bad_mapping = _with_property(person_mapping_config, "fakeProperty", {"type": "FakeThing"})
         issues = introspector.validate_mapping(bad_mapping, context_lookup=person_context)
         fake_issues = [i for i in issues if i["property"] == "fakeProperty"]
         assert len(fake_issues) == 1
@@ -355,10 +397,8 @@ class TestMappingValidation:
         self, introspector: SHACLIntrospector, person_context: dict, person_mapping_config: dict
     ) -> None:
         """A property with the wrong type should produce an error."""
-        import copy
-
-        bad_mapping = copy.deepcopy(person_mapping_config)
-        bad_mapping["properties"]["hasPersonName"]["type"] = "WrongType"
+        name_prop = person_mapping_config["properties"]["hasPersonName"]
+        bad_mapping = _with_property(person_mapping_config, "hasPersonName", {**name_prop, "type": "WrongType"})
         issues = introspector.validate_mapping(bad_mapping, context_lookup=person_context)
         type_issues = [i for i in issues if "Type mismatch" in i["message"]]
         assert len(type_issues) >= 1
@@ -372,6 +412,83 @@ class TestMappingValidation:
         assert len(issues) > 0
 
 
+# ===================================================================
+# Sidecar cache
+# ===================================================================
+
+
+class TestFromCache:
+    """SHACLIntrospector.from_cache reuses a hash-keyed JSON sidecar."""
+
+    def test_first_load_writes_sidecar(self, tmp_path: Path) -> None:
+        sidecar = tmp_path / "person.cache.json"
+        SHACLIntrospector.from_cache(PERSON_SHACL, cache_path=sidecar)
+        payload = json.loads(sidecar.read_text(encoding="utf-8"))
+        assert len(payload["sha256"]) == 64
+        assert payload["version"] == __version__
+        assert {s["local_name"] for s in payload["shapes"]} >= {"PersonShape", "PersonNameShape"}
+
+    def test_cached_load_skips_rdflib_and_matches(self, tmp_path: Path, introspector: SHACLIntrospector) -> None:
+        sidecar = tmp_path / "person.cache.json"
+        SHACLIntrospector.from_cache(PERSON_SHACL, cache_path=sidecar)
+
+        with patch("ceds_jsonld.introspector.Graph.parse", side_effect=AssertionError("re-parsed")):
+            cached = SHACLIntrospector.from_cache(PERSON_SHACL, cache_path=sidecar)
+
+        assert cached.root_shape().local_name == introspector.root_shape().local_name
+        assert cached.all_shapes() == introspector.all_shapes()
+        assert cached.to_dict() == introspector.to_dict()
+        children = cached.root_shape().children.values()
+        assert any(child is cached.get_shape("PersonNameShape") for child in children)
+
+    def test_stale_sidecar_is_reparsed(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "cache"))
+        ttl = tmp_path / "Mini_SHACL.ttl"
+        ttl.write_text(
+            "@prefix sh: <http://www.w3.org/ns/shacl#> .\n"
+            "@prefix ex: <http://example.org/> .\n"
+            "ex:AShape a sh:NodeShape ; sh:targetClass ex:A .\n",
+            encoding="utf-8",
+        )
+        first = SHACLIntrospector.from_cache(ttl)
+        assert list(tmp_path.glob("*.json")) == []
+        assert len(list((tmp_path / "cache" / "ceds-jsonld" / "shacl").glob("Mini_SHACL-*.json"))) == 1
+        assert first.root_shape().local_name == "AShape"
+
+        ttl.write_text(ttl.read_text(encoding="utf-8").replace("AShape", "BShape"), encoding="utf-8")
+        second = SHACLIntrospector.from_cache(ttl)
+        assert second.root_shape().local_name == "BShape"
+
+    @pytest.mark.parametrize("key, value", [("version", "0.0.0"), ("format", -1)])
+    def test_version_mismatch_is_reparsed(self, tmp_path: Path, key: str, value: object) -> None:
+        sidecar = tmp_path / "person.cache.json"
+        SHACLIntrospector.from_cache(PERSON_SHACL, cache_path=sidecar)
+        payload = json.loads(sidecar.read_text(encoding="utf-8"))
+        sidecar.write_text(json.dumps({**payload, key: value}), encoding="utf-8")
+
+        with (
+            patch("ceds_jsonld.introspector.Graph.parse", side_effect=AssertionError("re-parsed")),
+            pytest.raises(ShapeLoadError),
+        ):
+            SHACLIntrospector.from_cache(PERSON_SHACL, cache_path=sidecar)
+
+        SHACLIntrospector.from_cache(PERSON_SHACL, cache_path=sidecar)
+        assert json.loads(sidecar.read_text(encoding="utf-8"))[key] == payload[key]
+        assert list(tmp_path.iterdir()) == [sidecar]
+
+    def test_corrupt_sidecar_falls_back_to_parse(self, tmp_path: Path) -> None:
+        sidecar = tmp_path / "person.cache.json"
+        sidecar.write_text("{not json", encoding="utf-8")
+        intro = SHACLIntrospector.from_cache(PERSON_SHACL, cache_path=sidecar)
+        assert intro.root_shape().local_name == "PersonShape"
+        assert json.loads(sidecar.read_text(encoding="utf-8"))["shapes"]
+
+    def test_missing_file_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(ShapeLoadError, match="Failed to read"):
+            SHACLIntrospector.from_cache(tmp_path / "nope.ttl")
+
+
 # ===================================================================
 # Data class tests
 # ===================================================================
@@ -399,3 +516,8 @@ class TestDataClasses:
         assert n.properties == []
         assert n.children == {}
         assert n.ignored_properties == []
+
+    def test_dataclasses_are_slotted(self) -> None:
+        """Shape records carry no per-instance ``__dict__``."""
+        assert not hasattr(PropertyInfo(path="p", path_local="p"), "__dict__")
+        assert not hasattr(NodeShapeInfo(iri="s", local_name="s"), "__dict__")
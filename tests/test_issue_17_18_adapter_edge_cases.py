@@ -8,81 +8,86 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from ceds_jsonld.adapters.csv_adapter import CSVAdapter
 from ceds_jsonld.adapters.ndjson_adapter import NDJSONAdapter
 
+_BOM = b"\xef\xbb\xbf"
+
+# Static fixture files — written once per module, only ever read.
+_FILES: dict[str, bytes] = {
+    "empty.csv": b"",
+    "header_only.csv": b"Name,Age\n",
+    "blanks.csv": b"Name,Age\nAlice,30\n\n\nBob,25\n",
+    "trailing.csv": b"Name,Age\nAlice,30\nBob,25\n\n\n\n",
+    "normal.csv": b"Name,Age\nAlice,30\nBob,25\nCharlie,35\n",
+    "bom.ndjson": _BOM + b'{"Name": "Alice"}\n{"Name": "Bob"}\n',
+    "no_bom.ndjson": b'{"Name": "Charlie"}\n',
+}
+
+
+@pytest.fixture(scope="module")
+def data_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    directory = tmp_path_factory.mktemp("adapter_edge_cases")
+    for name, content in _FILES.items():
+        (directory / name).write_bytes(content)
+    return directory
+
 
 class TestCSVAdapterCountEdgeCases:
     """Issue #17 — count() must match read() for empty files, blank lines, trailing newlines."""
 
-    def test_empty_file_returns_zero(self, tmp_path: Path):
+    def test_empty_file_returns_zero(self, data_dir: Path):
         """An empty (0-byte) CSV file should return 0, not -1."""
-        csv_file = tmp_path / "empty.csv"
-        csv_file.write_text("")
-        adapter = CSVAdapter(csv_file)
+        adapter = CSVAdapter(data_dir / "empty.csv")
         assert adapter.count() == 0
 
-    def test_header_only_returns_zero(self, tmp_path: Path):
+    def test_header_only_returns_zero(self, data_dir: Path):
         """A CSV with only a header row should return 0 data rows."""
-        csv_file = tmp_path / "header_only.csv"
-        csv_file.write_text("Name,Age\n")
-        adapter = CSVAdapter(csv_file)
+        adapter = CSVAdapter(data_dir / "header_only.csv")
         assert adapter.count() == 0
 
-    def test_blank_lines_between_rows(self, tmp_path: Path):
+    def test_blank_lines_between_rows(self, data_dir: Path):
         """Blank lines between data rows should not be counted."""
-        csv_file = tmp_path / "blanks.csv"
-        csv_file.write_text("Name,Age\nAlice,30\n\n\nBob,25\n")
-        adapter = CSVAdapter(csv_file)
+        adapter = CSVAdapter(data_dir / "blanks.csv")
         count = adapter.count()
-        actual_rows = len(list(adapter.read()))
-        assert count == actual_rows
+        actual_rows = sum(1 for _ in adapter.read())
+        assert count == actual_rows == 2
 
-    def test_trailing_newlines(self, tmp_path: Path):
+    def test_trailing_newlines(self, data_dir: Path):
         """Trailing newlines should not inflate the count."""
-        csv_file = tmp_path / "trailing.csv"
-        csv_file.write_text("Name,Age\nAlice,30\nBob,25\n\n\n\n")
-        adapter = CSVAdapter(csv_file)
+        adapter = CSVAdapter(data_dir / "trailing.csv")
         count = adapter.count()
-        actual_rows = len(list(adapter.read()))
-        assert count == actual_rows
+        actual_rows = sum(1 for _ in adapter.read())
+        assert count == actual_rows == 2
 
-    def test_count_matches_read_normal_file(self, tmp_path: Path):
+    def test_count_matches_read_normal_file(self, data_dir: Path):
         """Normal CSV — count() and len(read()) must agree."""
-        csv_file = tmp_path / "normal.csv"
-        csv_file.write_text("Name,Age\nAlice,30\nBob,25\nCharlie,35\n")
-        adapter = CSVAdapter(csv_file)
+        adapter = CSVAdapter(data_dir / "normal.csv")
         assert adapter.count() == 3
-        assert adapter.count() == len(list(adapter.read()))
+        assert adapter.count() == sum(1 for _ in adapter.read())
 
 
 class TestNDJSONAdapterBOM:
     """Issue #18 — NDJSONAdapter must handle UTF-8 BOM transparently."""
 
-    def test_bom_file_reads_successfully(self, tmp_path: Path):
+    def test_bom_file_reads_successfully(self, data_dir: Path):
         """NDJSON file with UTF-8 BOM should parse without errors."""
-        ndjson_file = tmp_path / "bom.ndjson"
-        bom = b"\xef\xbb\xbf"
-        ndjson_file.write_bytes(bom + b'{"Name": "Alice"}\n{"Name": "Bob"}\n')
-        adapter = NDJSONAdapter(ndjson_file)
+        adapter = NDJSONAdapter(data_dir / "bom.ndjson")
         records = list(adapter.read())
         assert len(records) == 2
         assert records[0]["Name"] == "Alice"
         assert records[1]["Name"] == "Bob"
 
-    def test_no_bom_still_works(self, tmp_path: Path):
+    def test_no_bom_still_works(self, data_dir: Path):
         """NDJSON file without BOM still works normally."""
-        ndjson_file = tmp_path / "no_bom.ndjson"
-        ndjson_file.write_bytes(b'{"Name": "Charlie"}\n')
-        adapter = NDJSONAdapter(ndjson_file)
+        adapter = NDJSONAdapter(data_dir / "no_bom.ndjson")
         records = list(adapter.read())
         assert len(records) == 1
         assert records[0]["Name"] == "Charlie"
 
-    def test_bom_count(self, tmp_path: Path):
+    def test_bom_count(self, data_dir: Path):
         """count() also works with BOM files."""
-        ndjson_file = tmp_path / "bom_count.ndjson"
-        bom = b"\xef\xbb\xbf"
-        ndjson_file.write_bytes(bom + b'{"Name": "Alice"}\n{"Name": "Bob"}\n')
-        adapter = NDJSONAdapter(ndjson_file)
+        adapter = NDJSONAdapter(data_dir / "bom.ndjson")
         assert adapter.count() == 2
@@ -6,7 +6,6 @@
 
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -14,14 +13,8 @@ from typing import Any
 import pytest
 
 from ceds_jsonld import DictAdapter, Pipeline, ShapeRegistry
-
-
-@pytest.fixture()
-def _person_registry() -> ShapeRegistry:
-    """Pre-loaded person shape registry."""
-    reg = ShapeRegistry()
-    reg.load_shape("person")
-    return reg
+from ceds_jsonld.exceptions import PipelineError
+from ceds_jsonld.serializer import loads
 
 
 def _good_row() -> dict[str, Any]:
@@ -50,11 +43,11 @@ def _bad_row() -> dict[str, Any]:
 class TestPipelineRecordsFailed:
     """Issue #19 — records_failed and dead_letter_path must reflect DLQ activity."""
 
-    def test_run_tracks_failures(self, _person_registry: ShapeRegistry, tmp_path: Path):
+    def test_run_tracks_failures(self, person_registry: ShapeRegistry, tmp_path: Path):
         """Pipeline.run() must set records_failed > 0 when rows fail."""
         rows = [_good_row(), _bad_row()]
         dlq = tmp_path / "dlq.ndjson"
-        pipe = Pipeline(DictAdapter(rows), "person", _person_registry, dead_letter_path=dlq)
+        pipe = Pipeline(DictAdapter(rows), "person", person_registry, dead_letter_path=dlq)
         result = pipe.run()
         assert result.records_in == 2
         assert result.records_out == 1
@@ -62,44 +55,64 @@ class TestPipelineRecordsFailed:
         assert result.dead_letter_path is not None
         assert dlq.exists()
 
-    def test_to_json_tracks_failures(self, _person_registry: ShapeRegistry, tmp_path: Path):
+    def test_to_json_tracks_failures(self, person_registry: ShapeRegistry, tmp_path: Path):
         """Pipeline.to_json() must reflect DLQ failures in result."""
         rows = [_good_row(), _bad_row()]
         dlq = tmp_path / "dlq.ndjson"
         out = tmp_path / "out.json"
-        pipe = Pipeline(DictAdapter(rows), "person", _person_registry, dead_letter_path=dlq)
+        pipe = Pipeline(DictAdapter(rows), "person", person_registry, dead_letter_path=dlq)
         result = pipe.to_json(out)
         assert result.records_in == 2
         assert result.records_out == 1
         assert result.records_failed == 1
         assert result.dead_letter_path is not None
 
-    def test_to_ndjson_tracks_failures(self, _person_registry: ShapeRegistry, tmp_path: Path):
+    def test_to_ndjson_tracks_failures(self, person_registry: ShapeRegistry, tmp_path: Path):
         """Pipeline.to_ndjson() must reflect DLQ failures in result."""
         rows = [_good_row(), _bad_row()]
         dlq = tmp_path / "dlq.ndjson"
         out = tmp_path / "out.ndjson"
-        pipe = Pipeline(DictAdapter(rows), "person", _person_registry, dead_letter_path=dlq)
+        pipe = Pipeline(DictAdapter(rows), "person", person_registry, dead_letter_path=dlq)
         result = pipe.to_ndjson(out)
         assert result.records_in == 2
         assert result.records_out == 1
         assert result.records_failed == 1
         assert result.dead_letter_path is not None
 
-    def test_no_failures_no_dlq_path(self, _person_registry: ShapeRegistry, tmp_path: Path):
+    def test_no_failures_no_dlq_path(self, person_registry: ShapeRegistry, tmp_path: Path):
         """When all rows succeed, dead_letter_path should remain None."""
         rows = [_good_row()]
         dlq = tmp_path / "dlq.ndjson"
-        pipe = Pipeline(DictAdapter(rows), "person", _person_registry, dead_letter_path=dlq)
+        pipe = Pipeline(DictAdapter(rows), "person", person_registry, dead_letter_path=dlq)
         result = pipe.run()
         assert result.records_failed == 0
         assert result.dead_letter_path is None
 
 
+class _FailingAdapter(DictAdapter):
+    """Yields its rows, then raises as if the source connection dropped."""
+
+    def read(self, **kwargs: Any):
+        yield from super().read(**kwargs)
+        raise OSError("source connection lost")
+
+
+class TestDLQFlushedOnFailure:
+    """Buffered DLQ entries must reach disk even when the run aborts."""
+
+    @pytest.mark.parametrize("method", ["to_json", "to_ndjson"])
+    def test_entries_flushed_when_source_fails(self, person_registry: ShapeRegistry, tmp_path: Path, method: str):
+        dlq = tmp_path / "dlq.ndjson"
+        pipe = Pipeline(_FailingAdapter([_bad_row()]), "person", person_registry, dead_letter_path=dlq)
+        with pytest.raises(PipelineError, match="source connection lost"):
+            getattr(pipe, method)(tmp_path / "out.json")
+        assert loads(dlq.read_bytes())["_record"]["FirstName"] == "Bad"
+
+
 class TestDLQNonSerializable:
     """Issue #20 — DLQ writer must gracefully handle non-serializable values."""
 
-    def test_set_value_does_not_crash(self, _person_registry: ShapeRegistry, tmp_path: Path):
+    def test_set_value_does_not_crash(self, person_registry: ShapeRegistry, tmp_path: Path):
         """A row with a set (non-JSON-serializable) should go to DLQ, not crash."""
         rows = [
             {
@@ -112,17 +125,16 @@ class TestDLQNonSerializable:
             },
         ]
         dlq = tmp_path / "dlq.ndjson"
-        pipe = Pipeline(DictAdapter(rows), "person", _person_registry, dead_letter_path=dlq)
+        pipe = Pipeline(DictAdapter(rows), "person", person_registry, dead_letter_path=dlq)
         result = pipe.run()
         assert result.records_failed == 1
         assert result.records_out == 0
         assert dlq.exists()
         # DLQ content should be parseable JSON
-        content = dlq.read_text(encoding="utf-8")
-        entry = json.loads(content.strip())
+        entry = loads(dlq.read_bytes())
         assert "_error" in entry
 
-    def test_datetime_value_does_not_crash(self, _person_registry: ShapeRegistry, tmp_path: Path):
+    def test_datetime_value_does_not_crash(self, person_registry: ShapeRegistry, tmp_path: Path):
         """A row with a datetime object should go to DLQ gracefully."""
         rows = [
             {
@@ -135,21 +147,44 @@ class TestDLQNonSerializable:
             },
         ]
         dlq = tmp_path / "dlq.ndjson"
-        pipe = Pipeline(DictAdapter(rows), "person", _person_registry, dead_letter_path=dlq)
+        pipe = Pipeline(DictAdapter(rows), "person", person_registry, dead_letter_path=dlq)
         # Should not crash — the DLQ writer must handle the datetime in raw_row
         result = pipe.run()
         assert result.records_failed == 1
         assert dlq.exists()
 
-    def test_normal_row_still_serializes_normally(self, _person_registry: ShapeRegistry, tmp_path: Path):
+    def test_normal_row_still_serializes_normally(self, person_registry: ShapeRegistry, tmp_path: Path):
         """Normal rows should use the fast orjson path, not the fallback."""
         rows = [_good_row(), _bad_row()]
         dlq = tmp_path / "dlq.ndjson"
-        pipe = Pipeline(DictAdapter(rows), "person", _person_registry, dead_letter_path=dlq)
+        pipe = Pipeline(DictAdapter(rows), "person", person_registry, dead_letter_path=dlq)
         result = pipe.run()
         assert result.records_out == 1
         assert result.records_failed == 1
         # DLQ entry for the normal bad row should NOT have _serialization_fallback
-        content = dlq.read_text(encoding="utf-8").strip()
-        entry = json.loads(content)
+        entry = loads(dlq.read_bytes())
         assert entry.get("_serialization_fallback") is not True
+
+    def test_set_and_datetime_serialized_without_fallback(self, person_registry: ShapeRegistry, tmp_path: Path):
+        """Sets and datetimes are encoded natively rather than repr()-coerced."""
+        row = _bad_row()
+        row["FirstName"] = {"Bad"}
+        row["Birthdate"] = datetime(2026, 1, 1, 8, 30)
+        dlq = tmp_path / "dlq.ndjson"
+        pipe = Pipeline(DictAdapter([row]), "person", person_registry, dead_letter_path=dlq)
+        pipe.run()
+        entry = loads(dlq.read_bytes())
+        assert "_serialization_fallback" not in entry
+        assert entry["_record"]["FirstName"] == ["Bad"]
+        assert entry["_record"]["Birthdate"] == "2026-01-01T08:30:00"
+
+    def test_unknown_object_still_uses_fallback(self, person_registry: ShapeRegistry, tmp_path: Path):
+        """Values the default hook cannot handle fall back to repr() strings."""
+        row = _bad_row()
+        row["FirstName"] = object()
+        dlq = tmp_path / "dlq.ndjson"
+        pipe = Pipeline(DictAdapter([row]), "person", person_registry, dead_letter_path=dlq)
+        pipe.run()
+        entry = loads(dlq.read_bytes())
+        assert entry["_serialization_fallback"] is True
+        assert entry["_record"]["FirstName"].startswith("<object object")
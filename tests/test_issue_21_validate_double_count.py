@@ -6,20 +6,26 @@ warning_count AND called result.add_issue() which also increments them.
 
 from __future__ import annotations
 
+from collections import Counter
+from unittest.mock import patch
+
 from ceds_jsonld import DictAdapter, Pipeline, ShapeRegistry
-from ceds_jsonld.validator import ValidationMode
+from ceds_jsonld.validator import FieldIssue, ValidationMode, ValidationResult
+
+
+def _severity_counts(result: ValidationResult) -> Counter[str]:
+    """Count the recorded FieldIssue objects by severity in one pass."""
+    return Counter(i.severity for issues in result.issues.values() for i in issues)
 
 
-def _make_pipeline(rows: list[dict]) -> Pipeline:
-    registry = ShapeRegistry()
-    registry.load_shape("person")
+def _make_pipeline(registry: ShapeRegistry, rows: list[dict]) -> Pipeline:
     return Pipeline(DictAdapter(rows), "person", registry)
 
 
 class TestValidateCountAccuracy:
     """Verify error_count / warning_count match actual FieldIssue objects."""
 
-    def test_error_count_matches_issue_count(self) -> None:
+    def test_error_count_matches_issue_count(self, person_registry: ShapeRegistry) -> None:
         """error_count must equal the number of error FieldIssue objects."""
         row = {
             "FirstName": "",
@@ -29,16 +35,16 @@ class TestValidateCountAccuracy:
             "PersonIdentifiers": "12345",
             "IdentificationSystems": "State",
         }
-        pipeline = _make_pipeline([row])
+        pipeline = _make_pipeline(person_registry, [row])
         result = pipeline.validate(mode=ValidationMode.REPORT)
 
-        actual_errors = sum(1 for issues in result.issues.values() for i in issues if i.severity == "error")
+        actual_errors = _severity_counts(result)["error"]
         assert actual_errors > 0, "Test expects at least one error"
         assert result.error_count == actual_errors, (
             f"error_count ({result.error_count}) != actual error issues ({actual_errors})"
         )
 
-    def test_warning_count_matches_issue_count(self) -> None:
+    def test_warning_count_matches_issue_count(self, person_registry: ShapeRegistry) -> None:
         """warning_count must equal the number of warning FieldIssue objects."""
         row = {
             "FirstName": "Jane",
@@ -48,15 +54,15 @@ class TestValidateCountAccuracy:
             "PersonIdentifiers": "12345",
             "IdentificationSystems": "State",
         }
-        pipeline = _make_pipeline([row])
+        pipeline = _make_pipeline(person_registry, [row])
         result = pipeline.validate(mode=ValidationMode.REPORT)
 
-        actual_warnings = sum(1 for issues in result.issues.values() for i in issues if i.severity == "warning")
+        actual_warnings = _severity_counts(result)["warning"]
         assert result.warning_count == actual_warnings, (
             f"warning_count ({result.warning_count}) != actual warning issues ({actual_warnings})"
         )
 
-    def test_no_double_count_multiple_rows(self) -> None:
+    def test_no_double_count_multiple_rows(self, person_registry: ShapeRegistry) -> None:
         """Counts must be accurate across multiple rows."""
         rows = [
             {
@@ -76,13 +82,13 @@ class TestValidateCountAccuracy:
                 "IdentificationSystems": "State",
             },
         ]
-        pipeline = _make_pipeline(rows)
+        pipeline = _make_pipeline(person_registry, rows)
         result = pipeline.validate(mode=ValidationMode.REPORT)
 
-        actual_errors = sum(1 for issues in result.issues.values() for i in issues if i.severity == "error")
+        actual_errors = _severity_counts(result)["error"]
         assert result.error_count == actual_errors
 
-    def test_valid_row_zero_counts(self) -> None:
+    def test_valid_row_zero_counts(self, person_registry: ShapeRegistry) -> None:
         """A fully valid row should produce zero errors and zero warnings."""
         row = {
             "FirstName": "Jane",
@@ -92,14 +98,14 @@ class TestValidateCountAccuracy:
             "PersonIdentifiers": "12345",
             "IdentificationSystems": "State",
         }
-        pipeline = _make_pipeline([row])
+        pipeline = _make_pipeline(person_registry, [row])
         result = pipeline.validate(mode=ValidationMode.REPORT)
 
         assert result.error_count == 0
         assert result.warning_count == 0
         assert result.conforms is True
 
-    def test_summary_reflects_accurate_counts(self) -> None:
+    def test_summary_reflects_accurate_counts(self, person_registry: ShapeRegistry) -> None:
         """The summary() string must use the corrected (non-inflated) counts."""
         row = {
             "FirstName": "",
@@ -109,9 +115,33 @@ class TestValidateCountAccuracy:
             "PersonIdentifiers": "12345",
             "IdentificationSystems": "State",
         }
-        pipeline = _make_pipeline([row])
+        pipeline = _make_pipeline(person_registry, [row])
         result = pipeline.validate(mode=ValidationMode.REPORT)
 
-        actual_errors = sum(1 for issues in result.issues.values() for i in issues if i.severity == "error")
+        actual_errors = _severity_counts(result)["error"]
         # The summary must contain the accurate count, not 2x
         assert f"{actual_errors} errors" in result.summary()
+
+    def test_shacl_phase_issues_counted_once(self, person_registry: ShapeRegistry) -> None:
+        """Issues folded in from the SHACL phase must not be counted twice."""
+        row = {
+            "FirstName": "Jane",
+            "LastName": "Doe",
+            "Birthdate": "2000-01-01",
+            "Sex": "Female",
+            "PersonIdentifiers": "12345",
+            "IdentificationSystems": "State",
+        }
+        shacl_result = ValidationResult(record_count=1)
+        shacl_result.add_issue("r1", FieldIssue(property_path="a", message="bad"))
+        shacl_result.add_issue("r1", FieldIssue(property_path="b", message="meh", severity="warning"))
+
+        pipeline = _make_pipeline(person_registry, [row])
+        with patch("ceds_jsonld.pipeline.SHACLValidator") as validator_cls:
+            validator_cls.return_value.validate_batch.return_value = shacl_result
+            result = pipeline.validate(mode=ValidationMode.REPORT, shacl=True)
+
+        counts = _severity_counts(result)
+        assert (result.error_count, result.warning_count) == (counts["error"], counts["warning"]) == (1, 1)
+        assert result.record_count == 1
+        assert result.conforms is False
@@ -14,23 +14,15 @@ from ceds_jsonld.exceptions import MappingError
 from ceds_jsonld.mapping import FieldMapper
 
 
-def _make_pipeline(rows: list[dict]) -> Pipeline:
-    registry = ShapeRegistry()
-    registry.load_shape("person")
-    return Pipeline(DictAdapter(rows), "person", registry)
-
-
-def _get_person_mapper() -> FieldMapper:
-    registry = ShapeRegistry()
-    registry.load_shape("person")
-    shape = registry.get_shape("person")
-    return FieldMapper(shape.mapping_config)
+@pytest.fixture()
+def person_mapper(person_registry: ShapeRegistry) -> FieldMapper:
+    return FieldMapper(person_registry.get_shape("person").mapping_config)
 
 
 class TestEnsureScalarRejectsInfNanBool:
     """_ensure_scalar must raise MappingError for inf, nan, and bool values."""
 
-    def test_float_inf_rejected(self) -> None:
+    def test_float_inf_rejected(self, person_mapper: FieldMapper) -> None:
         row = {
             "FirstName": "Jane",
             "LastName": "Doe",
@@ -39,11 +31,10 @@ class TestEnsureScalarRejectsInfNanBool:
             "PersonIdentifiers": "12345",
             "IdentificationSystems": "State",
         }
-        mapper = _get_person_mapper()
         with pytest.raises(MappingError, match="non-finite float"):
-            mapper.map(row)
+            person_mapper.map(row)
 
-    def test_float_neg_inf_rejected(self) -> None:
+    def test_float_neg_inf_rejected(self, person_mapper: FieldMapper) -> None:
         row = {
             "FirstName": "Jane",
             "LastName": "Doe",
@@ -52,11 +43,10 @@ class TestEnsureScalarRejectsInfNanBool:
             "PersonIdentifiers": "12345",
             "IdentificationSystems": "State",
         }
-        mapper = _get_person_mapper()
         with pytest.raises(MappingError, match="non-finite float"):
-            mapper.map(row)
+            person_mapper.map(row)
 
-    def test_float_nan_rejected(self) -> None:
+    def test_float_nan_rejected(self, person_mapper: FieldMapper) -> None:
         """NaN is caught by _is_empty as 'missing or empty' — still a MappingError."""
         row = {
             "FirstName": "Jane",
@@ -66,13 +56,12 @@ class TestEnsureScalarRejectsInfNanBool:
             "PersonIdentifiers": "12345",
             "IdentificationSystems": "State",
         }
-        mapper = _get_person_mapper()
         # NaN is caught by _is_empty (treated as missing), so the error message
         # may be "missing or empty" or "non-finite float" — both are MappingError.
         with pytest.raises(MappingError):
-            mapper.map(row)
+            person_mapper.map(row)
 
-    def test_bool_true_rejected(self) -> None:
+    def test_bool_true_rejected(self, person_mapper: FieldMapper) -> None:
         row = {
             "FirstName": True,
             "LastName": "Doe",
@@ -81,11 +70,10 @@ class TestEnsureScalarRejectsInfNanBool:
             "PersonIdentifiers": "12345",
             "IdentificationSystems": "State",
         }
-        mapper = _get_person_mapper()
         with pytest.raises(MappingError, match="boolean"):
-            mapper.map(row)
+            person_mapper.map(row)
 
-    def test_bool_false_rejected(self) -> None:
+    def test_bool_false_rejected(self, person_mapper: FieldMapper) -> None:
         row = {
             "FirstName": False,
             "LastName": "Doe",
@@ -94,11 +82,10 @@ class TestEnsureScalarRejectsInfNanBool:
             "PersonIdentifiers": "12345",
             "IdentificationSystems": "State",
         }
-        mapper = _get_person_mapper()
         with pytest.raises(MappingError, match="boolean"):
-            mapper.map(row)
+            person_mapper.map(row)
 
-    def test_normal_float_allowed(self) -> None:
+    def test_normal_float_allowed(self, person_mapper: FieldMapper) -> None:
         """Regular floats should still pass through _ensure_scalar."""
         row = {
             "FirstName": "Jane",
@@ -108,12 +95,24 @@ class TestEnsureScalarRejectsInfNanBool:
             "PersonIdentifiers": 12345.0,
             "IdentificationSystems": "State",
         }
-        mapper = _get_person_mapper()
         # Should not raise
-        result = mapper.map(row)
+        result = person_mapper.map(row)
         assert result is not None
 
-    def test_pipeline_build_rejects_inf_in_date(self) -> None:
+    @pytest.mark.parametrize("value", ["Jane", 12345, 1.5])
+    def test_plain_scalars_returned_unchanged(self, value: object) -> None:
+        assert FieldMapper._ensure_scalar(value, "f", "p") is value
+
+    def test_float_subclass_inf_rejected(self) -> None:
+        """Subclasses miss the exact-type fast path but are still checked."""
+
+        class _Float(float):
+            pass
+
+        with pytest.raises(MappingError, match="non-finite float"):
+            FieldMapper._ensure_scalar(_Float("inf"), "f", "p")
+
+    def test_pipeline_build_rejects_inf_in_date(self, person_registry: ShapeRegistry) -> None:
         """End-to-end: inf in a date field must not produce a document."""
         row = {
             "FirstName": "Jane",
@@ -123,7 +122,7 @@ class TestEnsureScalarRejectsInfNanBool:
             "PersonIdentifiers": "12345",
             "IdentificationSystems": "State",
         }
-        pipeline = _make_pipeline([row])
+        pipeline = Pipeline(DictAdapter([row]), "person", person_registry)
         # build_all catches MappingError and sends to DLQ or re-raises
         with pytest.raises((MappingError, Exception)):
             docs = pipeline.build_all()
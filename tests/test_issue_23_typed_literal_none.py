@@ -6,60 +6,50 @@ the string "None" and float('nan') became "nan".
 
 from __future__ import annotations
 
-from ceds_jsonld import JSONLDBuilder, ShapeRegistry
-
-
-def _get_builder() -> JSONLDBuilder:
-    registry = ShapeRegistry()
-    registry.load_shape("person")
-    shape = registry.get_shape("person")
-    return JSONLDBuilder(shape)
+from ceds_jsonld import JSONLDBuilder
 
 
 class TestTypedLiteralNoneHandling:
     """_typed_literal must return None (not string 'None') for null/nan/inf."""
 
-    def test_none_returns_none(self) -> None:
-        builder = _get_builder()
-        result = builder._typed_literal(None, "xsd:string")
+    def test_none_returns_none(self, person_builder: JSONLDBuilder) -> None:
+        result = person_builder._typed_literal(None, "xsd:string")
         assert result is None
 
-    def test_nan_returns_none(self) -> None:
-        builder = _get_builder()
-        result = builder._typed_literal(float("nan"), "xsd:date")
+    def test_nan_returns_none(self, person_builder: JSONLDBuilder) -> None:
+        result = person_builder._typed_literal(float("nan"), "xsd:date")
         assert result is None
 
-    def test_inf_returns_none(self) -> None:
-        builder = _get_builder()
-        result = builder._typed_literal(float("inf"), "xsd:date")
+    def test_inf_returns_none(self, person_builder: JSONLDBuilder) -> None:
+        result = person_builder._typed_literal(float("inf"), "xsd:date")
         assert result is None
 
-    def test_neg_inf_returns_none(self) -> None:
-        builder = _get_builder()
-        result = builder._typed_literal(float("-inf"), "xsd:date")
+    def test_neg_inf_returns_none(self, person_builder: JSONLDBuilder) -> None:
+        result = person_builder._typed_literal(float("-inf"), "xsd:date")
         assert result is None
 
-    def test_valid_string_produces_typed_literal(self) -> None:
-        builder = _get_builder()
-        result = builder._typed_literal("2000-01-01", "xsd:date")
+    def test_valid_string_produces_typed_literal(self, person_builder: JSONLDBuilder) -> None:
+        result = person_builder._typed_literal("2000-01-01", "xsd:date")
         assert result == {"@type": "xsd:date", "@value": "2000-01-01"}
 
-    def test_valid_int_produces_typed_literal(self) -> None:
-        builder = _get_builder()
-        result = builder._typed_literal(42, "xsd:integer")
+    def test_valid_int_produces_typed_literal(self, person_builder: JSONLDBuilder) -> None:
+        result = person_builder._typed_literal(42, "xsd:integer")
         assert result == {"@type": "xsd:integer", "@value": "42"}
 
-    def test_list_with_none_filters_nulls(self) -> None:
-        builder = _get_builder()
-        result = builder._typed_literal([None, "2000-01-01", None], "xsd:date")
+    def test_list_with_none_filters_nulls(self, person_builder: JSONLDBuilder) -> None:
+        result = person_builder._typed_literal([None, "2000-01-01", None], "xsd:date")
         assert result == [{"@type": "xsd:date", "@value": "2000-01-01"}]
 
-    def test_list_all_none_returns_none(self) -> None:
-        builder = _get_builder()
-        result = builder._typed_literal([None, None], "xsd:date")
+    def test_list_all_none_returns_none(self, person_builder: JSONLDBuilder) -> None:
+        result = person_builder._typed_literal([None, None], "xsd:date")
         assert result is None
 
-    def test_list_with_nan_filters_nan(self) -> None:
-        builder = _get_builder()
-        result = builder._typed_literal([float("nan"), "hello", float("inf")], "xsd:string")
+    def test_list_with_nan_filters_nan(self, person_builder: JSONLDBuilder) -> None:
+        result = person_builder._typed_literal([float("nan"), "hello", float("inf")], "xsd:string")
         assert result == [{"@type": "xsd:string", "@value": "hello"}]
+
+    def test_repeated_values_return_independent_dicts(self, person_builder: JSONLDBuilder) -> None:
+        first = person_builder._typed_literal("Female", "xsd:string")
+        second = person_builder._typed_literal("Female", "xsd:string")
+        assert first == second
+        assert first is not second
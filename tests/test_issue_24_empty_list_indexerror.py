@@ -6,22 +6,17 @@ when value is an empty list (len == 0 falls into else, value[0] on []).
 
 from __future__ import annotations
 
-from ceds_jsonld import JSONLDBuilder, ShapeRegistry
+import pytest
 
-
-def _get_builder() -> JSONLDBuilder:
-    registry = ShapeRegistry()
-    registry.load_shape("person")
-    shape = registry.get_shape("person")
-    return JSONLDBuilder(shape)
+from ceds_jsonld import JSONLDBuilder
+from ceds_jsonld.builder import _EMPTY, _unwrap
 
 
 class TestBuildSubNodesEmptyList:
     """Empty list values must not crash the builder."""
 
-    def test_empty_list_property_skipped(self) -> None:
+    def test_empty_list_property_skipped(self, person_builder: JSONLDBuilder) -> None:
         """An empty list at the property level should produce no output for that key."""
-        builder = _get_builder()
         mapped_row = {
             "__id__": "person-1",
             "hasPersonName": [{"FirstName": "Jane", "LastOrSurname": "Doe"}],
@@ -29,13 +24,12 @@ class TestBuildSubNodesEmptyList:
             "hasPersonSexGender": [{"hasSex": "Sex_Female"}],
             "hasPersonIdentifier": [],  # Empty list
         }
-        doc = builder.build_one(mapped_row)
+        doc = person_builder.build_one(mapped_row)
         # hasPersonIdentifier should be absent (skipped)
         assert "hasPersonIdentifier" not in doc
 
-    def test_empty_list_field_value_no_crash(self) -> None:
+    def test_empty_list_field_value_no_crash(self, person_builder: JSONLDBuilder) -> None:
         """An empty list as a field value within a sub-node must not crash."""
-        builder = _get_builder()
         mapped_row = {
             "__id__": "person-2",
             "hasPersonName": [{"FirstName": "Jane", "LastOrSurname": "Doe"}],
@@ -46,12 +40,11 @@ class TestBuildSubNodesEmptyList:
             ],
         }
         # Should not crash with IndexError
-        doc = builder.build_one(mapped_row)
+        doc = person_builder.build_one(mapped_row)
         assert doc is not None
 
-    def test_single_element_list_unwrapped(self) -> None:
+    def test_single_element_list_unwrapped(self, person_builder: JSONLDBuilder) -> None:
         """A single-element list should still be unwrapped to a scalar."""
-        builder = _get_builder()
         mapped_row = {
             "__id__": "person-3",
             "hasPersonName": [{"FirstName": "Jane", "LastOrSurname": "Doe"}],
@@ -61,13 +54,12 @@ class TestBuildSubNodesEmptyList:
                 {"PersonIdentifier": "12345", "hasPersonIdentificationSystem": "State"},
             ],
         }
-        doc = builder.build_one(mapped_row)
+        doc = person_builder.build_one(mapped_row)
         # Single instance should be unwrapped (not a list)
         assert isinstance(doc.get("hasPersonIdentification"), dict)
 
-    def test_multi_element_list_kept_as_list(self) -> None:
+    def test_multi_element_list_kept_as_list(self, person_builder: JSONLDBuilder) -> None:
         """Multiple instances should remain as a list."""
-        builder = _get_builder()
         mapped_row = {
             "__id__": "person-4",
             "hasPersonName": [{"FirstName": "Jane", "LastOrSurname": "Doe"}],
@@ -78,6 +70,14 @@ class TestBuildSubNodesEmptyList:
                 {"PersonIdentifier": "222", "hasPersonIdentificationSystem": "District"},
             ],
         }
-        doc = builder.build_one(mapped_row)
+        doc = person_builder.build_one(mapped_row)
         assert isinstance(doc.get("hasPersonIdentification"), list)
         assert len(doc["hasPersonIdentification"]) == 2
+
+
+@pytest.mark.parametrize(
+    ("values", "expected"),
+    [([], _EMPTY), (["a"], "a"), (["a", "b"], ["a", "b"])],
+)
+def test_unwrap(values: list, expected: object) -> None:
+    assert _unwrap(values) == expected
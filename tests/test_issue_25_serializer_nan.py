@@ -17,25 +17,29 @@ class TestSerializerRejectsNonFiniteFloats:
     """dumps() must raise SerializationError for NaN/Infinity values."""
 
     def test_nan_raises(self) -> None:
-        with pytest.raises((SerializationError, ValueError)):
+        with pytest.raises(SerializationError):
             dumps({"x": float("nan")})
 
     def test_inf_raises(self) -> None:
-        with pytest.raises((SerializationError, ValueError)):
+        with pytest.raises(SerializationError):
             dumps({"x": float("inf")})
 
     def test_neg_inf_raises(self) -> None:
-        with pytest.raises((SerializationError, ValueError)):
+        with pytest.raises(SerializationError):
             dumps({"x": float("-inf")})
 
     def test_nan_in_nested_dict_raises(self) -> None:
-        with pytest.raises((SerializationError, ValueError)):
+        with pytest.raises(SerializationError):
             dumps({"a": {"b": float("nan")}})
 
     def test_nan_in_list_raises(self) -> None:
-        with pytest.raises((SerializationError, ValueError)):
+        with pytest.raises(SerializationError):
             dumps({"items": [1, 2, float("nan")]})
 
+    def test_serialization_error_is_value_error(self) -> None:
+        with pytest.raises(ValueError):
+            dumps({"x": float("nan")})
+
     def test_normal_float_succeeds(self) -> None:
         result = dumps({"x": 3.14})
         assert b"3.14" in result
@@ -9,6 +9,8 @@ Issue #30: Custom transforms returning None/non-string bypass validation.
 
 from __future__ import annotations
 
+import logging
+
 import pytest
 
 from ceds_jsonld import DictAdapter, Pipeline, ShapeRegistry
@@ -17,13 +19,6 @@ from ceds_jsonld.transforms import date_format, first_pipe_split, race_prefix, s
 from ceds_jsonld.validator import PreBuildValidator, ValidationMode
 
 
-@pytest.fixture()
-def person_registry() -> ShapeRegistry:
-    reg = ShapeRegistry()
-    reg.load_shape("person")
-    return reg
-
-
 @pytest.fixture()
 def base_row() -> dict[str, str]:
     return {
@@ -138,6 +133,20 @@ class TestIssue27DateFormat:
         with pytest.raises(ValueError, match="not a valid calendar date"):
             date_format("2026-02-30")
 
+    def test_rejects_oversized_year(self) -> None:
+        with pytest.raises(ValueError, match="not a valid calendar date"):
+            date_format("99999999999999999999-01-01")
+
+    @pytest.mark.parametrize("value", ["2026-2-8T", "2026-2-8 anything"])
+    def test_unpadded_date_strips_trailing_time(self, value: str) -> None:
+        assert date_format(value) == "2026-02-08"
+
+    @pytest.mark.parametrize("value", ["20260208", "2026-W06-1", "2026-039"])
+    def test_rejects_other_iso_forms(self, value: str) -> None:
+        """Basic, week, and ordinal ISO forms are not YYYY-MM-DD."""
+        with pytest.raises(ValueError):
+            date_format(value)
+
     def test_pipeline_rejects_invalid_date(
         self,
         person_registry: ShapeRegistry,
@@ -227,6 +236,26 @@ class TestIssue29PipeMismatch:
             f"Expected no system for third ID (pipe mismatch), got {system!r}. Forward-fill bug is still present."
         )
 
+    def test_mismatch_warns_once_per_column(
+        self,
+        person_registry: ShapeRegistry,
+        base_row: dict[str, str],
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        row = {
+            **base_row,
+            "PersonIdentifiers": "AAA|BBB|CCC|DDD",
+            "IdentificationSystems": "State|Fed",
+            "PersonIdentifierTypes": "Type1|Type2|Type3|Type4",
+        }
+        pipe = Pipeline(DictAdapter([row]), "person", person_registry)
+        with caplog.at_level(logging.WARNING):
+            docs = pipe.build_all()
+
+        assert len(docs[0]["hasPersonIdentification"]) == 4
+        mismatches = [r for r in caplog.records if "pipe_count_mismatch" in r.getMessage()]
+        assert len(mismatches) == 1
+
     def test_matched_pipe_counts_work_normally(
         self,
         person_registry: ShapeRegistry,
@@ -7,13 +7,14 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Any
-from unittest.mock import MagicMock
 
 import pytest
 
 from ceds_jsonld.cosmos.prepare import prepare_for_cosmos
 from ceds_jsonld.exceptions import BuildError, CosmosError
+from ceds_jsonld.registry import ShapeDefinition
 from ceds_jsonld.sanitize import validate_base_uri
 
 # =====================================================================
@@ -72,6 +73,12 @@ class TestCosmosHashSeparator:
         result = prepare_for_cosmos(doc)
         assert result["id"] == "42"
 
+    def test_hash_then_slash_uses_last_separator(self) -> None:
+        """``a#b/c`` → id should be ``'c'`` (the later of ``#`` and ``/``)."""
+        doc: dict[str, Any] = {"@id": "a#b/c", "@type": "Person"}
+        result = prepare_for_cosmos(doc)
+        assert result["id"] == "c"
+
 
 # =====================================================================
 # Issue #34 — validate_base_uri gaps
@@ -109,10 +116,26 @@ class TestValidateBaseUriDangerousSchemes:
         with pytest.raises(ValueError, match="disallowed scheme"):
             validate_base_uri("ftp://evil.example.com/")
 
+    @pytest.mark.parametrize(
+        ("uri", "message"),
+        [
+            ("file:///etc/passwd", "disallowed scheme"),
+            ("cepi:person x", "whitespace"),
+            ("cepi:%2E%2E/etc", "percent-encoded path traversal"),
+        ],
+    )
+    def test_specific_error_wins_over_missing_separator(self, uri: str, message: str) -> None:
+        with pytest.raises(ValueError, match=message):
+            validate_base_uri(uri)
+
     def test_file_scheme_uppercase_rejected(self) -> None:
         with pytest.raises(ValueError, match="disallowed scheme"):
             validate_base_uri("FILE:///etc/passwd#")
 
+    @pytest.mark.parametrize("uri", ["filesystem:person/", "ftps://example.org/", "file/", "ftp#"])
+    def test_scheme_prefix_lookalikes_allowed(self, uri: str) -> None:
+        assert validate_base_uri(uri) == uri
+
     def test_http_scheme_allowed(self) -> None:
         assert validate_base_uri("http://example.org/ns/") == "http://example.org/ns/"
 
@@ -135,10 +158,20 @@ class TestValidateBaseUriEncodedTraversal:
         with pytest.raises(ValueError, match="percent-encoded path traversal"):
             validate_base_uri("cepi:%2E%2e/etc/")
 
+    @pytest.mark.parametrize("uri", ["cepi:%2E./etc/", "cepi:.%2e/etc/", "cepi:%2E%2E\\etc/", "cepi:%2E%2E#"])
+    def test_half_encoded_and_other_separators(self, uri: str) -> None:
+        with pytest.raises(ValueError, match="percent-encoded path traversal"):
+            validate_base_uri(uri)
+
 
 class TestValidateBaseUriExistingChecksUnbroken:
     """Existing validation rules must still work after our changes."""
 
+    def test_invalid_uri_raises_on_every_call(self) -> None:
+        for _ in range(2):
+            with pytest.raises(ValueError, match="must end with"):
+                validate_base_uri("cepi:no-separator")
+
     def test_valid_slash_uri(self) -> None:
         assert validate_base_uri("cepi:person/") == "cepi:person/"
 
@@ -174,18 +207,20 @@ class TestValidateBaseUriExistingChecksUnbroken:
 class TestBuilderValidatesBaseUri:
     """JSONLDBuilder.__init__ must call validate_base_uri."""
 
-    def _make_shape_def(self, base_uri: str) -> MagicMock:
-        """Create a minimal mock ShapeDefinition."""
-        shape_def = MagicMock()
-        shape_def.name = "test-shape"
-        shape_def.mapping_config = {
-            "base_uri": base_uri,
-            "type": "TestType",
-            "context_url": "https://example.org/ctx",
-            "properties": {},
-        }
-        shape_def.context = {}
-        return shape_def
+    def _make_shape_def(self, base_uri: str) -> ShapeDefinition:
+        """Create a minimal in-memory ShapeDefinition."""
+        return ShapeDefinition(
+            name="test-shape",
+            base_dir=Path("test-shape"),
+            shacl_path=Path("test-shape") / "shape.ttl",
+            context={},
+            mapping_config={
+                "base_uri": base_uri,
+                "type": "TestType",
+                "context_url": "https://example.org/ctx",
+                "properties": {},
+            },
+        )
 
     def test_valid_base_uri_accepted(self) -> None:
         from ceds_jsonld.builder import JSONLDBuilder
@@ -167,6 +167,26 @@ class TestPIIMaskingNoMutation:
         assert result["ssn"] == "***REDACTED***"
         assert result["name"] == "Alice"
 
+    def test_mask_pii_shares_branches_without_pii(self):
+        """Nested values with nothing to redact are returned as-is, not copied."""
+        clean = {"scores": [1, 2, 3], "meta": {"source": "csv"}}
+        dirty = {"firstname": "Alice", "tags": ["a"]}
+        result = _mask_pii({"clean": clean, "dirty": dirty})
+        assert result["clean"] is clean
+        assert result["dirty"] is not dirty
+        assert result["dirty"]["tags"] is dirty["tags"]
+        assert result["dirty"]["firstname"] == "***REDACTED***"
+
+    def test_mask_pii_copies_list_with_scrubbed_item(self):
+        items = ["ok", "ssn 123-45-6789"]
+        result = _mask_pii({"items": items})
+        assert result["items"] == ["ok", "ssn ***REDACTED***"]
+        assert items[1] == "ssn 123-45-6789"
+
+    def test_mask_pii_scalars_pass_through_but_pii_keys_still_redacted(self):
+        result = _mask_pii({"count": 3, "ratio": 0.5, "ok": True, "none": None, "ssn": 123456789})
+        assert result == {"count": 3, "ratio": 0.5, "ok": True, "none": None, "ssn": "***REDACTED***"}
+
     def test_logger_info_does_not_mutate_kwargs(self):
         """Using get_logger().info() must not mutate the passed kwargs."""
         logger = get_logger("test_mutation")
@@ -184,65 +204,68 @@ class TestPIIMaskingNoMutation:
 class TestPipelineExceptionConsistency:
     """Both run() and stream() must raise PipelineError for mapping failures."""
 
-    def test_stream_raises_pipeline_error(self):
+    def test_stream_raises_pipeline_error(self, person_registry):
         """stream() wraps mapping failures in PipelineError."""
-        from ceds_jsonld import Pipeline, ShapeRegistry
+        from ceds_jsonld import Pipeline
         from ceds_jsonld.adapters import DictAdapter
 
-        registry = ShapeRegistry()
-        registry.load_shape("person")
-
         bad_data = [{"FirstName": "Alice"}]
         adapter = DictAdapter(bad_data)
-        pipeline = Pipeline(adapter, "person", registry)
+        pipeline = Pipeline(adapter, "person", person_registry)
 
         with pytest.raises(PipelineError):
             list(pipeline.stream())
 
-    def test_run_raises_pipeline_error(self):
+    def test_run_raises_pipeline_error(self, person_registry):
         """run() must also wrap mapping failures in PipelineError (not raw MappingError)."""
-        from ceds_jsonld import Pipeline, ShapeRegistry
+        from ceds_jsonld import Pipeline
         from ceds_jsonld.adapters import DictAdapter
 
-        registry = ShapeRegistry()
-        registry.load_shape("person")
-
         bad_data = [{"FirstName": "Alice"}]
         adapter = DictAdapter(bad_data)
-        pipeline = Pipeline(adapter, "person", registry)
+        pipeline = Pipeline(adapter, "person", person_registry)
 
         with pytest.raises(PipelineError):
             pipeline.run()
 
-    def test_run_wraps_underlying_cause(self):
+    def test_run_wraps_underlying_cause(self, person_registry):
         """The PipelineError from run() must chain the original exception."""
-        from ceds_jsonld import Pipeline, ShapeRegistry
+        from ceds_jsonld import Pipeline
         from ceds_jsonld.adapters import DictAdapter
 
-        registry = ShapeRegistry()
-        registry.load_shape("person")
-
         bad_data = [{"FirstName": "Alice"}]
         adapter = DictAdapter(bad_data)
-        pipeline = Pipeline(adapter, "person", registry)
+        pipeline = Pipeline(adapter, "person", person_registry)
 
         with pytest.raises(PipelineError) as exc_info:
             pipeline.run()
 
         assert exc_info.value.__cause__ is not None
 
-    def test_run_with_dlq_still_continues(self, tmp_path):
-        """When dead_letter_path is set, run() should NOT raise — DLQ catches failures."""
-        from ceds_jsonld import Pipeline, ShapeRegistry
+    def test_run_invalid_validation_mode_raises_pipeline_error(self, person_registry, tmp_path):
+        """An unknown validation_mode fails up front, even with a DLQ configured."""
+        from ceds_jsonld import Pipeline
         from ceds_jsonld.adapters import DictAdapter
 
-        registry = ShapeRegistry()
-        registry.load_shape("person")
+        adapter = DictAdapter([{"FirstName": "Alice"}])
+        dlq = tmp_path / "dead.ndjson"
+        pipeline = Pipeline(adapter, "person", person_registry, dead_letter_path=dlq)
+
+        with pytest.raises(PipelineError, match="Invalid validation_mode 'bogus'") as exc_info:
+            pipeline.run(validate=True, validation_mode="bogus")
+
+        assert isinstance(exc_info.value.__cause__, ValueError)
+        assert not dlq.exists()
+
+    def test_run_with_dlq_still_continues(self, person_registry, tmp_path):
+        """When dead_letter_path is set, run() should NOT raise — DLQ catches failures."""
+        from ceds_jsonld import Pipeline
+        from ceds_jsonld.adapters import DictAdapter
 
         bad_data = [{"FirstName": "Alice"}]
         adapter = DictAdapter(bad_data)
         dlq = tmp_path / "dead.ndjson"
-        pipeline = Pipeline(adapter, "person", registry, dead_letter_path=dlq)
+        pipeline = Pipeline(adapter, "person", person_registry, dead_letter_path=dlq)
 
         result = pipeline.run()
         assert result.records_failed >= 1
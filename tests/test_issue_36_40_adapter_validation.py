@@ -150,6 +150,19 @@ class TestBigQueryBoolParamTyping:
             "d": "STRING",
         }
 
+    def test_subclass_and_unlisted_params(self) -> None:
+        """Subclasses resolve via their base type; other types stay STRING."""
+        import enum
+
+        from ceds_jsonld.adapters.bigquery_adapter import _param_type
+
+        class Grade(enum.IntEnum):
+            TENTH = 10
+
+        assert _param_type(Grade.TENTH) == "INT64"
+        assert _param_type(b"\x00") == "STRING"
+        assert _param_type(None) == "STRING"
+
 
 # ======================================================================
 # Issue #40a — BigQuery must reject whitespace-only queries
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 
 from ceds_jsonld.exceptions import MappingError
 from ceds_jsonld.mapping import FieldMapper
+from ceds_jsonld.transforms import get_transform
 
 
 class TestFieldMapperID:
@@ -126,6 +129,40 @@ class TestFieldMapperEdgeCases:
         assert "MiddleName" not in name
         assert "GenerationCodeOrSuffix" not in name
 
+    def test_unknown_transform_fails_at_map_time(self):
+        config = {
+            "id_source": "ID",
+            "properties": {"hasThing": {"fields": {"Name": {"source": "Name", "transform": "no_such_transform"}}}},
+        }
+        mapper = FieldMapper(config)
+        with pytest.raises(KeyError, match="no_such_transform"):
+            mapper.map({"ID": "1", "Name": "x"})
+
+    def test_transform_resolved_once_per_mapper(self, person_shape_def):
+        calls = []
+
+        def counting(value):
+            calls.append(value)
+            return f"Sex_{value}"
+
+        mapper = FieldMapper(person_shape_def.mapping_config, custom_transforms={"sex_prefix": counting})
+        row = {
+            "FirstName": "Jane",
+            "LastName": "Doe",
+            "Birthdate": "1990-01-01",
+            "Sex": "Female",
+            "RaceEthnicity": "White",
+            "PersonIdentifiers": "123456789",
+            "IdentificationSystems": "PersonIdentificationSystem_SSN",
+            "PersonIdentifierTypes": "PersonIdentifierType_PersonIdentifier",
+        }
+        with patch("ceds_jsonld.mapping.get_transform", wraps=get_transform) as lookup:
+            mapper.map(row)
+            mapper.map(row)
+        assert calls == ["Female", "Female"]
+        names = [c.args[0] for c in lookup.call_args_list]
+        assert len(names) == len(set(names))
+
     def test_custom_transform(self, person_shape_def):
         custom = {"sex_prefix": lambda v: f"CUSTOM_{v}"}
         mapper = FieldMapper(person_shape_def.mapping_config, custom_transforms=custom)
@@ -321,6 +358,14 @@ class TestFieldMapperOverrides:
 class TestFieldMapperCompose:
     """Test compose() for merging base + overlay configs."""
 
+    def test_compose_copies_nested_lists_and_dicts(self):
+        base = {"id_source": "ID", "properties": {}, "extra": {"tags": ["a", {"b": [1]}]}}
+        cfg = FieldMapper.compose(base, {"type": "T"}).config
+        assert cfg["extra"] == base["extra"]
+        assert cfg["extra"] is not base["extra"]
+        assert cfg["extra"]["tags"] is not base["extra"]["tags"]
+        assert cfg["extra"]["tags"][1] is not base["extra"]["tags"][1]
+
     def test_compose_overwrites_scalar(self, person_shape_def):
         base = person_shape_def.mapping_config
         overlay = {"id_source": "NewIDColumn", "type": "CustomPerson"}
@@ -487,3 +532,38 @@ class TestNestedValueRejection:
         pipeline = Pipeline(source=DictAdapter([record]), shape="person", registry=registry)
         with pytest.raises(PipelineError, match="nested dict"):
             pipeline.build_all()
+
+
+class _Str(str):
+    pass
+
+
+class _Float(float):
+    pass
+
+
+class TestIsEmpty:
+    """FieldMapper._is_empty — exact-type fast paths and subclass fallbacks agree."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            pytest.param(None, True, id="none"),
+            pytest.param("", True, id="empty-str"),
+            pytest.param(" \t\n", True, id="whitespace-str"),
+            pytest.param(" x ", False, id="padded-str"),
+            pytest.param(0, False, id="zero-int"),
+            pytest.param(False, False, id="false"),
+            pytest.param(0.0, False, id="zero-float"),
+            pytest.param(float("nan"), True, id="nan"),
+            pytest.param(float("inf"), False, id="inf"),
+            pytest.param(_Str("  "), True, id="str-subclass-blank"),
+            pytest.param(_Str("a"), False, id="str-subclass"),
+            pytest.param(_Float("nan"), True, id="float-subclass-nan"),
+            pytest.param([], True, id="empty-list"),
+            pytest.param({}, True, id="empty-dict"),
+            pytest.param(("a",), False, id="tuple"),
+        ],
+    )
+    def test_is_empty(self, value, expected):
+        assert FieldMapper._is_empty(value) is expected
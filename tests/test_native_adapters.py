@@ -851,6 +851,26 @@ class TestOneRosterAdapter:
         assert rows[0]["givenName"] == "Alice"
         assert rows[2]["role"] == "teacher"
 
+    def test_read_imports_httpx_once_across_pages(self, httpserver: Any) -> None:
+        from ceds_jsonld.adapters.oneroster_adapter import OneRosterAdapter
+
+        for offset, users in (("0", [{"sourcedId": "u1"}]), ("1", [])):
+            httpserver.expect_ordered_request(
+                "/users",
+                query_string={"offset": offset, "limit": "1"},
+            ).respond_with_json({"users": users})
+
+        adapter = OneRosterAdapter(
+            base_url=httpserver.url_for(""),
+            resource="users",
+            bearer_token="tok",
+            page_size=1,
+            flatten=False,
+        )
+        with patch.object(OneRosterAdapter, "_import_httpx", wraps=OneRosterAdapter._import_httpx) as importer:
+            assert len(list(adapter.read())) == 1
+        assert importer.call_count == 1
+
     def test_read_with_filter(self, httpserver: Any) -> None:
         from ceds_jsonld.adapters.oneroster_adapter import OneRosterAdapter
 
@@ -7,8 +7,10 @@ metrics, dead-letter queue, progress tracking, and memory profiling.
 from __future__ import annotations
 
 import json
+import logging
 from pathlib import Path
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
@@ -109,6 +111,15 @@ class TestStructuredLogging:
         # Should not raise
         bound.info("test.bound_event")
 
+    def test_filtered_level_skips_pii_masking(self, caplog: pytest.LogCaptureFixture) -> None:
+        caplog.set_level(logging.WARNING, logger="test.filtered")
+        logger = get_logger("test.filtered")
+        with patch("ceds_jsonld.logging._mask_pii", wraps=_mask_pii) as mask:
+            logger.debug("test.dropped", ssn="123-45-6789")
+            assert mask.call_count == 0
+            logger.warning("test.emitted", ssn="123-45-6789")
+            assert mask.call_count == 1
+
 
 # =====================================================================
 # PII Masking
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import shutil
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
 from threading import Thread
@@ -11,7 +12,7 @@ import pytest
 import yaml
 
 from ceds_jsonld.exceptions import ShapeLoadError
-from ceds_jsonld.registry import ShapeDefinition, ShapeRegistry
+from ceds_jsonld.registry import _PACKAGE_ONTOLOGIES, ShapeDefinition, ShapeRegistry
 
 
 class TestShapeRegistryLoading:
@@ -76,6 +77,23 @@ class TestShapeRegistryAPI:
         fetched = registry.get_shape("person")
         assert loaded is fetched
 
+    def test_load_shape_again_rereads_edited_files(self, tmp_path):
+        shape_dir = tmp_path / "person"
+        shutil.copytree(_PACKAGE_ONTOLOGIES / "person", shape_dir)
+        registry = ShapeRegistry()
+        registry.add_search_dir(tmp_path)
+        first = registry.load_shape("person")
+
+        mapping_file = shape_dir / "person_mapping.yaml"
+        mapping = yaml.safe_load(mapping_file.read_text(encoding="utf-8"))
+        mapping["id_source"] = "EditedID"
+        mapping_file.write_text(yaml.safe_dump(mapping), encoding="utf-8")
+
+        second = registry.load_shape("person")
+        assert second is not first
+        assert second.mapping_config["id_source"] == "EditedID"
+        assert registry.get_shape("person") is second
+
     def test_get_shape_not_loaded_raises(self):
         registry = ShapeRegistry()
         with pytest.raises(KeyError, match="person"):
@@ -120,6 +138,38 @@ class TestShapeLoadErrors:
         assert shape.name == "person_explicit"
         assert shape.mapping_config["type"] == "Person"
 
+    def test_mapping_parse_shared_but_config_owned(self):
+        first = ShapeRegistry().load_shape("person")
+        second = ShapeRegistry().load_shape("person")
+        assert first.mapping_config == second.mapping_config
+        assert first.mapping_config is not second.mapping_config
+        assert first.mapping_config["properties"] is not second.mapping_config["properties"]
+
+    def test_edited_mapping_is_reparsed(self, tmp_path):
+        person_dir = Path(__file__).parent.parent / "src" / "ceds_jsonld" / "ontologies" / "person"
+        shape_dir = tmp_path / "edited"
+        shape_dir.mkdir()
+        for name in ("Person_SHACL.ttl", "person_context.json", "person_mapping.yaml"):
+            (shape_dir / name).write_bytes((person_dir / name).read_bytes())
+        registry = ShapeRegistry()
+        assert registry.load_shape("edited", path=shape_dir).mapping_config["type"] == "Person"
+
+        mapping_path = shape_dir / "person_mapping.yaml"
+        mapping_path.write_text(mapping_path.read_text(encoding="utf-8") + "\ntype: Edited\n", encoding="utf-8")
+        assert registry.load_shape("edited", path=shape_dir).mapping_config["type"] == "Edited"
+
+    def test_mapping_yaml_rejects_python_tags(self, tmp_path):
+        """The (possibly C-accelerated) mapping loader stays a safe loader."""
+        person_dir = Path(__file__).parent.parent / "src" / "ceds_jsonld" / "ontologies" / "person"
+        shape_dir = tmp_path / "evil"
+        shape_dir.mkdir()
+        for name in ("Person_SHACL.ttl", "person_context.json"):
+            (shape_dir / name).write_bytes((person_dir / name).read_bytes())
+        (shape_dir / "evil_mapping.yaml").write_text("shape: !!python/object/apply:os.getcwd []\n", encoding="utf-8")
+
+        with pytest.raises(ShapeLoadError, match="mapping YAML"):
+            ShapeRegistry().load_shape("evil", path=shape_dir)
+
 
 # ===================================================================
 # fetch_shape tests (with local HTTP server)
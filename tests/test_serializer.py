@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import importlib.util
+import sys
+from unittest.mock import patch
+
 import pytest
 
 from ceds_jsonld import serializer
@@ -56,6 +60,21 @@ class TestDumpsLoads:
         with pytest.raises(SerializationError, match="Failed to serialize"):
             serializer.dumps({"bad": {1, 2, 3}})  # sets are not JSON-serializable
 
+    def test_dumps_default_hook_handles_unknown_types(self):
+        data = serializer.dumps({"tags": {"a"}}, default=lambda o: sorted(o))
+        assert serializer.loads(data) == {"tags": ["a"]}
+
+    def test_dumps_newline_appends_single_newline(self):
+        obj = {"a": [1, 2]}
+        assert serializer.dumps(obj, newline=True) == serializer.dumps(obj) + b"\n"
+
+    def test_dumps_rejects_non_finite_float_subclass(self):
+        class _Float(float):
+            pass
+
+        with pytest.raises(SerializationError, match="non-finite"):
+            serializer.dumps({"a": [{"b": _Float("nan")}]})
+
     def test_loads_invalid_json_raises_serialization_error(self):
         """Regression: loads must raise SerializationError, not raw JSONDecodeError (issue #14)."""
         with pytest.raises(SerializationError, match="Failed to deserialize"):
@@ -96,3 +115,67 @@ class TestBackend:
 
     def test_backend_is_string(self):
         assert serializer.get_backend() in ("orjson", "json")
+
+
+@pytest.fixture()
+def stdlib_serializer():
+    """A private copy of the serializer module loaded with orjson hidden."""
+    spec = importlib.util.find_spec("ceds_jsonld.serializer")
+    module = importlib.util.module_from_spec(spec)
+    with patch.dict(sys.modules, {"orjson": None}):
+        spec.loader.exec_module(module)
+    assert module.get_backend() == "json"
+    return module
+
+
+class TestStdlibWriteJson:
+    """write_json on the stdlib backend when orjson is unavailable."""
+
+    @pytest.mark.parametrize("pretty", [True, False])
+    def test_matches_dumps_output(self, stdlib_serializer, tmp_path, pretty):
+        obj = {"@type": "Person", "name": "Ñoño", "ids": [1, 2, 3]}
+        path = tmp_path / "out.json"
+        n = stdlib_serializer.write_json(obj, path, pretty=pretty)
+        assert path.read_bytes() == stdlib_serializer.dumps(obj, pretty=pretty)
+        assert n == path.stat().st_size
+
+    def test_dumps_default_hook(self, stdlib_serializer):
+        data = stdlib_serializer.dumps({"tags": {"a"}}, default=lambda o: sorted(o))
+        assert stdlib_serializer.loads(data) == {"tags": ["a"]}
+
+    def test_dumps_newline_appends_single_newline(self, stdlib_serializer):
+        obj = {"a": [1, 2]}
+        assert stdlib_serializer.dumps(obj, newline=True) == stdlib_serializer.dumps(obj) + b"\n"
+
+    @pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+    def test_non_finite_rejected_by_encoder(self, stdlib_serializer, value):
+        with pytest.raises(SerializationError, match="Out of range float"):
+            stdlib_serializer.dumps({"nested": [{"x": value}]})
+
+    def test_non_finite_leaves_no_partial_file(self, stdlib_serializer, tmp_path):
+        path = tmp_path / "out.json"
+        with pytest.raises(SerializationError):
+            stdlib_serializer.write_json({"ok": "x" * 10_000, "bad": float("nan")}, path)
+        assert not path.exists()
+
+    def test_failed_encode_leaves_no_partial_file(self, stdlib_serializer, tmp_path):
+        path = tmp_path / "out.json"
+        with pytest.raises(SerializationError, match="Failed to write JSON"):
+            stdlib_serializer.write_json({"ok": 1, "bad": object()}, path)
+        assert not path.exists()
+
+    @pytest.mark.parametrize("bad", [float("nan"), object()])
+    def test_failed_write_keeps_existing_file(self, stdlib_serializer, tmp_path, bad):
+        path = tmp_path / "out.json"
+        path.write_bytes(b'{"keep": true}')
+        with pytest.raises(SerializationError):
+            stdlib_serializer.write_json({"ok": "x" * 10_000, "bad": bad}, path)
+        assert path.read_bytes() == b'{"keep": true}'
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_overwrite_replaces_existing_file(self, stdlib_serializer, tmp_path):
+        path = tmp_path / "out.json"
+        path.write_bytes(b'{"old": true}')
+        stdlib_serializer.write_json({"new": True}, path, pretty=False)
+        assert stdlib_serializer.read_json(path) == {"new": True}
+        assert list(tmp_path.iterdir()) == [path]
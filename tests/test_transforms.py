@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import datetime
+
 import pytest
 
 from ceds_jsonld.transforms import (
@@ -137,6 +139,28 @@ class TestDateFormat:
     def test_strips_whitespace(self):
         assert date_format("  1990-01-01  ") == "1990-01-01"
 
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("2020-01-02", "2020-01-02"),
+            (datetime.date(2020, 1, 2), "2020-01-02"),
+            (datetime.datetime(2020, 1, 2, 5, 6), "2020-01-02"),
+            ("2020-1-2", "2020-01-02"),
+            ("2020-01-02T05:06:00", "2020-01-02"),
+        ],
+    )
+    def test_mixed_input_types(self, value, expected):
+        assert date_format(value) == expected
+
+    def test_invalid_value_raises_on_every_call(self):
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                date_format("not-a-date")
+
+    def test_unhashable_value_raises_value_error(self):
+        with pytest.raises(ValueError, match="not a valid ISO 8601 date"):
+            date_format(["2020-01-02"])
+
 
 # ---------------------------------------------------------------------------
 # Registry and get_transform
@@ -6,6 +6,8 @@ validation modes (strict / report / sample), and Pipeline integration.
 
 from __future__ import annotations
 
+import sys
+
 import pytest
 
 from ceds_jsonld.builder import JSONLDBuilder
@@ -124,6 +126,38 @@ class TestValidationResult:
         assert result.conforms is True
         assert result.warning_count == 1
 
+    def test_merge_combines_issues_and_counts(self):
+        a = ValidationResult(record_count=1)
+        a.add_issue("rec1", FieldIssue(property_path="x", message="bad", severity="error"))
+        b = ValidationResult(record_count=2)
+        b.add_issue("rec1", FieldIssue(property_path="y", message="hm", severity="warning"))
+        b.add_issue("rec2", FieldIssue(property_path="z", message="hm", severity="warning"))
+
+        total = ValidationResult()
+        total.merge(a)
+        total.merge(b)
+        assert total.record_count == 3
+        assert total.error_count == 1
+        assert total.warning_count == 2
+        assert total.conforms is False
+        assert [i.property_path for i in total.issues["rec1"]] == ["x", "y"]
+        assert len(b.issues["rec1"]) == 1  # source untouched
+
+    def test_merge_warnings_only_keeps_conformant(self):
+        other = ValidationResult(record_count=1)
+        other.add_issue("rec1", FieldIssue(property_path="x", message="hm", severity="warning"))
+        total = ValidationResult()
+        total.merge(other)
+        assert total.conforms is True
+
+    def test_result_and_issue_are_slotted(self):
+        assert not hasattr(ValidationResult(), "__dict__")
+        assert not hasattr(FieldIssue(property_path="x", message="m"), "__dict__")
+
+    def test_issue_severity_is_interned(self):
+        issue = FieldIssue(property_path="x", message="m", severity="".join(["warn", "ing"]))
+        assert issue.severity is sys.intern("warning")
+
     def test_summary_string(self):
         result = ValidationResult(record_count=5, error_count=2, warning_count=1)
         s = result.summary()
@@ -132,6 +166,25 @@ class TestValidationResult:
         assert "1 warnings" in s
 
 
+# =========================================================================
+# PreBuildValidator._FieldRule
+# =========================================================================
+
+
+class TestFieldRule:
+    """Compiled rules are immutable, slotted records."""
+
+    def test_rules_are_frozen(self, pre_validator):
+        import dataclasses
+
+        rule = pre_validator._rules[0]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            rule.required = False
+
+    def test_rules_have_no_instance_dict(self, pre_validator):
+        assert not hasattr(pre_validator._rules[0], "__dict__")
+
+
 # =========================================================================
 # PreBuildValidator — basic checks
 # =========================================================================
@@ -197,6 +250,16 @@ class TestPreBuildValidatorInvalid:
         # Should check ~10 rows (sampling is random, so allow tolerance)
         assert 1 <= result.record_count <= 20
 
+    def test_batch_strict_mode_raises(self, pre_validator, valid_row, invalid_row_missing_required):
+        with pytest.raises(ValidationError):
+            pre_validator.validate_batch([valid_row, invalid_row_missing_required], mode=ValidationMode.STRICT)
+
+    def test_batch_issues_match_per_row(self, pre_validator, valid_row, invalid_row_missing_required):
+        rows = [valid_row, invalid_row_missing_required]
+        result = pre_validator.validate_batch(rows, mode=ValidationMode.REPORT)
+        single = pre_validator.validate_row(invalid_row_missing_required, mode=ValidationMode.REPORT)
+        assert result.issues == single.issues
+
     def test_batch_counts_not_doubled(self, pre_validator, invalid_row_missing_required):
         """Regression: validate_batch must not double-count errors/warnings (issue #11)."""
         rows = [invalid_row_missing_required] * 5